@@ -10,14 +10,254 @@ Enhanced to:
 - Display individual runs in grey with aggregate trend line
 """
 
+import contextlib
+import functools
+import multiprocessing
+import os
 import sqlite3
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+import matplotlib
+matplotlib.use('Agg')  # Charts are only saved to files; no display needed
 import matplotlib.pyplot as plt
-import yaml
-from collections import defaultdict
+from matplotlib.collections import LineCollection
 import numpy as np
 
+from gene_sim.config import load_config_json_cached
+
+
+def connect_database(db_path):
+    """
+    Open a simulation database read-only for analysis.
+    
+    The file is opened with mode=ro, so analysis never modifies results
+    databases. Sets read-side PRAGMAs (large page cache, memory-mapped I/O,
+    in-memory temp tables). Databases created by the simulation carry the
+    covering index used to select living creatures by generation, and are in
+    WAL mode, so readers do not block on it.
+    """
+    conn = sqlite3.connect(Path(db_path).resolve().as_uri() + "?mode=ro", uri=True)
+    conn.execute("PRAGMA cache_size = -65536")
+    conn.execute("PRAGMA mmap_size = 268435456")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    return conn
+
+
+# Open connections by database path while inside shared_connections()
+_shared_connections = None
+
+
+@contextlib.contextmanager
+def shared_connections():
+    """
+    Reuse one connection per database for the analysis calls in the block.
+    
+    The chart builders query every database once per trait; inside this block
+    each database is opened on first use and closed when the block exits.
+    """
+    global _shared_connections
+    if _shared_connections is not None:
+        # Already sharing (nested block)
+        yield
+        return
+    _shared_connections = {}
+    try:
+        yield
+    finally:
+        for conn in _shared_connections.values():
+            conn.close()
+        _shared_connections = None
+
+
+def open_database(db_path):
+    """Get a connection for analysis; pair with release_database()."""
+    if _shared_connections is None:
+        return connect_database(db_path)
+    key = str(db_path)
+    conn = _shared_connections.get(key)
+    if conn is None:
+        conn = _shared_connections[key] = connect_database(db_path)
+    return conn
+
+
+def release_database(conn):
+    """Close a connection from open_database() unless it is shared."""
+    if _shared_connections is None or conn not in _shared_connections.values():
+        conn.close()
+
+
+def map_databases(func, tasks, workers=None):
+    """
+    Apply func to each task, spreading the tasks over worker processes.
+    
+    Tasks are independent read-only analyses of separate database files.
+    Workers are spawned, so they share no SQLite handles with this process.
+    With a single task or CPU everything runs in this process instead.
+    
+    Args:
+        func: Picklable (module-level) function taking one task
+        tasks: List of task arguments
+        workers: Maximum number of worker processes (default: one per CPU)
+    
+    Returns:
+        list: func(task) for each task, in task order
+    """
+    workers = min(len(tasks), workers or os.cpu_count() or 1)
+    if workers <= 1:
+        return [func(task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=workers,
+                             mp_context=multiprocessing.get_context('spawn')) as executor:
+        return list(executor.map(func, tasks))
+
+
+def _analyze_database(task):
+    """Worker: run an all-traits analysis on one database."""
+    analyze, db_file, directory, undesirable_list = task
+    with shared_connections():
+        return analyze(db_file, undesirable_list, directory)
+
+
+def analyze_all_databases(analyze, databases, undesirable_list, workers=None):
+    """
+    Run an analysis for every database and undesirable trait, in parallel.
+    
+    Args:
+        analyze: analyze_all_undesirable_phenotype_trends or
+            analyze_all_undesirables_in_desired_population
+        databases: List of (db_file, directory) pairs; directory is passed
+            through for config lookup
+        undesirable_list: Undesirable phenotype entries from the config
+        workers: Maximum number of worker processes (default: one per CPU)
+    
+    Returns:
+        list: For each database, the list of analyze() results in
+            undesirable_list order
+    """
+    return map_databases(_analyze_database, [
+        (analyze, db_file, directory, undesirable_list)
+        for db_file, directory in databases
+    ], workers)
+
+
+# Per-run lines longer than this are downsampled before plotting
+MAX_RUN_POINTS = 200
+
+
+def lttb_indices(values, n_out):
+    """
+    Pick points of a series to plot with Largest-Triangle-Three-Buckets.
+    
+    Keeps the first and last points and, from each of n_out - 2 equal buckets
+    in between, the point forming the largest triangle with the previously
+    kept point and the next bucket's average, so peaks and dips survive.
+    
+    Args:
+        values: 1-D series, sampled at positions 0..len(values) - 1
+        n_out: Number of points to keep
+    
+    Returns:
+        np.ndarray: Sorted indices of the kept points (all indices if the
+            series already has at most n_out points)
+    """
+    n = len(values)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+    
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    indices = np.empty(n_out, dtype=int)
+    indices[0] = 0
+    indices[-1] = n - 1
+    kept = 0
+    for bucket in range(n_out - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        next_end = edges[bucket + 2] if bucket + 2 < len(edges) else n
+        avg_x = (end + next_end - 1) / 2
+        avg_y = values[end:next_end].mean()
+        xs = np.arange(start, end)
+        area = np.abs((kept - avg_x) * (values[start:end] - values[kept])
+                      - (kept - xs) * (avg_y - values[kept]))
+        kept = start + int(area.argmax())
+        indices[bucket + 1] = kept
+    return indices
+
+
+def pad_frequencies(frequency_lists, max_len):
+    """
+    Stack per-run frequency series into one array for aggregation.
+    
+    Args:
+        frequency_lists: Non-empty frequency lists, one per run
+        max_len: Length to pad every series to
+    
+    Returns:
+        np.ndarray: C-contiguous float32 (runs, max_len) array; shorter runs
+            are padded with their last value. Percentages need far less than
+            float32 precision, and it halves the data the reductions read.
+    """
+    padded = np.empty((len(frequency_lists), max_len), dtype=np.float32)
+    for row, frequencies in zip(padded, frequency_lists):
+        row[:len(frequencies)] = frequencies
+        row[len(frequencies):] = frequencies[-1]
+    return padded
+
+
+def plot_runs(ax, run_array, inverted_cycles, color, alpha):
+    """
+    Draw every run's faded background line as a single LineCollection.
+    
+    Args:
+        ax: Axes to draw on
+        run_array: Padded (runs, max_len) frequency array
+        inverted_cycles: Shared y values for every run
+        color: Line color
+        alpha: Line opacity
+    """
+    segments = []
+    for padded in run_array:
+        shown = lttb_indices(padded, MAX_RUN_POINTS)
+        segments.append(np.column_stack((padded[shown], inverted_cycles[shown])))
+    ax.add_collection(LineCollection(segments, colors=color, alpha=alpha, linewidths=1,
+                                     rasterized=True))
+
+
+def mean_and_std(run_array):
+    """
+    Per-generation mean and standard deviation across runs.
+    
+    Equivalent to np.mean and np.std along axis 0, but the deviations are
+    taken from the mean already computed instead of a second mean pass.
+    
+    Args:
+        run_array: Padded (runs, max_len) frequency array
+    
+    Returns:
+        tuple: (mean, std) arrays of length max_len
+    """
+    mean = run_array.mean(axis=0)
+    deviations = run_array - mean
+    np.square(deviations, out=deviations)
+    return mean, np.sqrt(deviations.mean(axis=0))
+
+
+def moving_average(values, window):
+    """
+    Centered moving average of a series, using a prefix sum.
+    
+    Matches np.convolve(values, np.ones(window)/window, mode='same'): values
+    beyond either end count as zero, and the result has the input's length.
+    
+    Args:
+        values: 1-D series to smooth
+        window: Number of points averaged
+    
+    Returns:
+        np.ndarray: Smoothed series
+    """
+    padded = np.concatenate((np.zeros(window // 2), values, np.zeros((window - 1) // 2)))
+    csum = np.concatenate(([0.0], np.cumsum(padded)))
+    return (csum[window:] - csum[:-window]) / window
+
 
 def get_all_databases(directory="."):
     """Get all simulation database files in the directory."""
@@ -28,7 +268,7 @@ def get_all_databases(directory="."):
 
 def get_simulation_info(db_path):
     """Get basic simulation information."""
-    conn = sqlite3.connect(db_path)
+    conn = open_database(db_path)
     cursor = conn.cursor()
     
     # Get simulation ID
@@ -47,12 +287,28 @@ def get_simulation_info(db_path):
     for breeder_type, count in cursor.fetchall():
         breeders[breeder_type] = count
     
-    conn.close()
+    release_database(conn)
     return sim_id, breeders
 
 
-def get_trait_info(directory, trait_id):
-    """Get trait information from config file."""
+@functools.lru_cache(maxsize=32)
+def _load_config(path_str, mtime_ns, size):
+    """Load a YAML config through its JSON sidecar; cached per (path, mtime, size)."""
+    return load_config_json_cached(path_str)
+
+
+def load_batch_config(directory="."):
+    """
+    Load the batch config for a results directory.
+    
+    Uses batch_config.yaml in the directory, falling back to
+    quick_test_config.yaml in its parent. The file is parsed once per
+    modification, so the result is shared between callers and must not be
+    modified.
+    
+    Returns:
+        dict: Parsed config, or None if no config file exists
+    """
     config_path = Path(directory) / "batch_config.yaml"
     
     if not config_path.exists():
@@ -61,8 +317,16 @@ def get_trait_info(directory, trait_id):
     if not config_path.exists():
         return None
     
-    with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
+    st = config_path.stat()
+    return _load_config(str(config_path), st.st_mtime_ns, st.st_size)
+
+
+def get_trait_info(directory, trait_id):
+    """Get trait information from config file."""
+    config = load_batch_config(directory)
+    
+    if config is None:
+        return None
     
     traits = config.get('traits', [])
     for trait in traits:
@@ -86,6 +350,8 @@ def analyze_trait_characteristics(trait_info, target_phenotype, target_genotypes
     if not trait_info:
         return {'dominance': 'Unknown', 'frequency': 'Unknown', 'starting_freq': 0.0}
     
+    target_genotypes = frozenset(target_genotypes)
+    
     # Calculate starting frequency of undesirable phenotype
     total_freq = 0.0
     for genotype_info in trait_info.get('genotypes', []):
@@ -139,17 +405,11 @@ def analyze_trait_characteristics(trait_info, target_phenotype, target_genotypes
 
 def get_target_phenotypes(directory="."):
     """Get list of target (desired) phenotypes from batch config file."""
-    config_path = Path(directory) / "batch_config.yaml"
-    
-    if not config_path.exists():
-        config_path = Path(directory).parent / "quick_test_config.yaml"
+    config = load_batch_config(directory)
     
-    if not config_path.exists():
+    if config is None:
         return []
     
-    with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
-    
     target = config.get('target_phenotypes', [])
     
     return target
@@ -166,10 +426,31 @@ def analyze_undesirable_in_desired_population(db_path, trait_id, target_phenotyp
         directory: Directory for config lookup
     
     Returns:
-        tuple: (cycles, frequencies, target_genotypes) where frequencies are percentages
-               of creatures with the undesirable trait among those with all desired traits
+        tuple: (cycles, frequencies, target_genotypes) where cycles and frequencies are
+               NumPy arrays and frequencies are percentages of creatures with the
+               undesirable trait among those with all desired traits
+    """
+    undesirable = {'trait_id': trait_id, 'phenotype': target_phenotype}
+    return analyze_all_undesirables_in_desired_population(db_path, [undesirable], directory)[0]
+
+
+def analyze_all_undesirables_in_desired_population(db_path, undesirable_list, directory="."):
+    """
+    Analyze every undesirable phenotype among creatures with ALL desired phenotypes.
+    
+    The desired population is filtered once, and one grouped query counts it
+    and its undesirable carriers per generation for all traits together.
+    
+    Args:
+        db_path: Path to database file
+        undesirable_list: Undesirable phenotype entries from the config
+        directory: Directory for config lookup
+    
+    Returns:
+        list: For each entry of undesirable_list, the tuple
+              analyze_undesirable_in_desired_population() returns for it
     """
-    conn = sqlite3.connect(db_path)
+    conn = open_database(db_path)
     cursor = conn.cursor()
     
     # Get simulation ID
@@ -180,21 +461,19 @@ def analyze_undesirable_in_desired_population(db_path, trait_id, target_phenotyp
     target_pheno_list = get_target_phenotypes(directory)
     
     if not target_pheno_list:
-        conn.close()
-        return [], [], []
+        release_database(conn)
+        return [([], [], []) for _ in undesirable_list]
     
-    # Get genotypes that map to the undesirable phenotype
-    cursor.execute("""
-        SELECT genotype
-        FROM genotypes
-        WHERE trait_id = ? AND phenotype = ?
-    """, (trait_id, target_phenotype))
-    
-    undesirable_genotypes = [row[0] for row in cursor.fetchall()]
-    
-    if not undesirable_genotypes:
-        conn.close()
-        return [], [], []
+    # Get genotypes that map to each undesirable phenotype
+    undesirable_genotype_lists = []
+    for undesirable in undesirable_list:
+        cursor.execute("""
+            SELECT genotype
+            FROM genotypes
+            WHERE trait_id = ? AND phenotype = ?
+        """, (undesirable['trait_id'], undesirable['phenotype']))
+        
+        undesirable_genotype_lists.append([row[0] for row in cursor.fetchall()])
     
     # For each target phenotype, get the genotypes that express it
     target_genotype_map = {}
@@ -208,126 +487,152 @@ def analyze_undesirable_in_desired_population(db_path, trait_id, target_phenotyp
             WHERE trait_id = ? AND phenotype = ?
         """, (target_trait_id, target_pheno))
         
-        target_genotype_map[target_trait_id] = [row[0] for row in cursor.fetchall()]
-    
-    # Get all creatures by generation and check their phenotypes
-    cursor.execute("""
-        SELECT DISTINCT generation
-        FROM creatures
-        WHERE simulation_id = ?
-        ORDER BY generation
-    """, (sim_id,))
-    
-    generations = [row[0] for row in cursor.fetchall()]
-    generation_frequencies = {}
-    
-    for generation in generations:
-        # Get all living creatures in this generation (homed or not)
-        cursor.execute("""
-            SELECT creature_id
+        target_genotype_map[target_trait_id] = frozenset(row[0] for row in cursor.fetchall())
+    
+    # One query does the per-generation counting: among living creatures, those
+    # whose genotype matches a desired genotype for every target trait (rows
+    # tagged -1), and of those, how many carry an undesirable genotype for each
+    # entry of undesirable_list (rows tagged with the entry's index)
+    desired_pairs = [
+        (target_trait_id, genotype)
+        for target_trait_id, desired_genotypes in target_genotype_map.items()
+        for genotype in desired_genotypes
+    ]
+    if desired_pairs:
+        desired_filter = "(cg.trait_id, cg.genotype) IN (VALUES {})".format(
+            ", ".join("(?, ?)" for _ in desired_pairs)
+        )
+    else:
+        desired_filter = "0"
+    undesirable_rows = [
+        (index, undesirable['trait_id'], genotype)
+        for index, (undesirable, genotypes) in enumerate(zip(undesirable_list, undesirable_genotype_lists))
+        for genotype in frozenset(genotypes)
+    ]
+    if undesirable_rows:
+        undesirable_values = "VALUES {}".format(", ".join("(?, ?, ?)" for _ in undesirable_rows))
+    else:
+        undesirable_values = "SELECT NULL, NULL, NULL WHERE 0"
+    
+    cursor.execute(f"""
+        WITH living AS (
+            SELECT creature_id, generation
             FROM creatures
-            WHERE simulation_id = ? AND generation = ? AND is_alive = 1
-        """, (sim_id, generation))
-        
-        creature_ids = [row[0] for row in cursor.fetchall()]
-        
-        if not creature_ids:
-            continue
-        
-        # Count creatures with all desired phenotypes
-        creatures_with_all_desired = []
-        
-        for creature_id in creature_ids:
-            # Check if this creature has all desired phenotypes
-            has_all_desired = True
-            
-            for target_trait_id, desired_genotypes in target_genotype_map.items():
-                cursor.execute("""
-                    SELECT genotype
-                    FROM creature_genotypes
-                    WHERE creature_id = ? AND trait_id = ?
-                """, (creature_id, target_trait_id))
-                
-                result = cursor.fetchone()
-                if not result or result[0] not in desired_genotypes:
-                    has_all_desired = False
-                    break
-            
-            if has_all_desired:
-                creatures_with_all_desired.append(creature_id)
-        
-        # Among creatures with all desired phenotypes, count those with the undesirable trait
-        if creatures_with_all_desired:
-            count_with_undesirable = 0
-            
-            for creature_id in creatures_with_all_desired:
-                cursor.execute("""
-                    SELECT genotype
-                    FROM creature_genotypes
-                    WHERE creature_id = ? AND trait_id = ?
-                """, (creature_id, trait_id))
-                
-                result = cursor.fetchone()
-                if result and result[0] in undesirable_genotypes:
-                    count_with_undesirable += 1
-            
-            frequency = count_with_undesirable / len(creatures_with_all_desired)
-            generation_frequencies[generation] = frequency
+            WHERE simulation_id = ? AND is_alive = 1
+        ),
+        desired AS (
+            SELECT cg.creature_id, l.generation
+            FROM living l
+            JOIN creature_genotypes cg ON cg.creature_id = l.creature_id
+            WHERE {desired_filter}
+            GROUP BY cg.creature_id
+            HAVING COUNT(*) = ?
+        ),
+        undesirable(idx, trait_id, genotype) AS ({undesirable_values})
+        SELECT -1, l.generation, COUNT(d.creature_id)
+        FROM living l
+        LEFT JOIN desired d ON d.creature_id = l.creature_id
+        GROUP BY l.generation
+        UNION ALL
+        SELECT u.idx, d.generation, COUNT(*)
+        FROM desired d
+        JOIN undesirable u
+        JOIN creature_genotypes cg
+            ON cg.creature_id = d.creature_id AND cg.trait_id = u.trait_id
+            AND cg.genotype = u.genotype
+        GROUP BY u.idx, d.generation
+        ORDER BY 1, 2
+    """, (
+        sim_id,
+        *(value for pair in desired_pairs for value in pair),
+        len(target_genotype_map),
+        *(value for row in undesirable_rows for value in row),
+    ))
+    rows = cursor.fetchall()
+    release_database(conn)
+    
+    # Rows come in generation order, the -1 rows (every living generation) first
+    desired_counts = {}
+    undesirable_counts = [{} for _ in undesirable_list]
+    for index, generation, count in rows:
+        if index < 0:
+            desired_counts[generation] = count
         else:
-            # No creatures with all desired phenotypes
-            generation_frequencies[generation] = 0.0
-    
-    conn.close()
-    
-    # Convert to sorted lists
-    cycles = sorted(generation_frequencies.keys())
-    frequencies = [generation_frequencies[c] * 100 for c in cycles]  # Convert to percentage
+            undesirable_counts[index][generation] = count
+    cycles = np.array(list(desired_counts))
     
-    return cycles, frequencies, undesirable_genotypes
+    results = []
+    for genotypes, counts in zip(undesirable_genotype_lists, undesirable_counts):
+        if not genotypes:
+            results.append(([], [], []))
+            continue
+        # 0.0 when no creatures have all desired phenotypes
+        frequencies = np.array([
+            counts.get(generation, 0) / desired_count if desired_count else 0.0
+            for generation, desired_count in desired_counts.items()
+        ])
+        results.append((cycles, frequencies * 100, genotypes))  # Percentages
+    
+    return results
 
 
 def get_undesirable_phenotypes(directory="."):
 
     """Get list of undesirable phenotypes from batch config file."""
-    # Look for batch_config.yaml in the directory
-    config_path = Path(directory) / "batch_config.yaml"
-    
-    if not config_path.exists():
-        # Fallback to quick_test_config.yaml
-        config_path = Path(directory).parent / "quick_test_config.yaml"
+    config = load_batch_config(directory)
     
-    if not config_path.exists():
+    if config is None:
         return []
     
-    with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
-    
     undesirable = config.get('undesirable_phenotypes', [])
     
     return undesirable
 
 
-def get_starting_genotype_frequencies(db_path, trait_id):
-    """Get starting (generation 0) genotype frequencies for a trait."""
-    conn = sqlite3.connect(db_path)
+@functools.lru_cache(maxsize=64)
+def _load_genotype_frequencies(path_str, mtime_ns):
+    """Read a database's genotype frequency table; cached per (path, mtime)."""
+    conn = open_database(path_str)
     cursor = conn.cursor()
     
     # Get simulation ID
     cursor.execute("SELECT simulation_id FROM simulations LIMIT 1")
     sim_id = cursor.fetchone()[0]
     
-    # Get generation 0 genotype frequencies
     cursor.execute("""
-        SELECT genotype, frequency
+        SELECT trait_id, generation, genotype, frequency
         FROM generation_genotype_frequencies
-        WHERE simulation_id = ? AND trait_id = ? AND generation = 0
-        ORDER BY genotype
-    """, (sim_id, trait_id))
+        WHERE simulation_id = ?
+        ORDER BY trait_id, generation, genotype
+    """, (sim_id,))
     
-    genotype_freqs = {row[0]: row[1] * 100 for row in cursor.fetchall()}
-    conn.close()
+    table = {}
+    for trait_id, generation, genotype, frequency in cursor.fetchall():
+        table.setdefault(trait_id, {}).setdefault(generation, {})[genotype] = frequency
+    release_database(conn)
     
-    return genotype_freqs
+    return table
+
+
+def get_genotype_frequencies(db_path):
+    """
+    Get every genotype frequency recorded in a database.
+    
+    The table is read in one query the first time a database is asked for and
+    reused until the file changes, so per-trait lookups cost no queries. The
+    result is shared and must not be modified.
+    
+    Returns:
+        dict: {trait_id: {generation: {genotype: frequency}}}
+    """
+    path = Path(db_path)
+    return _load_genotype_frequencies(str(path), path.stat().st_mtime_ns)
+
+
+def get_starting_genotype_frequencies(db_path, trait_id):
+    """Get starting (generation 0) genotype frequencies for a trait."""
+    generation_0 = get_genotype_frequencies(db_path).get(trait_id, {}).get(0, {})
+    return {genotype: frequency * 100 for genotype, frequency in generation_0.items()}
 
 
 def analyze_undesirable_phenotype_trend(db_path, trait_id, target_phenotype, directory="."):
@@ -341,54 +646,88 @@ def analyze_undesirable_phenotype_trend(db_path, trait_id, target_phenotype, dir
         directory: Directory for config lookup
     
     Returns:
-        tuple: (cycles, frequencies) where cycles are generation numbers
-               and frequencies are percentages of undesirable phenotype
+        tuple: (cycles, frequencies, target_genotypes) where cycles are generation
+               numbers and frequencies are percentages of undesirable phenotype,
+               both as NumPy arrays
     """
-    conn = sqlite3.connect(db_path)
+    undesirable = {'trait_id': trait_id, 'phenotype': target_phenotype}
+    return analyze_all_undesirable_phenotype_trends(db_path, [undesirable], directory)[0]
+
+
+def analyze_all_undesirable_phenotype_trends(db_path, undesirable_list, directory="."):
+    """
+    Analyze the trend of every undesirable phenotype in one database.
+    
+    One grouped query sums each phenotype's genotype frequencies per
+    generation for all entries together.
+    
+    Args:
+        db_path: Path to database file
+        undesirable_list: Undesirable phenotype entries from the config
+        directory: Directory for config lookup
+    
+    Returns:
+        list: For each entry of undesirable_list, the tuple
+              analyze_undesirable_phenotype_trend() returns for it
+    """
+    conn = open_database(db_path)
     cursor = conn.cursor()
     
     # Get simulation ID
     cursor.execute("SELECT simulation_id FROM simulations LIMIT 1")
     sim_id = cursor.fetchone()[0]
     
-    # Get genotypes that map to this phenotype
-    cursor.execute("""
-        SELECT genotype
-        FROM genotypes
-        WHERE trait_id = ? AND phenotype = ?
-    """, (trait_id, target_phenotype))
-    
-    target_genotypes = [row[0] for row in cursor.fetchall()]
-    
-    if not target_genotypes:
-        conn.close()
-        return [], []
-    
-    # Get frequency data for each generation
-    cursor.execute("""
-        SELECT generation, genotype, frequency
-        FROM generation_genotype_frequencies
-        WHERE simulation_id = ? AND trait_id = ?
-        ORDER BY generation
-    """, (sim_id, trait_id))
-    
-    # Aggregate frequencies by generation
-    generation_frequencies = defaultdict(float)
-    
-    for generation, genotype, frequency in cursor.fetchall():
-        if genotype in target_genotypes:
-            generation_frequencies[generation] += frequency
-    
-    conn.close()
-    
-    # Convert to sorted lists
-    cycles = sorted(generation_frequencies.keys())
-    frequencies = [generation_frequencies[c] * 100 for c in cycles]  # Convert to percentage
-    
-    return cycles, frequencies, target_genotypes
+    # Get genotypes that map to each phenotype
+    target_genotype_lists = []
+    for undesirable in undesirable_list:
+        cursor.execute("""
+            SELECT genotype
+            FROM genotypes
+            WHERE trait_id = ? AND phenotype = ?
+        """, (undesirable['trait_id'], undesirable['phenotype']))
+        
+        target_genotype_lists.append([row[0] for row in cursor.fetchall()])
+    
+    # Sum the target genotypes' frequencies per entry and generation
+    target_rows = [
+        (index, undesirable['trait_id'], genotype)
+        for index, (undesirable, genotypes) in enumerate(zip(undesirable_list, target_genotype_lists))
+        for genotype in frozenset(genotypes)
+    ]
+    rows = []
+    if target_rows:
+        cursor.execute(f"""
+            WITH target(idx, trait_id, genotype) AS (
+                VALUES {", ".join("(?, ?, ?)" for _ in target_rows)}
+            )
+            SELECT t.idx, f.generation, SUM(f.frequency)
+            FROM target t
+            JOIN generation_genotype_frequencies f
+                ON f.simulation_id = ? AND f.trait_id = t.trait_id AND f.genotype = t.genotype
+            GROUP BY t.idx, f.generation
+            ORDER BY t.idx, f.generation
+        """, (*(value for row in target_rows for value in row), sim_id))
+        rows = cursor.fetchall()
+    release_database(conn)
+    
+    # Rows are grouped by entry, each in generation order
+    series = [([], []) for _ in undesirable_list]
+    for index, generation, frequency in rows:
+        cycles, frequencies = series[index]
+        cycles.append(generation)
+        frequencies.append(frequency)
+    
+    results = []
+    for (cycles, frequencies), target_genotypes in zip(series, target_genotype_lists):
+        if not target_genotypes:
+            results.append((np.array([]), np.array([]), []))
+        else:
+            results.append((np.array(cycles), np.array(frequencies) * 100, target_genotypes))  # Percentages
+    return results
 
 
-def create_comprehensive_charts(db_files, output_dir=".", aggregate_method="mean"):
+@shared_connections()
+def create_comprehensive_charts(db_files, output_dir=".", aggregate_method="mean", workers=None):
     """
     Create comprehensive charts showing undesirable phenotype trends
     across all simulation runs - one chart per undesirable trait.
@@ -397,6 +736,7 @@ def create_comprehensive_charts(db_files, output_dir=".", aggregate_method="mean
         db_files: List of database file paths
         output_dir: Directory to save charts
         aggregate_method: Method for aggregate line - 'mean', 'median', 'mean_ci', or 'moving_avg'
+        workers: Maximum number of analysis processes (default: one per CPU)
     """
     if not db_files:
         print("No database files found!")
@@ -417,6 +757,17 @@ def create_comprehensive_charts(db_files, output_dir=".", aggregate_method="mean
     
     print(f"\nFound {len(undesirable_list)} undesirable traits to chart")
     
+    # Analyze every database up front, in parallel
+    db_results = analyze_all_databases(
+        analyze_all_undesirable_phenotype_trends,
+        [(db_file, output_dir) for db_file in db_files],
+        undesirable_list,
+        workers
+    )
+    
+    # One figure is cleared and redrawn for each chart
+    fig = plt.figure(figsize=(12, 8))
+    
     # Create a chart for each undesirable trait
     for trait_idx, undesirable in enumerate(undesirable_list, 1):
         trait_id = undesirable['trait_id']
@@ -430,12 +781,10 @@ def create_comprehensive_charts(db_files, output_dir=".", aggregate_method="mean
         target_genotypes = None
         starting_freqs = None
         
-        for db_file in db_files:
-            cycles, frequencies, genotypes = analyze_undesirable_phenotype_trend(
-                db_file, trait_id, target_phenotype, output_dir
-            )
+        for db_file, results in zip(db_files, db_results):
+            cycles, frequencies, genotypes = results[trait_idx - 1]
             
-            if cycles and frequencies:
+            if len(frequencies):
                 all_cycles.append(cycles)
                 all_frequencies.append(frequencies)
                 
@@ -453,28 +802,19 @@ def create_comprehensive_charts(db_files, output_dir=".", aggregate_method="mean
         trait_chars = analyze_trait_characteristics(trait_info, target_phenotype, target_genotypes)
         
         # Create the chart
-        fig, ax = plt.subplots(figsize=(12, 8))
+        fig.clf()
+        ax = fig.add_subplot()
         
         # Find max length for padding
         max_len = max(len(cycles) for cycles in all_cycles)
         
         # Pad all frequency arrays and plot individual runs in grey
-        padded_frequencies = []
-        for cycles, frequencies in zip(all_cycles, all_frequencies):
-            if len(frequencies) < max_len:
-                # Pad with last value
-                padded = frequencies + [frequencies[-1]] * (max_len - len(frequencies))
-            else:
-                padded = frequencies
-            padded_frequencies.append(padded)
-            
-            # Invert y-axis by negating cycle numbers
-            inverted_cycles = [-i for i in range(len(padded))]
-            ax.plot(padded, inverted_cycles, color='grey', alpha=0.3, linewidth=1)
+        freq_array = pad_frequencies(all_frequencies, max_len)
+        # Invert y-axis by negating cycle numbers
+        inverted_cycles = np.arange(0, -max_len, -1)
+        plot_runs(ax, freq_array, inverted_cycles, 'grey', 0.3)
         
         # Calculate and plot aggregate line
-        freq_array = np.array(padded_frequencies)
-        inverted_cycles = [-i for i in range(max_len)]
         
         if aggregate_method == 'mean':
             aggregate = np.mean(freq_array, axis=0)
@@ -487,8 +827,7 @@ def create_comprehensive_charts(db_files, output_dir=".", aggregate_method="mean
                    label='Median', zorder=10)
         
         elif aggregate_method == 'mean_ci':
-            mean = np.mean(freq_array, axis=0)
-            std = np.std(freq_array, axis=0)
+            mean, std = mean_and_std(freq_array)
             ci_upper = mean + std
             ci_lower = mean - std
             
@@ -500,8 +839,7 @@ def create_comprehensive_charts(db_files, output_dir=".", aggregate_method="mean
         elif aggregate_method == 'moving_avg':
             # Simple moving average with window of 3 generations
             window = 3
-            aggregate = np.convolve(np.mean(freq_array, axis=0), 
-                                   np.ones(window)/window, mode='same')
+            aggregate = moving_average(np.mean(freq_array, axis=0), window)
             ax.plot(aggregate, inverted_cycles, color='darkred', linewidth=2.5,
                    label='Moving Average', zorder=10)
         
@@ -556,40 +894,57 @@ def create_comprehensive_charts(db_files, output_dir=".", aggregate_method="mean
         # Save the chart
         safe_name = target_phenotype.lower().replace(' ', '_')
         output_path = Path(output_dir) / f"undesirable_{safe_name}_trends.png"
-        plt.savefig(output_path, dpi=150, bbox_inches='tight')
+        plt.savefig(output_path, dpi=150)
         print(f"    Saved: {output_path.name}")
-        plt.close()
     
+    plt.close(fig)
     return len(undesirable_list)
 
 
 def run_comprehensive_analytics(db_file, output_dir="."):
     """Run comprehensive analytics and save to file."""
     from analytics.comprehensive_analytics import analyze_comprehensive
-    import sys
-    from io import StringIO
-    
-    # Capture output
-    old_stdout = sys.stdout
-    sys.stdout = output_buffer = StringIO()
-    
-    try:
-        analyze_comprehensive(str(db_file))
-        output_text = output_buffer.getvalue()
-    finally:
-        sys.stdout = old_stdout
     
-    # Save to file
     run_name = db_file.stem  # e.g., "simulation_run_001_seed_1000"
     output_path = Path(output_dir) / f"analysis_{run_name}.txt"
     
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(output_text)
+    # Stream the report straight into the file through a large write buffer
+    with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        with contextlib.redirect_stdout(f):
+            analyze_comprehensive(str(db_file))
     
     return output_path
 
 
-def create_combined_charts(kennel_dir, mill_dir, output_dir, aggregate_method="mean"):
+def _comprehensive_analytics_task(task):
+    """Worker: run_comprehensive_analytics, returning (output_path, error message)."""
+    db_file, output_dir = task
+    try:
+        return run_comprehensive_analytics(db_file, output_dir), None
+    except Exception as e:
+        return None, str(e)
+
+
+def run_all_comprehensive_analytics(db_files, output_dir=".", workers=None):
+    """
+    Run comprehensive analytics for each database, in parallel.
+    
+    Args:
+        db_files: List of database file paths
+        output_dir: Directory to save the reports
+        workers: Maximum number of worker processes (default: one per CPU)
+    
+    Returns:
+        list: (output_path, error message) per database in db_files order;
+            exactly one of the two is None
+    """
+    return map_databases(
+        _comprehensive_analytics_task, [(db_file, output_dir) for db_file in db_files], workers
+    )
+
+
+@shared_connections()
+def create_combined_charts(kennel_dir, mill_dir, output_dir, aggregate_method="mean", workers=None):
     """
     Create combined charts showing kennel and mill data together.
     
@@ -598,6 +953,7 @@ def create_combined_charts(kennel_dir, mill_dir, output_dir, aggregate_method="m
         mill_dir: Directory containing mill databases
         output_dir: Directory to save combined charts
         aggregate_method: Method for aggregate line
+        workers: Maximum number of analysis processes (default: one per CPU)
     """
     # Color-blind friendly colors
     # Blue/teal for kennels, Orange/red for mills
@@ -634,6 +990,20 @@ def create_combined_charts(kennel_dir, mill_dir, output_dir, aggregate_method="m
     output_path = Path(output_dir)
     output_path.mkdir(exist_ok=True)
     
+    # Analyze every database up front, in parallel
+    db_results = analyze_all_databases(
+        analyze_all_undesirable_phenotype_trends,
+        [(db_file, kennel_dir) for db_file in kennel_files]
+        + [(db_file, mill_dir) for db_file in mill_files],
+        undesirable_list,
+        workers
+    )
+    kennel_results = db_results[:len(kennel_files)]
+    mill_results = db_results[len(kennel_files):]
+    
+    # One figure is cleared and redrawn for each chart
+    fig = plt.figure(figsize=(12, 8))
+    
     # Create a chart for each undesirable trait
     for trait_idx, undesirable in enumerate(undesirable_list, 1):
         trait_id = undesirable['trait_id']
@@ -648,12 +1018,10 @@ def create_combined_charts(kennel_dir, mill_dir, output_dir, aggregate_method="m
         starting_freqs = None
         trait_info = None
         
-        for db_file in kennel_files:
-            cycles, frequencies, genotypes = analyze_undesirable_phenotype_trend(
-                db_file, trait_id, target_phenotype, kennel_dir
-            )
+        for db_file, results in zip(kennel_files, kennel_results):
+            cycles, frequencies, genotypes = results[trait_idx - 1]
             
-            if cycles and frequencies:
+            if len(frequencies):
                 kennel_cycles_list.append(cycles)
                 kennel_frequencies_list.append(frequencies)
                 
@@ -666,12 +1034,10 @@ def create_combined_charts(kennel_dir, mill_dir, output_dir, aggregate_method="m
         mill_cycles_list = []
         mill_frequencies_list = []
         
-        for db_file in mill_files:
-            cycles, frequencies, genotypes = analyze_undesirable_phenotype_trend(
-                db_file, trait_id, target_phenotype, mill_dir
-            )
+        for db_file, results in zip(mill_files, mill_results):
+            cycles, frequencies, genotypes = results[trait_idx - 1]
             
-            if cycles and frequencies:
+            if len(frequencies):
                 mill_cycles_list.append(cycles)
                 mill_frequencies_list.append(frequencies)
         
@@ -683,41 +1049,25 @@ def create_combined_charts(kennel_dir, mill_dir, output_dir, aggregate_method="m
         trait_chars = analyze_trait_characteristics(trait_info, target_phenotype, target_genotypes)
         
         # Create the chart
-        fig, ax = plt.subplots(figsize=(12, 8))
+        fig.clf()
+        ax = fig.add_subplot()
         
         # Find max length for padding
         max_len_kennel = max(len(cycles) for cycles in kennel_cycles_list)
         max_len_mill = max(len(cycles) for cycles in mill_cycles_list)
         max_len = max(max_len_kennel, max_len_mill)
         
+        inverted_cycles = np.arange(0, -max_len, -1)
+        
         # Pad and plot kennel runs (faded blue)
-        padded_kennel = []
-        for cycles, frequencies in zip(kennel_cycles_list, kennel_frequencies_list):
-            if len(frequencies) < max_len:
-                padded = frequencies + [frequencies[-1]] * (max_len - len(frequencies))
-            else:
-                padded = frequencies
-            padded_kennel.append(padded)
-            
-            inverted_cycles = [-i for i in range(len(padded))]
-            ax.plot(padded, inverted_cycles, color=kennel_light, alpha=0.25, linewidth=1)
+        kennel_array = pad_frequencies(kennel_frequencies_list, max_len)
+        plot_runs(ax, kennel_array, inverted_cycles, kennel_light, 0.25)
         
         # Pad and plot mill runs (faded orange)
-        padded_mill = []
-        for cycles, frequencies in zip(mill_cycles_list, mill_frequencies_list):
-            if len(frequencies) < max_len:
-                padded = frequencies + [frequencies[-1]] * (max_len - len(frequencies))
-            else:
-                padded = frequencies
-            padded_mill.append(padded)
-            
-            inverted_cycles = [-i for i in range(len(padded))]
-            ax.plot(padded, inverted_cycles, color=mill_light, alpha=0.25, linewidth=1)
+        mill_array = pad_frequencies(mill_frequencies_list, max_len)
+        plot_runs(ax, mill_array, inverted_cycles, mill_light, 0.25)
         
         # Calculate and plot aggregate lines
-        kennel_array = np.array(padded_kennel)
-        mill_array = np.array(padded_mill)
-        inverted_cycles = [-i for i in range(max_len)]
         
         if aggregate_method == 'mean':
             kennel_agg = np.mean(kennel_array, axis=0)
@@ -736,10 +1086,8 @@ def create_combined_charts(kennel_dir, mill_dir, output_dir, aggregate_method="m
                    label='Mills (Median)', zorder=10)
         
         elif aggregate_method == 'mean_ci':
-            kennel_mean = np.mean(kennel_array, axis=0)
-            kennel_std = np.std(kennel_array, axis=0)
-            mill_mean = np.mean(mill_array, axis=0)
-            mill_std = np.std(mill_array, axis=0)
+            kennel_mean, kennel_std = mean_and_std(kennel_array)
+            mill_mean, mill_std = mean_and_std(mill_array)
             
             ax.fill_betweenx(inverted_cycles, kennel_mean - kennel_std, kennel_mean + kennel_std,
                            color=kennel_color, alpha=0.15)
@@ -753,10 +1101,8 @@ def create_combined_charts(kennel_dir, mill_dir, output_dir, aggregate_method="m
         
         elif aggregate_method == 'moving_avg':
             window = 3
-            kennel_agg = np.convolve(np.mean(kennel_array, axis=0), 
-                                   np.ones(window)/window, mode='same')
-            mill_agg = np.convolve(np.mean(mill_array, axis=0),
-                                 np.ones(window)/window, mode='same')
+            kennel_agg = moving_average(np.mean(kennel_array, axis=0), window)
+            mill_agg = moving_average(np.mean(mill_array, axis=0), window)
             ax.plot(kennel_agg, inverted_cycles, color=kennel_color, linewidth=3,
                    label='Kennels (Moving Avg)', zorder=10)
             ax.plot(mill_agg, inverted_cycles, color=mill_color, linewidth=3,
@@ -811,14 +1157,16 @@ def create_combined_charts(kennel_dir, mill_dir, output_dir, aggregate_method="m
         # Save the chart
         safe_name = target_phenotype.lower().replace(' ', '_')
         output_file = output_path / f"combined_{safe_name}_trends.png"
-        plt.savefig(output_file, dpi=150, bbox_inches='tight')
+        plt.savefig(output_file, dpi=150)
         print(f"    Saved: {output_file.name}")
-        plt.close()
     
+    plt.close(fig)
     return len(undesirable_list)
 
 
-def create_combined_charts_desired_only(kennel_dir, mill_dir, output_dir, aggregate_method="mean"):
+@shared_connections()
+def create_combined_charts_desired_only(kennel_dir, mill_dir, output_dir, aggregate_method="mean",
+                                        workers=None):
     """
     Create combined charts showing kennel and mill data together,
     but calculating undesirable trait frequency ONLY among creatures with all desired phenotypes.
@@ -828,6 +1176,7 @@ def create_combined_charts_desired_only(kennel_dir, mill_dir, output_dir, aggreg
         mill_dir: Directory containing mill databases
         output_dir: Directory to save combined charts
         aggregate_method: Method for aggregate line
+        workers: Maximum number of analysis processes (default: one per CPU)
     """
     # Color-blind friendly colors
     kennel_color = '#0173B2'  # Blue (color-blind safe)
@@ -870,6 +1219,20 @@ def create_combined_charts_desired_only(kennel_dir, mill_dir, output_dir, aggreg
     output_path = Path(output_dir)
     output_path.mkdir(exist_ok=True)
     
+    # Analyze every database up front, in parallel
+    db_results = analyze_all_databases(
+        analyze_all_undesirables_in_desired_population,
+        [(db_file, kennel_dir) for db_file in kennel_files]
+        + [(db_file, mill_dir) for db_file in mill_files],
+        undesirable_list,
+        workers
+    )
+    kennel_results = db_results[:len(kennel_files)]
+    mill_results = db_results[len(kennel_files):]
+    
+    # One figure is cleared and redrawn for each chart
+    fig = plt.figure(figsize=(12, 8))
+    
     # Create a chart for each undesirable trait
     for trait_idx, undesirable in enumerate(undesirable_list, 1):
         trait_id = undesirable['trait_id']
@@ -884,12 +1247,10 @@ def create_combined_charts_desired_only(kennel_dir, mill_dir, output_dir, aggreg
         starting_freqs = None
         trait_info = None
         
-        for db_file in kennel_files:
-            cycles, frequencies, genotypes = analyze_undesirable_in_desired_population(
-                db_file, trait_id, target_phenotype, kennel_dir
-            )
+        for db_file, results in zip(kennel_files, kennel_results):
+            cycles, frequencies, genotypes = results[trait_idx - 1]
             
-            if cycles and frequencies:
+            if len(frequencies):
                 kennel_cycles_list.append(cycles)
                 kennel_frequencies_list.append(frequencies)
                 
@@ -902,12 +1263,10 @@ def create_combined_charts_desired_only(kennel_dir, mill_dir, output_dir, aggreg
         mill_cycles_list = []
         mill_frequencies_list = []
         
-        for db_file in mill_files:
-            cycles, frequencies, genotypes = analyze_undesirable_in_desired_population(
-                db_file, trait_id, target_phenotype, mill_dir
-            )
+        for db_file, results in zip(mill_files, mill_results):
+            cycles, frequencies, genotypes = results[trait_idx - 1]
             
-            if cycles and frequencies:
+            if len(frequencies):
                 mill_cycles_list.append(cycles)
                 mill_frequencies_list.append(frequencies)
         
@@ -919,41 +1278,25 @@ def create_combined_charts_desired_only(kennel_dir, mill_dir, output_dir, aggreg
         trait_chars = analyze_trait_characteristics(trait_info, target_phenotype, target_genotypes)
         
         # Create the chart
-        fig, ax = plt.subplots(figsize=(12, 8))
+        fig.clf()
+        ax = fig.add_subplot()
         
         # Find max length for padding
         max_len_kennel = max(len(cycles) for cycles in kennel_cycles_list)
         max_len_mill = max(len(cycles) for cycles in mill_cycles_list)
         max_len = max(max_len_kennel, max_len_mill)
         
+        inverted_cycles = np.arange(0, -max_len, -1)
+        
         # Pad and plot kennel runs (faded blue)
-        padded_kennel = []
-        for cycles, frequencies in zip(kennel_cycles_list, kennel_frequencies_list):
-            if len(frequencies) < max_len:
-                padded = frequencies + [frequencies[-1]] * (max_len - len(frequencies))
-            else:
-                padded = frequencies
-            padded_kennel.append(padded)
-            
-            inverted_cycles = [-i for i in range(len(padded))]
-            ax.plot(padded, inverted_cycles, color=kennel_light, alpha=0.25, linewidth=1)
+        kennel_array = pad_frequencies(kennel_frequencies_list, max_len)
+        plot_runs(ax, kennel_array, inverted_cycles, kennel_light, 0.25)
         
         # Pad and plot mill runs (faded orange)
-        padded_mill = []
-        for cycles, frequencies in zip(mill_cycles_list, mill_frequencies_list):
-            if len(frequencies) < max_len:
-                padded = frequencies + [frequencies[-1]] * (max_len - len(frequencies))
-            else:
-                padded = frequencies
-            padded_mill.append(padded)
-            
-            inverted_cycles = [-i for i in range(len(padded))]
-            ax.plot(padded, inverted_cycles, color=mill_light, alpha=0.25, linewidth=1)
+        mill_array = pad_frequencies(mill_frequencies_list, max_len)
+        plot_runs(ax, mill_array, inverted_cycles, mill_light, 0.25)
         
         # Calculate and plot aggregate lines
-        kennel_array = np.array(padded_kennel)
-        mill_array = np.array(padded_mill)
-        inverted_cycles = [-i for i in range(max_len)]
         
         if aggregate_method == 'mean':
             kennel_agg = np.mean(kennel_array, axis=0)
@@ -972,10 +1315,8 @@ def create_combined_charts_desired_only(kennel_dir, mill_dir, output_dir, aggreg
                    label='Mills (Median)', zorder=10)
         
         elif aggregate_method == 'mean_ci':
-            kennel_mean = np.mean(kennel_array, axis=0)
-            kennel_std = np.std(kennel_array, axis=0)
-            mill_mean = np.mean(mill_array, axis=0)
-            mill_std = np.std(mill_array, axis=0)
+            kennel_mean, kennel_std = mean_and_std(kennel_array)
+            mill_mean, mill_std = mean_and_std(mill_array)
             
             ax.fill_betweenx(inverted_cycles, kennel_mean - kennel_std, kennel_mean + kennel_std,
                            color=kennel_color, alpha=0.15)
@@ -989,10 +1330,8 @@ def create_combined_charts_desired_only(kennel_dir, mill_dir, output_dir, aggreg
         
         elif aggregate_method == 'moving_avg':
             window = 3
-            kennel_agg = np.convolve(np.mean(kennel_array, axis=0), 
-                                   np.ones(window)/window, mode='same')
-            mill_agg = np.convolve(np.mean(mill_array, axis=0),
-                                 np.ones(window)/window, mode='same')
+            kennel_agg = moving_average(np.mean(kennel_array, axis=0), window)
+            mill_agg = moving_average(np.mean(mill_array, axis=0), window)
             ax.plot(kennel_agg, inverted_cycles, color=kennel_color, linewidth=3,
                    label='Kennels (Moving Avg)', zorder=10)
             ax.plot(mill_agg, inverted_cycles, color=mill_color, linewidth=3,
@@ -1047,10 +1386,10 @@ def create_combined_charts_desired_only(kennel_dir, mill_dir, output_dir, aggreg
         # Save the chart
         safe_name = target_phenotype.lower().replace(' ', '_')
         output_file = output_path / f"combined_desired_{safe_name}_trends.png"
-        plt.savefig(output_file, dpi=150, bbox_inches='tight')
+        plt.savefig(output_file, dpi=150)
         print(f"    Saved: {output_file.name}")
-        plt.close()
     
+    plt.close(fig)
     return len(undesirable_list)
 
 
@@ -1102,13 +1441,13 @@ def main():
     
     # Process each database
     print("Generating individual analysis reports...")
-    for i, db_file in enumerate(db_files, 1):
+    reports = run_all_comprehensive_analytics(db_files, output_dir)
+    for i, (db_file, (output_path, error)) in enumerate(zip(db_files, reports), 1):
         print(f"  [{i}/{len(db_files)}] {db_file.name}...", end=" ")
-        try:
-            output_path = run_comprehensive_analytics(db_file, output_dir)
+        if error is None:
             print(f"✓ Saved to {output_path.name}")
-        except Exception as e:
-            print(f"✗ Error: {e}")
+        else:
+            print(f"✗ Error: {error}")
     
     print(f"\nText analyses saved to: {output_dir}")
     
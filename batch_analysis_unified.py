@@ -27,6 +27,9 @@ Examples:
     
     # Individual kennel analysis only
     python batch_analysis_unified.py --individual run4/run4a_kennels
+    
+    # Analyze at most 4 databases at a time
+    python batch_analysis_unified.py run5/run5a_kennels run5/run5b_mills -j 4
 """
 
 import sys
@@ -36,7 +39,7 @@ from pathlib import Path
 # Import functions from the existing batch_analysis module
 from batch_analysis import (
     get_all_databases,
-    run_comprehensive_analytics,
+    run_all_comprehensive_analytics,
     create_comprehensive_charts,
     create_combined_charts,
     create_combined_charts_desired_only
@@ -104,10 +107,17 @@ Examples:
         help='Aggregate method for ensemble trends (default: mean)'
     )
     
+    parser.add_argument(
+        '-j', '--workers',
+        type=int,
+        default=None,
+        help='Number of databases to analyze in parallel (default: one per CPU)'
+    )
+    
     return parser.parse_args()
 
 
-def run_individual_analysis(directory, aggregate_method):
+def run_individual_analysis(directory, aggregate_method, workers=None):
     """Run individual batch analysis on a single directory."""
     
     print("="*80)
@@ -139,19 +149,19 @@ def run_individual_analysis(directory, aggregate_method):
     
     # Process each database
     print("Generating individual analysis reports...")
-    for i, db_file in enumerate(db_files, 1):
+    reports = run_all_comprehensive_analytics(db_files, output_dir, workers)
+    for i, (db_file, (output_path, error)) in enumerate(zip(db_files, reports), 1):
         print(f"  [{i}/{len(db_files)}] {db_file.name}...", end=" ")
-        try:
-            output_path = run_comprehensive_analytics(db_file, output_dir)
+        if error is None:
             print(f"OK - Saved to {output_path.name}")
-        except Exception as e:
-            print(f"ERROR: {e}")
+        else:
+            print(f"ERROR: {error}")
     
     print(f"\nText analyses saved to: {output_dir}")
     
     # Create comprehensive charts
     print("\nGenerating undesirable phenotype trend charts...")
-    num_charts = create_comprehensive_charts(db_files, directory, aggregate_method)
+    num_charts = create_comprehensive_charts(db_files, directory, aggregate_method, workers)
     
     print("\n" + "="*80)
     print("BATCH ANALYSIS COMPLETE")
@@ -163,7 +173,7 @@ def run_individual_analysis(directory, aggregate_method):
     print()
 
 
-def run_combined_analysis(kennel_dir, mill_dir, output_dir, aggregate_method):
+def run_combined_analysis(kennel_dir, mill_dir, output_dir, aggregate_method, workers=None):
     """Run combined analysis comparing kennels vs mills (total population)."""
     
     print("="*80)
@@ -177,7 +187,7 @@ def run_combined_analysis(kennel_dir, mill_dir, output_dir, aggregate_method):
     print()
     
     # Create combined charts
-    num_charts = create_combined_charts(kennel_dir, mill_dir, output_dir, aggregate_method)
+    num_charts = create_combined_charts(kennel_dir, mill_dir, output_dir, aggregate_method, workers)
     
     print("\n" + "="*80)
     print("COMBINED ANALYSIS COMPLETE")
@@ -188,7 +198,7 @@ def run_combined_analysis(kennel_dir, mill_dir, output_dir, aggregate_method):
     print()
 
 
-def run_combined_desired_analysis(kennel_dir, mill_dir, output_dir, aggregate_method):
+def run_combined_desired_analysis(kennel_dir, mill_dir, output_dir, aggregate_method, workers=None):
     """Run combined analysis comparing kennels vs mills (desired population only)."""
     
     print("="*80)
@@ -204,7 +214,8 @@ def run_combined_desired_analysis(kennel_dir, mill_dir, output_dir, aggregate_me
     print()
     
     # Create combined charts
-    num_charts = create_combined_charts_desired_only(kennel_dir, mill_dir, output_dir, aggregate_method)
+    num_charts = create_combined_charts_desired_only(kennel_dir, mill_dir, output_dir, aggregate_method,
+                                                     workers)
     
     print("\n" + "="*80)
     print("COMBINED ANALYSIS COMPLETE - Desired Population Only")
@@ -215,7 +226,7 @@ def run_combined_desired_analysis(kennel_dir, mill_dir, output_dir, aggregate_me
     print()
 
 
-def run_full_analysis(dir1, dir2, aggregate_method):
+def run_full_analysis(dir1, dir2, aggregate_method, workers=None):
     """Run complete analysis suite on two directories.
     
     Performs:
@@ -255,25 +266,25 @@ def run_full_analysis(dir1, dir2, aggregate_method):
     print("\n" + "#"*80)
     print("# STEP 1/4: Individual Analysis - Directory 1")
     print("#"*80 + "\n")
-    run_individual_analysis(dir1, aggregate_method)
+    run_individual_analysis(dir1, aggregate_method, workers)
     
     # Step 2: Individual analysis on dir2
     print("\n" + "#"*80)
     print("# STEP 2/4: Individual Analysis - Directory 2")
     print("#"*80 + "\n")
-    run_individual_analysis(dir2, aggregate_method)
+    run_individual_analysis(dir2, aggregate_method, workers)
     
     # Step 3: Combined analysis (total population)
     print("\n" + "#"*80)
     print("# STEP 3/4: Combined Analysis - Total Population")
     print("#"*80 + "\n")
-    run_combined_analysis(dir1, dir2, str(combined_dir), aggregate_method)
+    run_combined_analysis(dir1, dir2, str(combined_dir), aggregate_method, workers)
     
     # Step 4: Combined analysis (desired population only)
     print("\n" + "#"*80)
     print("# STEP 4/4: Combined Analysis - Desired Population Only")
     print("#"*80 + "\n")
-    run_combined_desired_analysis(dir1, dir2, str(combined_desired_dir), aggregate_method)
+    run_combined_desired_analysis(dir1, dir2, str(combined_desired_dir), aggregate_method, workers)
     
     # Final summary
     print("\n" + "="*80)
@@ -305,22 +316,22 @@ def main():
             sys.exit(1)
         
         dir1, dir2 = args.directories
-        run_full_analysis(dir1, dir2, args.aggregate)
+        run_full_analysis(dir1, dir2, args.aggregate, args.workers)
     
     elif args.individual:
-        run_individual_analysis(args.individual, args.aggregate)
+        run_individual_analysis(args.individual, args.aggregate, args.workers)
     
     elif args.combined:
         kennel_dir, mill_dir, output_dir = args.combined
-        run_combined_analysis(kennel_dir, mill_dir, output_dir, args.aggregate)
+        run_combined_analysis(kennel_dir, mill_dir, output_dir, args.aggregate, args.workers)
     
     elif args.combined_desired:
         kennel_dir, mill_dir, output_dir = args.combined_desired
-        run_combined_desired_analysis(kennel_dir, mill_dir, output_dir, args.aggregate)
+        run_combined_desired_analysis(kennel_dir, mill_dir, output_dir, args.aggregate, args.workers)
     
     elif args.combined_desired:
         kennel_dir, mill_dir, output_dir = args.combined_desired
-        run_combined_desired_analysis(kennel_dir, mill_dir, output_dir, args.aggregate)
+        run_combined_desired_analysis(kennel_dir, mill_dir, output_dir, args.aggregate, args.workers)
     
     else:
         print("ERROR: No analysis mode specified")
@@ -1,7 +1,15 @@
 """Configuration loading and validation for gene_sim."""
 
+import copy
+import functools
 import json
+import os
+import tempfile
 import yaml
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader, SafeDumper
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
@@ -103,12 +111,29 @@ def load_config(config_path: str) -> SimulationConfig:
             if path.suffix.lower() == '.json':
                 raw_config = json.load(f)
             else:
-                raw_config = yaml.safe_load(f)
+                raw_config = yaml.load(f, Loader=SafeLoader)
     except (json.JSONDecodeError, yaml.YAMLError) as e:
         raise ConfigurationError(f"Failed to parse configuration file: {e}") from e
     except Exception as e:
         raise ConfigurationError(f"Failed to read configuration file: {e}") from e
     
+    return config_from_dict(raw_config)
+
+
+def config_from_dict(raw_config: Dict[str, Any]) -> SimulationConfig:
+    """
+    Validate, normalize and build a configuration from an in-memory dictionary.
+    
+    Args:
+        raw_config: Configuration dictionary, as parsed from a config file
+            (normalized in place)
+        
+    Returns:
+        Validated SimulationConfig object
+        
+    Raises:
+        ConfigurationError: If configuration is invalid
+    """
     # Validate and normalize
     validate_config(raw_config)
     normalize_config(raw_config)
@@ -117,6 +142,95 @@ def load_config(config_path: str) -> SimulationConfig:
     return build_config(raw_config)
 
 
+@functools.lru_cache(maxsize=16)
+def _load_yaml_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a YAML file; cached per (path, mtime, size) so edits invalidate it."""
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+
+def load_config_dict(config_path: str) -> Dict[str, Any]:
+    """
+    Load a configuration file as a dict, parsing it at most once per version.
+    
+    Args:
+        config_path: Path to YAML configuration file
+        
+    Returns:
+        Parsed configuration dictionary (not validated). This is a deep copy,
+        so callers may modify it freely.
+    """
+    st = os.stat(config_path)
+    return copy.deepcopy(_load_yaml_cached(str(config_path), st.st_mtime_ns, st.st_size))
+
+
+def load_config_json_cached(config_path: str) -> Dict[str, Any]:
+    """
+    Load a YAML config file, preferring a JSON sidecar parsed on a previous run.
+    
+    The sidecar (<config>.yaml.json) records the YAML file's modification time
+    and size, and is only used while both match exactly, so an edited or
+    restored config is never served from a stale cache. Otherwise the YAML is
+    parsed and the sidecar rewritten through a unique temporary file, so
+    concurrent loaders never see a partial one. Configs that JSON cannot
+    represent exactly (e.g. non-string keys) are not cached, and unreadable
+    sidecars or unwritable directories just skip the cache.
+    
+    Args:
+        config_path: Path to YAML configuration file
+        
+    Returns:
+        Parsed configuration dictionary (not validated), freshly loaded
+    """
+    config_path = Path(config_path)
+    cache_path = config_path.with_name(config_path.name + '.json')
+    st = config_path.stat()
+    source = {'mtime_ns': st.st_mtime_ns, 'size': st.st_size}
+    try:
+        with open(cache_path, 'r') as f:
+            cached = json.load(f)
+        if isinstance(cached, dict) and cached.get('source') == source:
+            return cached['config']
+    except (OSError, ValueError):
+        pass
+    
+    with open(config_path, 'r') as f:
+        config = yaml.load(f, Loader=SafeLoader)
+    try:
+        text = json.dumps({'source': source, 'config': config})
+    except TypeError:
+        return config
+    if json.loads(text)['config'] != config:
+        return config
+    try:
+        tmp = tempfile.NamedTemporaryFile('w', dir=cache_path.parent, prefix=cache_path.name,
+                                          suffix='.tmp', delete=False)
+    except OSError:
+        return config
+    try:
+        with tmp:
+            tmp.write(text)
+        os.replace(tmp.name, cache_path)
+    except OSError:
+        os.unlink(tmp.name)
+    return config
+
+
+def save_config(raw_config: Dict[str, Any], config_path: str) -> None:
+    """
+    Write a configuration dictionary to a YAML file.
+    
+    The document is emitted directly into the file as it is serialized, rather
+    than built up as one string first. Keys keep their insertion order (no sort).
+    
+    Args:
+        raw_config: Configuration dictionary
+        config_path: Path of the YAML file to write
+    """
+    with open(config_path, 'w') as f:
+        yaml.dump(raw_config, f, Dumper=SafeDumper, sort_keys=False, default_flow_style=False)
+
+
 def validate_config(config: Dict[str, Any]) -> None:
     """
     Validate configuration structure and values.
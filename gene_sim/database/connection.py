@@ -12,11 +12,17 @@ def get_db_connection(db_path: str) -> sqlite3.Connection:
     """
     Get a database connection with foreign keys enabled.
     
+    The connection is tuned for the simulation's write-heavy workload: WAL
+    journaling with synchronous=NORMAL avoids an fsync on every commit while
+    keeping the database consistent after a crash, and a 64 MiB page cache
+    keeps the indexes touched by bulk inserts in memory. The tradeoff is that
+    a power loss or OS crash may drop the last few commits (never integrity).
+    
     Args:
         db_path: Path to SQLite database file
         
     Returns:
-        SQLite connection with foreign keys enabled
+        SQLite connection with foreign keys enabled and performance PRAGMAs set
         
     Raises:
         DatabaseError: If connection fails
@@ -28,6 +34,11 @@ def get_db_connection(db_path: str) -> sqlite3.Connection:
         
         conn = sqlite3.connect(db_path)
         conn.execute("PRAGMA foreign_keys = ON")
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute("PRAGMA mmap_size = 268435456")
+        conn.execute("PRAGMA cache_size = -65536")
         return conn
     except sqlite3.Error as e:
         raise DatabaseError(f"Failed to connect to database at {db_path}: {e}") from e
@@ -129,7 +129,20 @@ def create_schema(conn: sqlite3.Connection) -> None:
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_creature_ownership_breeder ON creature_ownership_history(breeder_id)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_creature_ownership_generation ON creature_ownership_history(transfer_generation)")
         
+        # Recording a transfer also moves the creature to its new owner, so a
+        # transfer is a single INSERT round-trip from the simulation
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_creature_ownership_transfer
+            AFTER INSERT ON creature_ownership_history
+            BEGIN
+                UPDATE creatures SET breeder_id = NEW.breeder_id
+                WHERE creature_id = NEW.creature_id;
+            END
+        """)
+        
         # 5. Creature genotypes table
+        # WITHOUT ROWID clusters rows on (creature_id, trait_id), so the primary
+        # key is the table itself rather than a separate index on a rowid table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS creature_genotypes (
                 creature_id INTEGER NOT NULL,
@@ -138,7 +151,7 @@ def create_schema(conn: sqlite3.Connection) -> None:
                 FOREIGN KEY (creature_id) REFERENCES creatures(creature_id) ON DELETE CASCADE,
                 FOREIGN KEY (trait_id) REFERENCES traits(trait_id) ON DELETE CASCADE,
                 PRIMARY KEY (creature_id, trait_id)
-            )
+            ) WITHOUT ROWID
         """)
         
         # 6. Generation stats table
@@ -206,11 +219,12 @@ def create_schema(conn: sqlite3.Connection) -> None:
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_creatures_parents ON creatures(parent1_id, parent2_id)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_creatures_breeding_eligibility ON creatures(simulation_id, sex, birth_cycle, is_alive)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_creatures_inbreeding ON creatures(simulation_id, inbreeding_coefficient)")
+        # Covers the analysis scripts' selection of living creatures by generation
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_creatures_alive_generation ON creatures(simulation_id, is_alive, generation, creature_id)")
         
-        # Creature genotypes indexes
+        # Creature genotypes indexes (lookups by creature_id use the primary key)
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_creature_genotypes_trait ON creature_genotypes(trait_id)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_creature_genotypes_genotype ON creature_genotypes(genotype)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_creature_genotypes_creature ON creature_genotypes(creature_id)")
         
         # Generation stats indexes
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_generation_stats_generation ON generation_stats(simulation_id, generation)")
@@ -2,15 +2,35 @@
 
 from .trait import Trait, Genotype, TraitType
 from .creature import Creature
-from .breeder import Breeder, RandomBreeder, InbreedingAvoidanceBreeder, KennelClubBreeder, MillBreeder
-from .population import Population
-from .generation import Cycle, CycleStats
+from .population import Population, CreaturePool
 
 __all__ = [
     'Trait', 'Genotype', 'TraitType',
     'Creature',
     'Breeder', 'RandomBreeder', 'InbreedingAvoidanceBreeder', 'KennelClubBreeder', 'MillBreeder',
-    'Population',
+    'Population', 'CreaturePool',
     'Cycle', 'CycleStats',
 ]
 
+# Breeder and cycle classes are imported on first access, so importing a
+# lightweight model (e.g. Trait) does not load the breeding/cycle modules
+_LAZY_EXPORTS = {
+    'Breeder': '.breeder',
+    'RandomBreeder': '.breeder',
+    'InbreedingAvoidanceBreeder': '.breeder',
+    'KennelClubBreeder': '.breeder',
+    'MillBreeder': '.breeder',
+    'Cycle': '.generation',
+    'CycleStats': '.generation',
+}
+
+
+def __getattr__(name):
+    """Import lazily exported classes on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -38,6 +38,29 @@ class Breeder(ABC):
         self.avoid_undesirable_phenotypes = avoid_undesirable_phenotypes
         self.avoid_undesirable_genotypes = avoid_undesirable_genotypes
         self.max_creatures = max_creatures
+        # trait_id -> Trait index for the traits list last passed in (see _get_trait)
+        self._traits_indexed: Optional[List] = None
+        self._trait_by_id: dict = {}
+    
+    def _get_trait(self, traits: List, trait_id: int):
+        """
+        Look up a trait definition by ID.
+        
+        The simulation passes the same traits list every cycle, so the
+        trait_id index is built once per list object rather than scanning the
+        list on every lookup.
+        
+        Args:
+            traits: List of trait definitions
+            trait_id: Trait ID to look up
+            
+        Returns:
+            Matching Trait, or None if not found
+        """
+        if traits is not self._traits_indexed:
+            self._trait_by_id = {t.trait_id: t for t in traits}
+            self._traits_indexed = traits
+        return self._trait_by_id.get(trait_id)
     
     def _has_undesirable_phenotype(self, creature: 'Creature', traits: List) -> bool:
         """Check if creature has any undesirable phenotype."""
@@ -54,7 +77,7 @@ class Breeder(ABC):
                 continue
             
             # Find trait to get phenotype mapping
-            trait = next((t for t in traits if t.trait_id == trait_id), None)
+            trait = self._get_trait(traits, trait_id)
             if trait is None:
                 continue
             
@@ -298,6 +321,29 @@ class KennelClubBreeder(Breeder):
         
         # Cache for genotype pairing scores: {(trait_id, genotype1, genotype2): score}
         self._pairing_score_cache = {}
+        
+        # Tier lookup table: {trait_id: {genotype: tier}}
+        self._tier_lut = self._build_tier_lut(self.genotype_preferences)
+    
+    @staticmethod
+    def _build_tier_lut(genotype_preferences: List[dict]) -> dict:
+        """
+        Build a {trait_id: {genotype: tier}} lookup table from genotype preferences.
+        
+        The first preference entry for a trait wins, and within an entry a genotype
+        listed in several tiers keeps the best one (optimal > acceptable > undesirable).
+        """
+        lut = {}
+        for pref in genotype_preferences:
+            trait_id = pref['trait_id']
+            if trait_id in lut:
+                continue
+            tiers = {}
+            for tier, key in enumerate(('optimal', 'acceptable', 'undesirable')):
+                for genotype in pref.get(key, []):
+                    tiers.setdefault(genotype, tier)
+            lut[trait_id] = tiers
+        return lut
     
     def _get_genotype_tier(self, creature: 'Creature', trait_id: int) -> int:
         """
@@ -309,24 +355,42 @@ class KennelClubBreeder(Breeder):
         if not self.genotype_preferences:
             return 3  # Not configured, use legacy behavior
         
-        # Find preference config for this trait
-        pref = next((p for p in self.genotype_preferences if p['trait_id'] == trait_id), None)
-        if not pref:
+        tiers = self._tier_lut.get(trait_id)
+        if tiers is None:
             return 3  # Not configured for this trait
         
         if trait_id >= len(creature.genome) or creature.genome[trait_id] is None:
             return 3
         
-        genotype = creature.genome[trait_id]
+        return tiers.get(creature.genome[trait_id], 3)
+    
+    def _sub_optimal_mask(self, creatures: List['Creature']) -> List[bool]:
+        """
+        Flag creatures that are candidates for proactive replacement.
         
-        if genotype in pref.get('optimal', []):
-            return 0
-        elif genotype in pref.get('acceptable', []):
-            return 1
-        elif genotype in pref.get('undesirable', []):
-            return 2
-        else:
-            return 3
+        With genotype preferences, a creature is sub-optimal if any preferred trait
+        is not in its optimal tier; otherwise the legacy undesirable-genotype check
+        is used. Scanning the whole list in one call keeps the tier tables in locals.
+        
+        Args:
+            creatures: Creatures to evaluate
+            
+        Returns:
+            List of booleans parallel to creatures
+        """
+        if not self.genotype_preferences:
+            return [self._has_undesirable_genotype(c) for c in creatures]
+        
+        luts = list(self._tier_lut.items())
+        mask = []
+        for creature in creatures:
+            genome = creature.genome
+            n = len(genome)
+            mask.append(any(
+                trait_id >= n or tiers.get(genome[trait_id]) != 0
+                for trait_id, tiers in luts
+            ))
+        return mask
     
     def _has_acceptable_or_better_genotypes(self, creature: 'Creature') -> bool:
         """Check if creature has only optimal or acceptable genotypes (no undesirable)."""
@@ -356,7 +420,7 @@ class KennelClubBreeder(Breeder):
                 return False
             
             # Find trait to get phenotype mapping
-            trait = next((t for t in traits if t.trait_id == trait_id), None)
+            trait = self._get_trait(traits, trait_id)
             if trait is None:
                 return False
             
@@ -378,7 +442,7 @@ class KennelClubBreeder(Breeder):
             if trait_id >= len(creature.genome) or creature.genome[trait_id] is None:
                 return False
             
-            trait = next((t for t in traits if t.trait_id == trait_id), None)
+            trait = self._get_trait(traits, trait_id)
             if trait is None:
                 return False
             
@@ -740,7 +804,7 @@ class KennelClubBreeder(Breeder):
                     if trait_id >= len(creature.genome) or creature.genome[trait_id] is None:
                         continue
                     
-                    trait = next((t for t in traits if t.trait_id == trait_id), None)
+                    trait = self._get_trait(traits, trait_id)
                     if trait is None:
                         continue
                     
@@ -783,7 +847,7 @@ class KennelClubBreeder(Breeder):
                     continue
                 
                 # Find trait definition
-                trait = next((t for t in traits if t.trait_id == trait_id), None)
+                trait = self._get_trait(traits, trait_id)
                 if trait is None:
                     continue
                 
@@ -957,7 +1021,7 @@ class MillBreeder(Breeder):
             if trait_id >= len(creature.genome) or creature.genome[trait_id] is None:
                 return False
             
-            trait = next((t for t in traits if t.trait_id == trait_id), None)
+            trait = self._get_trait(traits, trait_id)
             if trait is None:
                 return False
             
@@ -983,7 +1047,7 @@ class MillBreeder(Breeder):
                 continue
             
             # Find trait to get phenotype mapping
-            trait = next((t for t in traits if t.trait_id == trait_id), None)
+            trait = self._get_trait(traits, trait_id)
             if trait is None:
                 continue
             
@@ -1020,7 +1084,7 @@ class MillBreeder(Breeder):
             for undesirable in self.undesirable_phenotypes:
                 trait_id = undesirable['trait_id']
                 undesirable_phenotype = undesirable['phenotype']
-                trait = next((t for t in traits if t.trait_id == trait_id), None)
+                trait = self._get_trait(traits, trait_id)
                 if trait is not None:
                     filtered_males = [m for m in filtered_males 
                                     if trait_id >= len(m.genome) or m.genome[trait_id] is None or 
@@ -1105,7 +1169,7 @@ class MillBreeder(Breeder):
             for undesirable in self.undesirable_phenotypes:
                 trait_id = undesirable['trait_id']
                 undesirable_phenotype = undesirable['phenotype']
-                trait = next((t for t in traits if t.trait_id == trait_id), None)
+                trait = self._get_trait(traits, trait_id)
                 if trait is not None:
                     filtered = [c for c in filtered 
                                if trait_id >= len(c.genome) or c.genome[trait_id] is None or 
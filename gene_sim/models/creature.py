@@ -11,6 +11,16 @@ if TYPE_CHECKING:
 class Creature:
     """Represents an individual creature with genome, lineage, and lifecycle attributes."""
     
+    # Populations hold many creatures; slots drop the per-instance __dict__
+    __slots__ = (
+        'simulation_id', 'birth_cycle', 'sex', 'genome',
+        'parent1_id', 'parent2_id', 'breeder_id', 'produced_by_breeder_id',
+        'inbreeding_coefficient', 'lifespan', 'is_alive', 'creature_id',
+        'conception_cycle', 'sexual_maturity_cycle', 'max_fertility_age_cycle',
+        'gestation_end_cycle', 'nursing_end_cycle', 'generation',
+        'has_produced_offspring', 'transfer_count', 'is_homed',
+    )
+    
     def __init__(
         self,
         simulation_id: int,
@@ -6,6 +6,11 @@ import json
 import sqlite3
 import numpy as np
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
 if TYPE_CHECKING:
     from .population import Population
     from .breeder import Breeder
@@ -14,6 +19,33 @@ if TYPE_CHECKING:
     from ..config import SimulationConfig
 
 
+def _dumps_json(value) -> str:
+    """
+    Serialize a value to a JSON string, using orjson when it is installed.
+    
+    The fallback emits the same compact separators and raw UTF-8 as orjson,
+    so the stored text does not depend on which serializer is available.
+    """
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    return json.dumps(value, separators=(',', ':'), ensure_ascii=False)
+
+
+def _bulk_update_is_homed(db_conn: sqlite3.Connection, creature_ids: List[int]) -> None:
+    """
+    Mark creatures as homed in the database with a single batched UPDATE.
+    
+    Args:
+        db_conn: Database connection
+        creature_ids: IDs of creatures to mark as homed
+    """
+    if creature_ids:
+        db_conn.executemany(
+            "UPDATE creatures SET is_homed = 1 WHERE creature_id = ?",
+            ((creature_id,) for creature_id in creature_ids)
+        )
+
+
 @dataclass
 class CycleStats:
     """Statistics for a single cycle."""
@@ -28,6 +60,7 @@ class CycleStats:
     heterozygosity: Dict[int, float]  # trait_id -> heterozygosity
     genotype_diversity: Dict[int, int]  # trait_id -> diversity count
     homed_out: int = 0  # Creatures spayed/neutered and homed out
+    created: int = 0  # Creatures persisted this cycle (offspring at conception)
 
 
 class Cycle:
@@ -296,10 +329,7 @@ class Cycle:
                 # Home out traded parents
                 for parent in kennel_traded_parents:
                     parent.is_homed = True
-                    cursor = db_conn.cursor()
-                    cursor.execute("""
-                        UPDATE creatures SET is_homed = 1 WHERE creature_id = ?
-                    """, (parent.creature_id,))
+                _bulk_update_is_homed(db_conn, [p.creature_id for p in kennel_traded_parents])
                 
                 # Update capacity_info to reflect trades and kept offspring
                 if breeder_id in capacity_info:
@@ -445,13 +475,9 @@ class Cycle:
                 breeder_obj.females_acquired_this_cycle = already_acquired_female + females_kept
             
             # Home out replaced parents (they are removed from breeding pool)
+            _bulk_update_is_homed(db_conn, [p.creature_id for p in parents_to_remove])
             for parent in parents_to_remove:
                 parent.is_homed = True
-                # Update in database
-                cursor = db_conn.cursor()
-                cursor.execute("""
-                    UPDATE creatures SET is_homed = 1 WHERE creature_id = ?
-                """, (parent.creature_id,))
                 
                 # Update capacity_info to reflect parent removal
                 if breeder_id in capacity_info:
@@ -594,17 +620,12 @@ class Cycle:
         aged_out = population.get_aged_out_creatures()
         
         # 10. Calculate statistics (before removal)
-        genotype_frequencies = {}
-        allele_frequencies = {}
-        heterozygosity = {}
-        genotype_diversity = {}
-        
-        for trait in traits:
-            trait_id = trait.trait_id
-            genotype_frequencies[trait_id] = population.calculate_genotype_frequencies(trait_id)
-            allele_frequencies[trait_id] = population.calculate_allele_frequencies(trait_id, trait)
-            heterozygosity[trait_id] = population.calculate_heterozygosity(trait_id)
-            genotype_diversity[trait_id] = population.calculate_genotype_diversity(trait_id)
+        (
+            genotype_frequencies,
+            allele_frequencies,
+            heterozygosity,
+            genotype_diversity,
+        ) = population.calculate_trait_stats(traits)
         
         stats = CycleStats(
             cycle=current_cycle,
@@ -614,6 +635,7 @@ class Cycle:
             births=len(births_this_cycle),  # Actual births this cycle
             deaths=len(aged_out),
             homed_out=homed_out,
+            created=len(all_offspring),
             genotype_frequencies=genotype_frequencies,
             allele_frequencies=allele_frequencies,
             heterozygosity=heterozygosity,
@@ -623,8 +645,10 @@ class Cycle:
         # 11. Persist cycle statistics
         self._persist_cycle_stats(db_conn, simulation_id, stats, traits)
         
-        # 12. Remove aged-out creatures (they are already persisted)
+        # 12. Remove aged-out creatures (they are already persisted) and
+        # shift the aging-out list to the next cycle
         population.remove_aged_out_creatures(db_conn, simulation_id)
+        population.advance_cycle()
         
         return stats
     
@@ -698,27 +722,15 @@ class Cycle:
                 breeder.male_targets_for_replacement = []
                 breeder.female_targets_for_replacement = []
                 
-                for creature in breeder_creatures:
-                    # Skip if already counted for end-of-life replacement
-                    death_cycle = creature.birth_cycle + creature.lifespan
-                    if current_cycle + replacement_lead_time >= death_cycle:
-                        continue
-                    
-                    # Check if creature has sub-optimal genotype (not optimal)
-                    # With new preference system: count creatures with acceptable or undesirable genotypes
-                    is_sub_optimal = False
-                    if breeder.genotype_preferences:
-                        # Check if all genotypes are optimal
-                        for pref in breeder.genotype_preferences:
-                            trait_id = pref['trait_id']
-                            tier = breeder._get_genotype_tier(creature, trait_id)
-                            if tier > 0:  # Not optimal (acceptable or undesirable)
-                                is_sub_optimal = True
-                                break
-                    else:
-                        # Legacy: check if has undesirable genotype
-                        is_sub_optimal = breeder._has_undesirable_genotype(creature)
-                    
+                # Creatures not already counted for end-of-life replacement
+                candidates = [
+                    c for c in breeder_creatures
+                    if current_cycle + replacement_lead_time < c.birth_cycle + c.lifespan
+                ]
+                
+                # Flag creatures with sub-optimal genotypes (acceptable or undesirable
+                # with the preference system, undesirable under the legacy config)
+                for creature, is_sub_optimal in zip(candidates, breeder._sub_optimal_mask(candidates)):
                     if is_sub_optimal:
                         # Track this specific creature for potential replacement
                         if creature.sex == 'male':
@@ -764,6 +776,9 @@ class Cycle:
         Returns:
             Number of creatures homed out
         """
+        if not eligible_males and not eligible_females:
+            return 0
+        
         # Extract creature IDs of those that bred
         bred_creature_ids = set()
         for pair in breeding_pairs:
@@ -784,29 +799,26 @@ class Cycle:
         num_males_to_home = int(len(non_breeding_males) * 0.8)
         num_females_to_home = int(len(non_breeding_females) * 0.8)
         
-        # Shuffle and select
-        rng.shuffle(non_breeding_males)
-        rng.shuffle(non_breeding_females)
+        # Sample without replacement (partial shuffle; inputs are left untouched)
+        males_to_home = []
+        if num_males_to_home:
+            male_idxs = rng.choice(len(non_breeding_males), size=num_males_to_home, replace=False)
+            males_to_home = [non_breeding_males[i] for i in male_idxs]
         
-        males_to_home = non_breeding_males[:num_males_to_home]
-        females_to_home = non_breeding_females[:num_females_to_home]
+        females_to_home = []
+        if num_females_to_home:
+            female_idxs = rng.choice(len(non_breeding_females), size=num_females_to_home, replace=False)
+            females_to_home = [non_breeding_females[i] for i in female_idxs]
         
         homed_out = males_to_home + females_to_home
         
         # Mark creatures as homed and update database
         if homed_out:
-            cursor = db_conn.cursor()
             for creature in homed_out:
                 # Mark as homed (stays alive in DB but removed from breeding pool)
                 creature.is_homed = True
-                
-                # Update in database
-                cursor.execute("""
-                    UPDATE creatures
-                    SET is_homed = 1
-                    WHERE creature_id = ?
-                """, (creature.creature_id,))
             
+            _bulk_update_is_homed(db_conn, [c.creature_id for c in homed_out])
             db_conn.commit()
             
             # Remove homed creatures from working memory for performance
@@ -939,29 +951,33 @@ class Cycle:
         mill_breeders = [b for b in breeders if isinstance(b, MillBreeder)]
         other_breeders = [b for b in breeders if not isinstance(b, (KennelClubBreeder, MillBreeder))]
         
+        # Pre-build candidate owner pools once; per-creature filtering only drops the current owner.
+        # Tuples keep breeder order stable so rng.choice() stays reproducible.
+        kennel_plus_other = tuple(kennel_breeders) + tuple(other_breeders)
+        mill_plus_other = tuple(mill_breeders) + tuple(other_breeders)
+        all_breeders = tuple(breeders)
+        mill_breeder_ids = {b.breeder_id for b in mill_breeders}
+        
         # Track if we've done a transfer this cycle (only one per cycle)
         transfer_done = False
         
-        # Shuffle creatures for random selection
-        eligible_creatures = list(population.creatures)
+        # Pre-filter to creatures that can actually be transferred (owned, have bred,
+        # not gestating or nursing) so the shuffle only touches real candidates
+        cycle_number = self.cycle_number
+        eligible_creatures = [
+            c for c in population.creatures
+            if c.breeder_id is not None
+            and c.has_produced_offspring
+            and (c.gestation_end_cycle is None or c.gestation_end_cycle <= cycle_number)
+            and (c.nursing_end_cycle is None or c.nursing_end_cycle <= cycle_number)
+        ]
+        if not eligible_creatures:
+            return
         rng.shuffle(eligible_creatures)
         
         for creature in eligible_creatures:
             if transfer_done:
                 break
-                
-            if creature.breeder_id is None:
-                continue
-            
-            # Rule: No transfer until has produced offspring
-            if not creature.has_produced_offspring:
-                continue
-            
-            # Rule: No transfer if gestating or nursing
-            if creature.gestation_end_cycle is not None and creature.gestation_end_cycle > self.cycle_number:
-                continue
-            if creature.nursing_end_cycle is not None and creature.nursing_end_cycle > self.cycle_number:
-                continue
             
             # Find current owner
             current_owner = next((b for b in breeders if b.breeder_id == creature.breeder_id), None)
@@ -999,31 +1015,30 @@ class Cycle:
             
             if isinstance(current_owner, KennelClubBreeder):
                 # Kennels transfer to other kennels or random/inbreeding avoidance breeders
-                available_breeders = [b for b in kennel_breeders + other_breeders 
+                available_breeders = [b for b in kennel_plus_other
                                      if b.breeder_id != creature.breeder_id]
                 
             elif isinstance(current_owner, MillBreeder):
                 # Mills may replace female with offspring
                 # For now, transfer out to "homes" (remove from breeding pool by transferring to None or special breeder)
                 # In this implementation, we'll transfer to other mills or random breeders
-                available_breeders = [b for b in mill_breeders + other_breeders 
+                available_breeders = [b for b in mill_plus_other
                                      if b.breeder_id != creature.breeder_id]
             else:
                 # Other breeders can transfer to anyone except kennels if mill-origin
-                if isinstance(current_owner, MillBreeder) or creature.produced_by_breeder_id in [b.breeder_id for b in mill_breeders]:
+                if isinstance(current_owner, MillBreeder) or creature.produced_by_breeder_id in mill_breeder_ids:
                     # Mill-origin, kennels won't accept
-                    available_breeders = [b for b in mill_breeders + other_breeders 
+                    available_breeders = [b for b in mill_plus_other
                                          if b.breeder_id != creature.breeder_id]
                 else:
                     # Not mill-origin, can go anywhere
-                    available_breeders = [b for b in breeders if b.breeder_id != creature.breeder_id]
+                    available_breeders = [b for b in all_breeders if b.breeder_id != creature.breeder_id]
             
             if not available_breeders:
                 continue
             
             # Additional kennel club restriction: won't accept mill-origin creatures
             if available_breeders:
-                mill_breeder_ids = [b.breeder_id for b in mill_breeders]
                 if creature.produced_by_breeder_id in mill_breeder_ids:
                     # Filter out kennel breeders from available
                     available_breeders = [b for b in available_breeders if not isinstance(b, KennelClubBreeder)]
@@ -1037,20 +1052,14 @@ class Cycle:
             creature.breeder_id = new_owner.breeder_id
             creature.transfer_count += 1
             
-            # Record ownership transfer in database
+            # Record ownership transfer in database (trg_creature_ownership_transfer
+            # updates creatures.breeder_id in the same statement)
             cursor.execute("""
                 INSERT INTO creature_ownership_history (
                     creature_id, breeder_id, transfer_generation
                 ) VALUES (?, ?, ?)
             """, (creature.creature_id, new_owner.breeder_id, self.cycle_number))
             
-            # Update creature's breeder_id in database
-            cursor.execute("""
-                UPDATE creatures
-                SET breeder_id = ?
-                WHERE creature_id = ?
-            """, (new_owner.breeder_id, creature.creature_id))
-            
             transfer_done = True  # Only one transfer per cycle
         
         db_conn.commit()
@@ -1062,66 +1071,58 @@ class Cycle:
         stats: CycleStats,
         traits: List['Trait']
     ) -> None:
-        """Persist cycle statistics to database."""
-        cursor = db_conn.cursor()
+        """
+        Persist cycle statistics to database.
         
-        # Insert generation_stats (using generation column to store cycle number)
-        cursor.execute("""
-            INSERT INTO generation_stats (
-                simulation_id, generation, population_size,
-                eligible_males, eligible_females, births, deaths
-            ) VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (
-            simulation_id,
-            stats.cycle,  # Store cycle number in generation column
-            stats.population_size,
-            stats.eligible_males,
-            stats.eligible_females,
-            stats.births,
-            stats.deaths
-        ))
-        
-        # Batch insert genotype frequencies
-        genotype_freq_data = []
-        for trait_id, frequencies in stats.genotype_frequencies.items():
-            for genotype, frequency in frequencies.items():
-                genotype_freq_data.append((
-                    simulation_id,
-                    stats.cycle,  # Store cycle number in generation column
-                    trait_id,
-                    genotype,
-                    frequency
-                ))
-        
-        if genotype_freq_data:
-            cursor.executemany("""
+        All three inserts run inside a single transaction so each cycle costs
+        one commit.
+        """
+        sid = simulation_id
+        cyc = stats.cycle  # Stored in the generation column
+        af_get = stats.allele_frequencies.get
+        het_get = stats.heterozygosity.get
+        gd_get = stats.genotype_diversity.get
+        
+        # Rows are streamed into executemany, so only one tuple is live at a time
+        genotype_freq_rows = (
+            (sid, cyc, tid, genotype, frequency)
+            for tid, frequencies in stats.genotype_frequencies.items()
+            for genotype, frequency in frequencies.items()
+        )
+        trait_stats_rows = (
+            (sid, cyc, tid, _dumps_json(af_get(tid, {})), het_get(tid, 0.0), gd_get(tid, 0))
+            for tid in (t.trait_id for t in traits)
+        )
+        
+        with db_conn:
+            # Insert generation_stats (using generation column to store cycle number)
+            db_conn.execute("""
+                INSERT INTO generation_stats (
+                    simulation_id, generation, population_size,
+                    eligible_males, eligible_females, births, deaths
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, (
+                sid,
+                cyc,
+                stats.population_size,
+                stats.eligible_males,
+                stats.eligible_females,
+                stats.births,
+                stats.deaths
+            ))
+            
+            db_conn.executemany("""
                 INSERT INTO generation_genotype_frequencies (
                     simulation_id, generation, trait_id, genotype, frequency
                 ) VALUES (?, ?, ?, ?, ?)
-            """, genotype_freq_data)
-        
-        # Batch insert trait stats
-        trait_stats_data = []
-        for trait_id in [t.trait_id for t in traits]:
-            allele_freqs = stats.allele_frequencies.get(trait_id, {})
-            trait_stats_data.append((
-                simulation_id,
-                stats.cycle,  # Store cycle number in generation column
-                trait_id,
-                json.dumps(allele_freqs),
-                stats.heterozygosity.get(trait_id, 0.0),
-                stats.genotype_diversity.get(trait_id, 0)
-            ))
-        
-        if trait_stats_data:
-            cursor.executemany("""
+            """, genotype_freq_rows)
+            
+            db_conn.executemany("""
                 INSERT INTO generation_trait_stats (
                     simulation_id, generation, trait_id,
                     allele_frequencies, heterozygosity, genotype_diversity
                 ) VALUES (?, ?, ?, ?, ?, ?)
-            """, trait_stats_data)
-        
-        db_conn.commit()
+            """, trait_stats_rows)
     
     def advance(self) -> int:
         """
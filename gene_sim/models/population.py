@@ -1,20 +1,350 @@
 """Population model for managing working pool of creatures."""
 
-from typing import List, Dict, Optional, TYPE_CHECKING
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import sqlite3
+from typing import Any, Deque, Iterable, Iterator, List, Dict, Optional, Tuple, TYPE_CHECKING
+import numpy as np
 from .creature import Creature
+from .trait import UNKNOWN_GENOTYPE_CODE
 
 if TYPE_CHECKING:
     from ..config import SimulationConfig
 
 
+# Statement text is kept constant so the connection's statement cache is hit
+INSERT_CREATURE_SQL = """
+    INSERT INTO creatures (
+        simulation_id, birth_cycle, sex, parent1_id, parent2_id, breeder_id,
+        produced_by_breeder_id, inbreeding_coefficient, lifespan, is_alive,
+        conception_cycle, sexual_maturity_cycle, max_fertility_age_cycle,
+        gestation_end_cycle, nursing_end_cycle, generation, is_homed
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+INSERT_GENOTYPE_SQL = """
+    INSERT INTO creature_genotypes (creature_id, trait_id, genotype)
+    VALUES (?, ?, ?)
+"""
+
+# Row indices of Population.sex_index(); creatures with any other sex (None) get SEX_OTHER
+SEX_FEMALE = 0
+SEX_MALE = 1
+SEX_OTHER = 2
+
+class CreaturePool:
+    """
+    Insertion-ordered set of creatures supporting O(1) removal.
+    
+    Creatures are keyed by object identity rather than creature_id, because
+    founders join the working pool before they are persisted and assigned IDs.
+    Iteration yields creatures in the order they were added.
+    """
+    
+    def __init__(self, creatures: Iterable[Creature] = ()):
+        """
+        Initialize pool.
+        
+        Args:
+            creatures: Initial creatures, in order
+        """
+        self._by_key: Dict[int, Creature] = {id(c): c for c in creatures}
+    
+    def __iter__(self) -> Iterator[Creature]:
+        return iter(self._by_key.values())
+    
+    def __len__(self) -> int:
+        return len(self._by_key)
+    
+    def __contains__(self, creature: object) -> bool:
+        return id(creature) in self._by_key
+    
+    def __repr__(self) -> str:
+        return f"CreaturePool({list(self._by_key.values())!r})"
+    
+    def extend(self, creatures: Iterable[Creature]) -> None:
+        """Add creatures to the end of the pool."""
+        self._by_key.update((id(c), c) for c in creatures)
+    
+    def discard(self, creature: Creature) -> None:
+        """Remove a creature if present."""
+        self._by_key.pop(id(creature), None)
+
+
 class Population:
-    """Manages the working pool of creatures and aging-out list."""
+    """
+    Manages the working pool of creatures and aging-out list.
+    
+    Eligible male/female lists are cached per cycle, and per-trait genotype
+    columns and counts for the stats methods are cached until the pool changes.
+    These caches are cleared by add_creatures, remove_aged_out_creatures,
+    remove_homed_creatures and by assigning ``creatures``; code that changes a
+    creature's eligibility by other means within the same cycle must call
+    invalidate_eligibility_cache().
+    """
     
     def __init__(self):
         """Initialize empty population."""
-        self.creatures: List[Creature] = []
-        # Aging-out list: List[List[Creature]] where index 0 = current cycle
-        self.age_out: List[List[Creature]] = []
+        # Eligibility cache: current_cycle -> (eligible_males, eligible_females)
+        self._eligibility_cache: Dict[int, Tuple[List[Creature], List[Creature]]] = {}
+        # Genotype column cache: trait_id -> (genotype strings, is-male flags)
+        self._genome_columns: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+        # Genotype count cache: (trait_id, by_sex) -> Counter of genotype or (genotype, is_male)
+        self._genotype_counts: Dict[Tuple[int, bool], Counter] = {}
+        # Encoded views: trait_ids -> (N, T) genotype code matrix, and per-creature sex index
+        self._genome_matrices: Dict[Tuple[int, ...], np.ndarray] = {}
+        self._sex_index: Optional[np.ndarray] = None
+        # Per-sex sub-pools of the working pool, kept in working-pool order
+        self.males = CreaturePool()
+        self.females = CreaturePool()
+        self.creatures = []
+        # IDs of homed creatures still referenced from age_out buckets; they are
+        # filtered out lazily when their bucket comes up
+        self._homed_ids: set = set()
+        # Aging-out list: deque of buckets where index 0 = current cycle
+        self.age_out: Deque[List[Creature]] = deque()
+        # Cursor reused by _persist_creatures, with the connection it belongs to
+        self._cursor: Optional[sqlite3.Cursor] = None
+        self._cursor_conn: Optional[sqlite3.Connection] = None
+    
+    @property
+    def age_out(self) -> Deque[List[Creature]]:
+        """Aging-out buckets; index 0 holds creatures aging out this cycle."""
+        return self._age_out
+    
+    @age_out.setter
+    def age_out(self, buckets: Iterable[List[Creature]]) -> None:
+        # Stored as a deque so shifting to the next cycle is an O(1) popleft()
+        self._age_out = deque(buckets)
+    
+    @property
+    def creatures(self) -> CreaturePool:
+        """
+        Working pool of creatures.
+        
+        Assigning any iterable of creatures replaces the pool and rebuilds the
+        per-sex sub-pools. Use add_creatures and the remove_* methods rather
+        than mutating the pool directly.
+        """
+        return self._creatures
+    
+    @creatures.setter
+    def creatures(self, creatures: Iterable[Creature]) -> None:
+        self._creatures = CreaturePool(creatures)
+        self.males = CreaturePool(c for c in self._creatures if c.sex == 'male')
+        self.females = CreaturePool(c for c in self._creatures if c.sex == 'female')
+        self._membership_changed()
+    
+    def clear(self) -> None:
+        """Remove all creatures from the working pool and aging-out list."""
+        self.creatures = []
+        self.age_out = []
+        self._homed_ids.clear()
+    
+    def invalidate_eligibility_cache(self) -> None:
+        """Discard cached eligible male/female lists."""
+        self._eligibility_cache.clear()
+    
+    def _membership_changed(self) -> None:
+        """Discard every cache derived from which creatures are in the working pool."""
+        self._eligibility_cache.clear()
+        self._genome_columns.clear()
+        self._genotype_counts.clear()
+        self._genome_matrices.clear()
+        self._sex_index = None
+    
+    def _trait_column(self, trait_id: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the set genotypes for a trait across the working pool, with each carrier's sex.
+        
+        Creatures whose genome does not cover the trait, or has it unset, are
+        skipped. The columns are cached until the working pool changes.
+        
+        Args:
+            trait_id: ID of the trait
+            
+        Returns:
+            Tuple of (object array of genotype strings, boolean is-male array),
+            parallel to each other and in working-pool order
+        """
+        columns = self._genome_columns.get(trait_id)
+        if columns is None:
+            carriers = [
+                c for c in self._creatures
+                if trait_id < len(c.genome) and c.genome[trait_id] is not None
+            ]
+            columns = (
+                np.array([c.genome[trait_id] for c in carriers], dtype=object),
+                np.fromiter((c.sex == 'male' for c in carriers), dtype=bool, count=len(carriers)),
+            )
+            self._genome_columns[trait_id] = columns
+        return columns
+    
+    def genome_matrix(self, traits: List) -> np.ndarray:
+        """
+        Get the working pool's genomes as a matrix of integer genotype codes.
+        
+        Row i is the i-th creature in working-pool order; column t holds the
+        code (see Trait.genotype_codes) of the creature's genotype for trait_id
+        t. Unset, undeclared and uncovered genotypes are UNKNOWN_GENOTYPE_CODE.
+        The matrix is cached until the working pool changes; do not mutate it.
+        
+        Args:
+            traits: Traits to encode
+            
+        Returns:
+            int16 array of shape (len(creatures), max_trait_id + 1)
+        """
+        key = tuple(trait.trait_id for trait in traits)
+        matrix = self._genome_matrices.get(key)
+        if matrix is None:
+            n = len(self._creatures)
+            width = max(key) + 1 if key else 0
+            matrix = np.full((n, width), UNKNOWN_GENOTYPE_CODE, dtype=np.int16)
+            genomes = [c.genome for c in self._creatures]
+            for trait in traits:
+                trait_id = trait.trait_id
+                codes = trait.genotype_codes
+                matrix[:, trait_id] = np.fromiter(
+                    (codes.get(g[trait_id], UNKNOWN_GENOTYPE_CODE) if trait_id < len(g) else UNKNOWN_GENOTYPE_CODE
+                     for g in genomes),
+                    dtype=np.int16, count=n
+                )
+            self._genome_matrices[key] = matrix
+        return matrix
+    
+    def sex_index(self) -> np.ndarray:
+        """
+        Get each creature's sex as SEX_FEMALE, SEX_MALE or SEX_OTHER, in working-pool order.
+        
+        Cached until the working pool changes; do not mutate the returned array.
+        """
+        if self._sex_index is None:
+            index = {'female': SEX_FEMALE, 'male': SEX_MALE}
+            self._sex_index = np.fromiter(
+                (index.get(c.sex, SEX_OTHER) for c in self._creatures),
+                dtype=np.int8, count=len(self._creatures)
+            )
+        return self._sex_index
+    
+    def _count_genotypes(self, trait_id: int, by_sex: bool = False) -> Counter:
+        """
+        Count carriers of each genotype for a trait, cached until the working pool changes.
+        
+        Counter hashes the strings in a single C-level pass, which is much
+        faster than sorting an object array with np.unique.
+        
+        Args:
+            trait_id: ID of the trait
+            by_sex: Count (genotype, is_male) pairs instead of genotypes
+            
+        Returns:
+            Counter keyed by genotype string, or by (genotype, is_male) if by_sex
+        """
+        key = (trait_id, by_sex)
+        counts = self._genotype_counts.get(key)
+        if counts is None:
+            genotypes, is_male = self._trait_column(trait_id)
+            if by_sex:
+                counts = Counter(zip(genotypes.tolist(), is_male.tolist()))
+            else:
+                counts = Counter(genotypes.tolist())
+            self._genotype_counts[key] = counts
+        return counts
+    
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _alleles_of(genotype_str: str, sex_linked: bool, is_male: bool) -> Tuple[Tuple[str, ...], int]:
+        """
+        Split a genotype string into the alleles it contributes to allele frequencies.
+        
+        Memoized per (genotype, sex_linked, is_male), so each distinct genotype
+        is parsed once per process.
+        
+        Args:
+            genotype_str: Genotype string
+            sex_linked: Whether the trait is sex-linked
+            is_male: Whether the carrier is male (only relevant if sex_linked)
+            
+        Returns:
+            Tuple of (alleles, number of alleles added to the frequency denominator)
+        """
+        if sex_linked:
+            if is_male:
+                # Male has single allele
+                return (genotype_str,), 1
+            if len(genotype_str) == 2:
+                # Female has two alleles
+                return tuple(genotype_str), 2
+            # Handle multi-character alleles (e.g., "Nc")
+            # Simplified: treat as single allele for now
+            return (genotype_str,), 1
+        if '_' in genotype_str:
+            # Polygenic: extract from each gene pair
+            alleles = []
+            for pair in genotype_str.split('_'):
+                if len(pair) >= 2:
+                    mid = len(pair) // 2
+                    alleles.append(pair[:mid])
+                    alleles.append(pair[mid:])
+            return tuple(alleles), len(alleles)
+        if len(genotype_str) == 2:
+            # Simple: extract two alleles
+            return tuple(genotype_str), 2
+        # Handle longer genotypes (counted once in the denominator)
+        mid = len(genotype_str) // 2
+        return (genotype_str[:mid], genotype_str[mid:]), 1
+    
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _is_heterozygous(genotype_str: str) -> bool:
+        """
+        Return True if a genotype string carries two different alleles at any gene.
+        
+        Memoized: the set of distinct genotype strings is tiny, so each one is
+        parsed once per process rather than once per cycle.
+        """
+        if '_' not in genotype_str:
+            if len(genotype_str) == 2:
+                return genotype_str[0] != genotype_str[1]
+            # Multi-character: check if halves differ
+            mid = len(genotype_str) // 2
+            return genotype_str[:mid] != genotype_str[mid:]
+        # Polygenic: check if any gene pair is heterozygous
+        return any(
+            pair[:len(pair) // 2] != pair[len(pair) // 2:]
+            for pair in genotype_str.split('_')
+            if len(pair) >= 2
+        )
+    
+    def _get_eligible(
+        self,
+        current_cycle: int,
+        config: 'SimulationConfig'
+    ) -> Tuple[List[Creature], List[Creature]]:
+        """
+        Get (eligible_males, eligible_females), building both in one pass on a cache miss.
+        
+        Args:
+            current_cycle: Current simulation cycle
+            config: Simulation configuration
+            
+        Returns:
+            Tuple of eligible male and female lists (shared with the cache; do not mutate)
+        """
+        cached = self._eligibility_cache.get(current_cycle)
+        if cached is not None:
+            return cached
+        
+        # Bind the predicate once so the comprehensions skip per-creature method lookup
+        is_eligible = Creature.is_breeding_eligible
+        cached = (
+            [c for c in self.males if not c.is_homed and is_eligible(c, current_cycle, config)],
+            [c for c in self.females if not c.is_homed and is_eligible(c, current_cycle, config)],
+        )
+        self._eligibility_cache[current_cycle] = cached
+        return cached
     
     def get_eligible_males(
         self, 
@@ -31,12 +361,9 @@ class Population:
             config: Simulation configuration
             
         Returns:
-            List of eligible male creatures
+            List of eligible male creatures (cached for the cycle; do not mutate)
         """
-        return [
-            c for c in self.creatures
-            if c.sex == 'male' and not c.is_homed and c.is_breeding_eligible(current_cycle, config)
-        ]
+        return self._get_eligible(current_cycle, config)[0]
     
     def get_eligible_females(
         self, 
@@ -53,12 +380,9 @@ class Population:
             config: Simulation configuration
             
         Returns:
-            List of eligible female creatures
+            List of eligible female creatures (cached for the cycle; do not mutate)
         """
-        return [
-            c for c in self.creatures
-            if c.sex == 'female' and not c.is_homed and c.is_breeding_eligible(current_cycle, config)
-        ]
+        return self._get_eligible(current_cycle, config)[1]
     
     def add_creatures(self, creatures: List[Creature], current_cycle: int) -> None:
         """
@@ -69,19 +393,39 @@ class Population:
             current_cycle: Current simulation cycle
         """
         self.creatures.extend(creatures)
+        self.males.extend(c for c in creatures if c.sex == 'male')
+        self.females.extend(c for c in creatures if c.sex == 'female')
+        self._membership_changed()
+        
+        # Update aging-out list: group by the relative cycle when each creature
+        # ages out (current_cycle >= birth_cycle + lifespan), then grow the list
+        # once and extend each slot once
+        buckets: Dict[int, List[Creature]] = defaultdict(list)
+        for creature in creatures:
+            buckets[creature.birth_cycle + creature.lifespan - current_cycle].append(creature)
+        if not buckets:
+            return
+        
+        max_relative_cycle = max(buckets)
+        if max_relative_cycle >= len(self.age_out):
+            self.age_out.extend([] for _ in range(max_relative_cycle + 1 - len(self.age_out)))
         
-        # Update aging-out list
+        for relative_cycle, bucket in buckets.items():
+            self.age_out[relative_cycle].extend(bucket)
+    
+    def _remove(self, creatures: List[Creature]) -> None:
+        """Drop persisted creatures from the working pool and sex sub-pools in O(len(creatures))."""
+        removed = False
         for creature in creatures:
-            # Calculate relative cycle when creature will age out
-            # Age out when: current_cycle >= birth_cycle + lifespan
-            relative_cycle = creature.birth_cycle + creature.lifespan - current_cycle
-            
-            # Ensure aging-out list is large enough
-            while len(self.age_out) <= relative_cycle:
-                self.age_out.append([])
-            
-            # Append creature to appropriate cycle slot
-            self.age_out[relative_cycle].append(creature)
+            if creature.creature_id is None or creature not in self._creatures:
+                continue
+            self._creatures.discard(creature)
+            self.males.discard(creature)
+            self.females.discard(creature)
+            removed = True
+        # Caches stay valid when nothing actually left the pool
+        if removed:
+            self._membership_changed()
     
     def get_aged_out_creatures(self) -> List[Creature]:
         """
@@ -90,9 +434,12 @@ class Population:
         Returns:
             List of creatures aging out (from age_out[0])
         """
-        if len(self.age_out) == 0:
+        if len(self.age_out) == 0 or not self.age_out[0]:
             return []
-        return self.age_out[0].copy() if self.age_out[0] else []
+        if self._homed_ids:
+            homed_ids = self._homed_ids
+            return [c for c in self.age_out[0] if c.creature_id not in homed_ids]
+        return self.age_out[0].copy()
     
     def remove_aged_out_creatures(self, db_conn, simulation_id: int) -> None:
         """
@@ -100,6 +447,7 @@ class Population:
         
         Note: All creatures are already persisted immediately upon creation,
         so this method only removes them from the in-memory working pool.
+        It does not shift the aging-out list; call advance_cycle() afterwards.
         
         Args:
             db_conn: Database connection (unused, kept for API compatibility)
@@ -110,12 +458,7 @@ class Population:
         if aged_out:
             # All creatures are already persisted immediately upon creation,
             # so we only need to remove them from the working pool
-            creature_ids_to_remove = {c.creature_id for c in aged_out if c.creature_id is not None}
-            self.creatures = [c for c in self.creatures if c.creature_id not in creature_ids_to_remove]
-        
-        # Always shift age_out list, even if no creatures aged out this cycle
-        if len(self.age_out) > 0:
-            self.age_out = self.age_out[1:]
+            self._remove(aged_out)
     
     def remove_homed_creatures(self, homed_creatures: List[Creature]) -> None:
         """
@@ -123,29 +466,45 @@ class Population:
         
         Homed creatures are already persisted to database and marked with is_homed=True.
         This method removes them from in-memory population to improve performance.
+        Removal from age_out is deferred: get_aged_out_creatures skips them.
         
         Args:
             homed_creatures: List of creatures that have been homed
         """
-        if homed_creatures:
-            creature_ids_to_remove = {c.creature_id for c in homed_creatures if c.creature_id is not None}
-            
-            # Remove from main creatures list
-            self.creatures = [c for c in self.creatures if c.creature_id not in creature_ids_to_remove]
-            
-            # Also remove from age_out lists
-            for age_list in self.age_out:
-                if age_list:
-                    # Filter out homed creatures from each age bucket
-                    age_list[:] = [c for c in age_list if c.creature_id not in creature_ids_to_remove]
+        creature_ids_to_remove = {c.creature_id for c in homed_creatures if c.creature_id is not None}
+        if not creature_ids_to_remove:
+            return
+        
+        # Remove from main creatures pool and sex sub-pools
+        self._remove(homed_creatures)
+        
+        # Defer age_out cleanup: homed creatures are skipped when their bucket
+        # comes up. Compact once stale entries outnumber the working pool, so
+        # homed creatures are not kept alive for their whole lifespan.
+        self._homed_ids.update(creature_ids_to_remove)
+        if len(self._homed_ids) > len(self._creatures):
+            self._compact_age_out()
+    
+    def _compact_age_out(self) -> None:
+        """Drop homed creatures from every age_out bucket and reset the homed-ID set."""
+        homed_ids = self._homed_ids
+        for age_list in self.age_out:
+            if any(c.creature_id in homed_ids for c in age_list):
+                age_list[:] = [c for c in age_list if c.creature_id not in homed_ids]
+        homed_ids.clear()
     
     def advance_cycle(self) -> None:
         """
-        Advance aging-out list by slicing off the first element.
-        Should be called after remove_aged_out_creatures.
+        Advance aging-out list by dropping the first bucket.
+        
+        This is the only method that shifts age_out. It must be called once
+        per cycle, after remove_aged_out_creatures, even if nothing aged out.
         """
-        if len(self.age_out) > 0:
-            self.age_out = self.age_out[1:]
+        if self.age_out:
+            expired = self.age_out.popleft()
+            if self._homed_ids:
+                # Homed IDs from the dropped bucket can no longer be referenced
+                self._homed_ids.difference_update(c.creature_id for c in expired)
     
     def calculate_genotype_frequencies(self, trait_id: int) -> Dict[str, float]:
         """
@@ -160,19 +519,12 @@ class Population:
         if not self.creatures:
             return {}
         
-        genotype_counts: Dict[str, int] = {}
-        total = 0
-        
-        for creature in self.creatures:
-            if trait_id < len(creature.genome) and creature.genome[trait_id] is not None:
-                genotype = creature.genome[trait_id]
-                genotype_counts[genotype] = genotype_counts.get(genotype, 0) + 1
-                total += 1
-        
+        counts = self._count_genotypes(trait_id)
+        total = sum(counts.values())
         if total == 0:
             return {}
         
-        return {genotype: count / total for genotype, count in genotype_counts.items()}
+        return {genotype: count / total for genotype, count in counts.items()}
     
     def calculate_allele_frequencies(self, trait_id: int, trait) -> Dict[str, float]:
         """
@@ -188,65 +540,31 @@ class Population:
         if not self.creatures:
             return {}
         
-        allele_counts: Dict[str, int] = {}
+        # Count carriers per distinct genotype (and sex, where it matters), then
+        # parse each distinct genotype once and weight its alleles by that count
+        sex_linked = trait.trait_type.value == 'SEX_LINKED'
+        if sex_linked:
+            carrier_counts = self._count_genotypes(trait_id, by_sex=True).items()
+        else:
+            carrier_counts = (
+                ((genotype_str, False), count)
+                for genotype_str, count in self._count_genotypes(trait_id).items()
+            )
+        
+        alleles_of = self._alleles_of
+        allele_counts: Counter = Counter()
         total_alleles = 0
-        
-        for creature in self.creatures:
-            if trait_id >= len(creature.genome) or creature.genome[trait_id] is None:
-                continue
-            
-            genotype_str = creature.genome[trait_id]
-            
-            # Extract alleles based on trait type
-            if trait.trait_type.value == 'SEX_LINKED':
-                if creature.sex == 'male':
-                    # Male has single allele
-                    allele = genotype_str
-                    allele_counts[allele] = allele_counts.get(allele, 0) + 1
-                    total_alleles += 1
-                else:
-                    # Female has two alleles
-                    if len(genotype_str) == 2:
-                        for allele in genotype_str:
-                            allele_counts[allele] = allele_counts.get(allele, 0) + 1
-                            total_alleles += 1
-                    else:
-                        # Handle multi-character alleles (e.g., "Nc")
-                        # Simplified: treat as single allele for now
-                        allele_counts[genotype_str] = allele_counts.get(genotype_str, 0) + 1
-                        total_alleles += 1
-            else:
-                # Non-sex-linked: extract alleles
-                if '_' in genotype_str:
-                    # Polygenic: extract from each gene pair
-                    gene_pairs = genotype_str.split('_')
-                    for pair in gene_pairs:
-                        if len(pair) >= 2:
-                            mid = len(pair) // 2
-                            allele1 = pair[:mid]
-                            allele2 = pair[mid:]
-                            allele_counts[allele1] = allele_counts.get(allele1, 0) + 1
-                            allele_counts[allele2] = allele_counts.get(allele2, 0) + 1
-                            total_alleles += 2
-                else:
-                    # Simple: extract two alleles
-                    if len(genotype_str) == 2:
-                        for allele in genotype_str:
-                            allele_counts[allele] = allele_counts.get(allele, 0) + 1
-                            total_alleles += 1
-                    else:
-                        # Handle longer genotypes
-                        mid = len(genotype_str) // 2
-                        allele1 = genotype_str[:mid]
-                        allele2 = genotype_str[mid:]
-                        allele_counts[allele1] = allele_counts.get(allele1, 0) + 1
-                        allele_counts[allele2] = allele_counts.get(allele2, 0) + 1
-                        total_alleles += 1
+        for (genotype_str, male), count in carrier_counts:
+            alleles, n_alleles = alleles_of(genotype_str, sex_linked, male)
+            for allele in alleles:
+                allele_counts[allele] += count
+            total_alleles += n_alleles * count
         
         if total_alleles == 0:
             return {}
         
-        return {allele: count / total_alleles for allele, count in allele_counts.items()}
+        # Gametes drawn with rng.choice are numpy.str_; key the result by plain str
+        return {str(allele): count / total_alleles for allele, count in allele_counts.items()}
     
     def calculate_heterozygosity(self, trait_id: int) -> float:
         """
@@ -261,40 +579,14 @@ class Population:
         if not self.creatures:
             return 0.0
         
-        heterozygous_count = 0
-        total = 0
-        
-        for creature in self.creatures:
-            if trait_id >= len(creature.genome) or creature.genome[trait_id] is None:
-                continue
-            
-            genotype_str = creature.genome[trait_id]
-            total += 1
-            
-            # Check if heterozygous
-            # For simple genotypes, check if alleles differ
-            if '_' not in genotype_str:
-                if len(genotype_str) == 2:
-                    if genotype_str[0] != genotype_str[1]:
-                        heterozygous_count += 1
-                else:
-                    # Multi-character: check if halves differ
-                    mid = len(genotype_str) // 2
-                    if genotype_str[:mid] != genotype_str[mid:]:
-                        heterozygous_count += 1
-            else:
-                # Polygenic: check if any gene pair is heterozygous
-                gene_pairs = genotype_str.split('_')
-                for pair in gene_pairs:
-                    if len(pair) >= 2:
-                        mid = len(pair) // 2
-                        if pair[:mid] != pair[mid:]:
-                            heterozygous_count += 1
-                            break
-        
+        counts = self._count_genotypes(trait_id)
+        total = sum(counts.values())
         if total == 0:
             return 0.0
         
+        # Classify each distinct genotype once, then weight by its count
+        is_heterozygous = self._is_heterozygous
+        heterozygous_count = sum(count for genotype, count in counts.items() if is_heterozygous(genotype))
         return heterozygous_count / total
     
     def calculate_genotype_diversity(self, trait_id: int) -> int:
@@ -310,13 +602,60 @@ class Population:
         if not self.creatures:
             return 0
         
-        distinct_genotypes = set()
+        return len(self._count_genotypes(trait_id))
+    
+    def calculate_trait_stats(
+        self,
+        traits: List,
+        max_workers: Optional[int] = None
+    ) -> Tuple[Dict[int, Dict[str, float]], Dict[int, Dict[str, float]], Dict[int, float], Dict[int, int]]:
+        """
+        Calculate genotype/allele frequencies, heterozygosity and diversity for many traits.
         
-        for creature in self.creatures:
-            if trait_id < len(creature.genome) and creature.genome[trait_id] is not None:
-                distinct_genotypes.add(creature.genome[trait_id])
+        Traits are independent and only read the working pool, so they can be
+        fanned out over a thread pool. Most of the per-trait work holds the GIL,
+        so threads only pay off for large populations with many traits; by
+        default the traits are processed serially.
         
-        return len(distinct_genotypes)
+        Args:
+            traits: Trait objects to calculate statistics for
+            max_workers: Number of worker threads (None or 1 runs serially)
+            
+        Returns:
+            Tuple of (genotype_frequencies, allele_frequencies, heterozygosity,
+            genotype_diversity), each keyed by trait_id
+        """
+        def trait_stats(trait) -> Tuple[int, Tuple[Any, Any, Any, Any]]:
+            trait_id = trait.trait_id
+            return trait_id, (
+                self.calculate_genotype_frequencies(trait_id),
+                self.calculate_allele_frequencies(trait_id, trait),
+                self.calculate_heterozygosity(trait_id),
+                self.calculate_genotype_diversity(trait_id),
+            )
+        
+        if max_workers is not None and max_workers > 1 and len(traits) > 1:
+            # Build the shared caches up front so workers only read them
+            for trait in traits:
+                self._count_genotypes(trait.trait_id)
+                self._count_genotypes(trait.trait_id, by_sex=True)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(trait_stats, traits))
+        else:
+            results = [trait_stats(trait) for trait in traits]
+        
+        genotype_frequencies = {trait_id: r[0] for trait_id, r in results}
+        allele_frequencies = {trait_id: r[1] for trait_id, r in results}
+        heterozygosity = {trait_id: r[2] for trait_id, r in results}
+        genotype_diversity = {trait_id: r[3] for trait_id, r in results}
+        return genotype_frequencies, allele_frequencies, heterozygosity, genotype_diversity
+    
+    def _get_cursor(self, db_conn: sqlite3.Connection) -> sqlite3.Cursor:
+        """Return a cursor on db_conn, reused across calls while the connection is unchanged."""
+        if self._cursor_conn is not db_conn:
+            self._cursor = db_conn.cursor()
+            self._cursor_conn = db_conn
+        return self._cursor
     
     def _persist_creatures(self, db_conn, simulation_id: int, creatures: List[Creature]) -> None:
         """
@@ -330,31 +669,10 @@ class Population:
             simulation_id: Simulation ID
             creatures: List of creatures to persist (must not already be persisted)
         """
-        import sqlite3
+        cursor = self._get_cursor(db_conn)
         
-        cursor = db_conn.cursor()
-        
-        # Create mapping of all creatures (in population and being persisted) to their IDs
-        creature_id_map = {}
-        for c in self.creatures:
-            if c.creature_id is not None:
-                creature_id_map[id(c)] = c.creature_id
-        
-        # First pass: Persist any parents that are in the population but not yet persisted
-        # and are needed by creatures being persisted
-        parents_to_persist = set()
-        for creature in creatures:
-            if creature.birth_cycle > 0:  # Offspring
-                # Find parents in population
-                for parent in self.creatures:
-                    if parent.creature_id is None and parent not in creatures:
-                        # Check if this parent matches (simplified: check by birth_cycle and simulation)
-                        # In a full implementation, we'd track parent references explicitly
-                        if (creature.parent1_id is None or creature.parent2_id is None):
-                            # We'll handle this by updating parent IDs after parents are persisted
-                            pass
-        
-        # Batch insert creatures
+        # Validate parent IDs and build creature rows before touching the database
+        creature_rows = []
         for creature in creatures:
             parent1_id = creature.parent1_id
             parent2_id = creature.parent2_id
@@ -376,14 +694,7 @@ class Population:
                         f"with NULL parent IDs. Parent IDs must be set before persistence."
                     )
             
-            cursor.execute("""
-                INSERT INTO creatures (
-                    simulation_id, birth_cycle, sex, parent1_id, parent2_id, breeder_id,
-                    produced_by_breeder_id, inbreeding_coefficient, lifespan, is_alive,
-                    conception_cycle, sexual_maturity_cycle, max_fertility_age_cycle,
-                    gestation_end_cycle, nursing_end_cycle, generation, is_homed
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
+            creature_rows.append((
                 simulation_id,
                 creature.birth_cycle,
                 creature.sex,
@@ -402,19 +713,23 @@ class Population:
                 creature.generation,
                 creature.is_homed
             ))
-            creature_id = cursor.lastrowid
-            creature.creature_id = creature_id
+        
+        if not creature_rows:
+            return
+        
+        with db_conn:
+            cursor.executemany(INSERT_CREATURE_SQL, creature_rows)
             
-            # Update creature_id_map for future parent lookups
-            creature_id_map[id(creature)] = creature_id
+            # AUTOINCREMENT assigns consecutive IDs to rows inserted in one
+            # transaction, so the batch ends at last_insert_rowid()
+            last_id = cursor.execute("SELECT last_insert_rowid()").fetchone()[0]
+            first_id = last_id - len(creature_rows) + 1
+            for creature_id, creature in enumerate(creatures, start=first_id):
+                creature.creature_id = creature_id
             
-            # Insert genotypes
-            for trait_id, genotype in enumerate(creature.genome):
-                if genotype is not None:
-                    cursor.execute("""
-                        INSERT INTO creature_genotypes (creature_id, trait_id, genotype)
-                        VALUES (?, ?, ?)
-                    """, (creature_id, trait_id, genotype))
-        
-        db_conn.commit()
-
+            cursor.executemany(INSERT_GENOTYPE_SQL, (
+                (creature.creature_id, trait_id, genotype)
+                for creature in creatures
+                for trait_id, genotype in enumerate(creature.genome)
+                if genotype is not None
+            ))
@@ -2,7 +2,8 @@
 
 from enum import Enum
 from typing import List, Dict, Optional, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+import numpy as np
 
 
 class TraitType(Enum):
@@ -14,6 +15,10 @@ class TraitType(Enum):
     POLYGENIC = "POLYGENIC"
 
 
+# Code for unset or undeclared genotypes in integer-encoded genomes
+UNKNOWN_GENOTYPE_CODE = -1
+
+
 @dataclass
 class Genotype:
     """Represents a genotype with its phenotype mapping."""
@@ -37,6 +42,13 @@ class Trait:
     name: str
     trait_type: TraitType
     genotypes: List[Genotype]
+    # Interning of distinct genotype strings to small integer codes (built in __post_init__)
+    genotype_codes: Dict[str, int] = field(init=False, repr=False, compare=False)
+    genotype_strings: List[str] = field(init=False, repr=False, compare=False)
+    # Sampling tables over the declared genotypes (built in __post_init__):
+    # normalized cumulative initial frequencies and each genotype's code
+    cumulative_freqs: np.ndarray = field(init=False, repr=False, compare=False)
+    declared_codes: np.ndarray = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate trait data."""
@@ -55,6 +67,34 @@ class Trait:
             for genotype in self.genotypes:
                 if genotype.sex is None:
                     raise ValueError(f"Trait {self.trait_id} (SEX_LINKED) genotype {genotype.genotype} must specify sex")
+        
+        # Intern genotype strings in declaration order; sex-linked traits may
+        # list the same string once per sex, which shares one code
+        self.genotype_codes = {}
+        for genotype in self.genotypes:
+            self.genotype_codes.setdefault(genotype.genotype, len(self.genotype_codes))
+        self.genotype_strings = list(self.genotype_codes)
+        
+        # Precompute the CDF once; sampling is then a searchsorted over it,
+        # drawing the same values as rng.choice(len(genotypes), p=freqs)
+        cdf = np.cumsum([g.initial_freq for g in self.genotypes])
+        self.cumulative_freqs = cdf / cdf[-1]
+        self.declared_codes = np.array(
+            [self.genotype_codes[g.genotype] for g in self.genotypes], dtype=np.int16
+        )
+    
+    def encode_genotype(self, genotype_str: Optional[str]) -> int:
+        """
+        Get the integer code for a genotype string.
+        
+        Args:
+            genotype_str: Genotype string, or None for an unset trait
+            
+        Returns:
+            Code in range(len(genotype_strings)), or UNKNOWN_GENOTYPE_CODE if the
+            genotype is unset or not declared for this trait
+        """
+        return self.genotype_codes.get(genotype_str, UNKNOWN_GENOTYPE_CODE)
     
     def get_phenotype(self, genotype_str: str, sex: Optional[str] = None) -> Optional[str]:
         """
@@ -87,10 +127,22 @@ class Trait:
         Returns:
             Randomly sampled Genotype based on frequencies
         """
-        probs = [g.initial_freq for g in self.genotypes]
-        idx = rng.choice(len(self.genotypes), p=probs)
+        idx = self.cumulative_freqs.searchsorted(rng.random(), side='right')
         return self.genotypes[idx]
     
+    def sample_codes(self, rng, n: int) -> np.ndarray:
+        """
+        Sample n genotype codes based on initial frequencies.
+        
+        Args:
+            rng: NumPy random number generator
+            n: Number of samples
+            
+        Returns:
+            int16 array of genotype codes (indices into genotype_strings)
+        """
+        return self.declared_codes[self.cumulative_freqs.searchsorted(rng.random(n), side='right')]
+    
     @classmethod
     def from_config(cls, config: Dict[str, Any]) -> 'Trait':
         """
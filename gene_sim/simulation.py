@@ -2,25 +2,29 @@
 
 import json
 import sqlite3
+from itertools import repeat
 from datetime import datetime
 from dataclasses import dataclass, asdict
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional, Union
 import numpy as np
 
-from .config import load_config, SimulationConfig
+from .config import load_config, config_from_dict, SimulationConfig
 from .exceptions import SimulationError, DatabaseError
 from .database import create_database, get_db_connection
 from .models.trait import Trait
 from .models.population import Population
-from .models.generation import Cycle
-from .models.breeder import (
-    RandomBreeder, InbreedingAvoidanceBreeder,
-    KennelClubBreeder, MillBreeder
-)
 from .models.creature import Creature
 
 
+# Statement text is kept constant so the connection's statement cache is hit
+UPDATE_PROGRESS_SQL = """
+    UPDATE simulations
+    SET generations_completed = ?, updated_at = ?
+    WHERE simulation_id = ?
+"""
+
+
 @dataclass
 class SimulationResults:
     """Results from a completed simulation."""
@@ -39,18 +43,23 @@ class SimulationResults:
 class Simulation:
     """Main simulation class that orchestrates the simulation lifecycle."""
     
-    def __init__(self, config_path: str, db_path: Optional[str] = None):
+    def __init__(self, config_path: Union[str, Dict[str, Any]], db_path: Optional[str] = None):
         """
         Initialize simulation from configuration file.
         
         Args:
-            config_path: Path to YAML/JSON configuration file
+            config_path: Path to YAML/JSON configuration file, or an already parsed
+                    configuration dictionary (normalized in place)
             db_path: Optional path for SQLite database. If None, database is created
-                    in the same directory as config_path with name 
-                    'simulation_YYYYMMDD_HHMMSS.db'
+                    in the same directory as config_path (the current directory for
+                    a dictionary) with name 'simulation_YYYYMMDD_HHMMSS.db'
         """
-        self.config_path = config_path
-        self.config = load_config(config_path)
+        if isinstance(config_path, dict):
+            self.config_path = None
+            self.config = config_from_dict(config_path)
+        else:
+            self.config_path = config_path
+            self.config = load_config(config_path)
         self.db_path = db_path or self._generate_db_path()
         self.db_conn: Optional[sqlite3.Connection] = None
         self.simulation_id: Optional[int] = None
@@ -58,14 +67,26 @@ class Simulation:
         self.population: Optional[Population] = None
         self.breeders: list = []
         self.traits: list = []
+        self.trait_by_id: dict = {}  # trait_id -> Trait, built with self.traits
+        # Progress is written to the simulations row every _progress_interval
+        # cycles (and on the last cycle) rather than every cycle
+        self._progress_interval = 100
+        self._last_progress_cycle = 0
+        self._cycles_completed = 0
+        # Running count of creatures persisted for this simulation (founders
+        # plus offspring), so monitor output needn't COUNT(*) the table
+        self._total_created = 0
+        # Per-target (trait_id, match table) pairs for penetration, built once
+        # from the fixed target list; None if a target names an unknown trait
+        self._penetration_tables: Optional[list] = []
     
     @classmethod
-    def from_config(cls, config_path: str, db_path: Optional[str] = None) -> 'Simulation':
+    def from_config(cls, config_path: Union[str, Dict[str, Any]], db_path: Optional[str] = None) -> 'Simulation':
         """
         Create a Simulation instance from a configuration file (convenience factory method).
         
         Args:
-            config_path: Path to YAML/JSON configuration file
+            config_path: Path to YAML/JSON configuration file, or a parsed configuration dictionary
             db_path: Optional path for SQLite database. If None, database is created
                     in the same directory as config_path with name 
                     'simulation_YYYYMMDD_HHMMSS.db'
@@ -77,7 +98,7 @@ class Simulation:
     
     def _generate_db_path(self) -> str:
         """Generate default database path based on config file location."""
-        config_dir = Path(self.config_path).parent
+        config_dir = Path(self.config_path).parent if self.config_path else Path.cwd()
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         db_name = f"simulation_{timestamp}.db"
         return str(config_dir / db_name)
@@ -101,15 +122,18 @@ class Simulation:
                 })
                 for tc in self.config.traits
             ]
+            self.trait_by_id = {t.trait_id: t for t in self.traits}
             
-            # Persist traits to database
-            self._persist_traits()
-            
-            # Create simulation record (must be done before creating breeders and founders)
-            self._create_simulation_record()
-            
-            # Create breeders (must be done before creating founders so founders can be assigned)
-            self._create_breeders()
+            # Persist traits, the simulation record and breeders in one transaction
+            with self.db_conn:
+                # Persist traits to database
+                self._persist_traits()
+                
+                # Create simulation record (must be done before creating breeders and founders)
+                self._create_simulation_record()
+                
+                # Create breeders (must be done before creating founders so founders can be assigned)
+                self._create_breeders()
             
             # Create initial population
             self.population = Population()
@@ -121,81 +145,83 @@ class Simulation:
             # Initialize cycle-based fields for founders
             self._initialize_founder_cycles()
             
+            # Specialize the penetration check on the fixed target phenotypes
+            self._compile_penetration_tables()
+            
         except Exception as e:
             raise SimulationError(f"Failed to initialize simulation: {e}") from e
     
     def _persist_traits(self) -> None:
-        """Persist trait definitions to database."""
+        """
+        Persist trait definitions to database.
+        
+        Rows are written with executemany; the caller owns the transaction.
+        """
         cursor = self.db_conn.cursor()
         
-        for trait in self.traits:
-            # Insert trait (ignore if already exists - allows multiple simulations in same DB)
-            cursor.execute("""
-                INSERT OR IGNORE INTO traits (trait_id, name, trait_type)
-                VALUES (?, ?, ?)
-            """, (trait.trait_id, trait.name, trait.trait_type.value))
-            
-            # Insert genotypes (ignore if already exists)
-            for genotype in trait.genotypes:
-                cursor.execute("""
-                    INSERT OR IGNORE INTO genotypes (
-                        trait_id, genotype, phenotype, sex, initial_freq
-                    ) VALUES (?, ?, ?, ?, ?)
-                """, (
-                    trait.trait_id,
-                    genotype.genotype,
-                    genotype.phenotype,
-                    genotype.sex,
-                    genotype.initial_freq
-                ))
+        # Insert traits (ignore if already exists - allows multiple simulations in same DB)
+        cursor.executemany("""
+            INSERT OR IGNORE INTO traits (trait_id, name, trait_type)
+            VALUES (?, ?, ?)
+        """, [(trait.trait_id, trait.name, trait.trait_type.value) for trait in self.traits])
         
-        self.db_conn.commit()
+        # Insert genotypes across all traits (ignore if already exists)
+        cursor.executemany("""
+            INSERT OR IGNORE INTO genotypes (
+                trait_id, genotype, phenotype, sex, initial_freq
+            ) VALUES (?, ?, ?, ?, ?)
+        """, [
+            (
+                trait.trait_id,
+                genotype.genotype,
+                genotype.phenotype,
+                genotype.sex,
+                genotype.initial_freq
+            )
+            for trait in self.traits
+            for genotype in trait.genotypes
+        ])
     
     def _create_breeders(self) -> None:
-        """Create breeder instances according to configuration and persist to database."""
-        breeders = []
-        breeder_index = 0
+        """
+        Create breeder instances according to configuration and persist to database.
         
-        cursor = self.db_conn.cursor()
+        All breeder rows are written with one executemany; the caller owns the
+        transaction.
+        """
+        from .models.breeder import (
+            RandomBreeder, InbreedingAvoidanceBreeder,
+            KennelClubBreeder, MillBreeder
+        )
+        
+        breeders = []
+        breeder_types = []
         
         # Random breeders
         for _ in range(self.config.breeders.random):
-            breeder = RandomBreeder(
+            breeders.append(RandomBreeder(
                 undesirable_phenotypes=self.config.undesirable_phenotypes,
                 undesirable_genotypes=self.config.undesirable_genotypes,
                 avoid_undesirable_phenotypes=self.config.breeders.avoid_undesirable_phenotypes,
                 avoid_undesirable_genotypes=self.config.breeders.avoid_undesirable_genotypes
-            )
-            breeders.append(breeder)
-            # Persist breeder to database
-            cursor.execute("""
-                INSERT INTO breeders (simulation_id, breeder_index, breeder_type)
-                VALUES (?, ?, 'random')
-            """, (self.simulation_id, breeder_index))
-            breeder.breeder_id = cursor.lastrowid
-            breeder_index += 1
+            ))
+            breeder_types.append('random')
         
         # Inbreeding avoidance breeders
         for _ in range(self.config.breeders.inbreeding_avoidance):
-            breeder = InbreedingAvoidanceBreeder(
+            breeders.append(InbreedingAvoidanceBreeder(
                 max_inbreeding_coefficient=0.25,
                 undesirable_phenotypes=self.config.undesirable_phenotypes,
                 undesirable_genotypes=self.config.undesirable_genotypes,
                 avoid_undesirable_phenotypes=self.config.breeders.avoid_undesirable_phenotypes,
                 avoid_undesirable_genotypes=self.config.breeders.avoid_undesirable_genotypes
-            )
-            breeders.append(breeder)
-            cursor.execute("""
-                INSERT INTO breeders (simulation_id, breeder_index, breeder_type)
-                VALUES (?, ?, 'inbreeding_avoidance')
-            """, (self.simulation_id, breeder_index))
-            breeder.breeder_id = cursor.lastrowid
-            breeder_index += 1
+            ))
+            breeder_types.append('inbreeding_avoidance')
         
         # Kennel club breeders
         kennel_config = self.config.breeders.kennel_club_config or {}
         for _ in range(self.config.breeders.kennel_club):
-            breeder = KennelClubBreeder(
+            breeders.append(KennelClubBreeder(
                 target_phenotypes=self.config.target_phenotypes,
                 max_inbreeding_coefficient=kennel_config.get('max_inbreeding_coefficient'),
                 required_phenotype_ranges=kennel_config.get('required_phenotype_ranges', []),
@@ -204,119 +230,124 @@ class Simulation:
                 genotype_preferences=self.config.genotype_preferences,
                 avoid_undesirable_phenotypes=self.config.breeders.avoid_undesirable_phenotypes,
                 avoid_undesirable_genotypes=self.config.breeders.avoid_undesirable_genotypes
-            )
-            breeders.append(breeder)
-            cursor.execute("""
-                INSERT INTO breeders (simulation_id, breeder_index, breeder_type)
-                VALUES (?, ?, 'kennel_club')
-            """, (self.simulation_id, breeder_index))
-            breeder.breeder_id = cursor.lastrowid
-            breeder_index += 1
+            ))
+            breeder_types.append('kennel_club')
         
         # Mill breeders
         for _ in range(self.config.breeders.mill):
-            breeder = MillBreeder(
+            breeders.append(MillBreeder(
                 target_phenotypes=self.config.target_phenotypes,
                 undesirable_phenotypes=self.config.undesirable_phenotypes,
                 undesirable_genotypes=self.config.undesirable_genotypes,
                 avoid_undesirable_phenotypes=self.config.breeders.avoid_undesirable_phenotypes,
                 avoid_undesirable_genotypes=self.config.breeders.avoid_undesirable_genotypes
-            )
-            breeders.append(breeder)
-            cursor.execute("""
-                INSERT INTO breeders (simulation_id, breeder_index, breeder_type)
-                VALUES (?, ?, 'mill')
-            """, (self.simulation_id, breeder_index))
-            breeder.breeder_id = cursor.lastrowid
-            breeder_index += 1
+            ))
+            breeder_types.append('mill')
+        
+        # Persist breeders in one batch, then backfill IDs in breeder_index order
+        cursor = self.db_conn.cursor()
+        cursor.executemany("""
+            INSERT INTO breeders (simulation_id, breeder_index, breeder_type)
+            VALUES (?, ?, ?)
+        """, [
+            (self.simulation_id, breeder_index, breeder_type)
+            for breeder_index, breeder_type in enumerate(breeder_types)
+        ])
+        cursor.execute("""
+            SELECT breeder_id FROM breeders
+            WHERE simulation_id = ?
+            ORDER BY breeder_index
+        """, (self.simulation_id,))
+        for breeder, (breeder_id,) in zip(breeders, cursor.fetchall()):
+            breeder.breeder_id = breeder_id
         
-        self.db_conn.commit()
         self.breeders = breeders
     
     def _initialize_founder_cycles(self) -> None:
         """Initialize cycle-based fields for founders."""
         archetype = self.config.creature_archetype
         
+        # Per-sex fertility caps are the same for every founder
+        cycles_per_year = 365.25 / archetype.menstrual_cycle_days
+        max_fertility_age_cycle = {
+            sex: int(years * cycles_per_year)
+            for sex, years in archetype.max_fertility_age_years.items()
+        }
+        
         for creature in self.population.creatures:
             if creature.birth_cycle == 0:  # Founders
                 # Founders are born at cycle 0, so they're already mature
-                # Calculate sexual maturity cycle (0 for founders, they start mature)
-                maturity_cycles = archetype.maturity_cycles
                 creature.sexual_maturity_cycle = 0  # Founders start mature
-                
-                # Calculate max_fertility_age_cycle
-                max_fertility_age_years = archetype.max_fertility_age_years[creature.sex]
-                cycles_per_year = 365.25 / archetype.menstrual_cycle_days
-                creature.max_fertility_age_cycle = int(max_fertility_age_years * cycles_per_year)
+                creature.max_fertility_age_cycle = max_fertility_age_cycle[creature.sex]
                 
                 # Founders have no conception cycle
                 creature.conception_cycle = None
                 creature.generation = 0  # Founders are generation 0
     
     def _create_initial_population(self) -> None:
-        """Create initial population of founders."""
-        founders = []
+        """
+        Create initial population of founders.
+        
+        Each founder attribute is drawn for the whole population with one
+        batched RNG call (sex, one genotype column per trait, lifespan, age);
+        Python-level work is limited to assembling the Creature objects.
+        """
+        n = self.config.initial_population_size
+        archetype = self.config.creature_archetype
         
         # Determine max trait_id for genome size
         max_trait_id = max(t.trait_id for t in self.traits) if self.traits else 0
         
-        for i in range(self.config.initial_population_size):
-            # Determine sex based on initial_sex_ratio
-            sex_prob = self.config.initial_sex_ratio['female']
-            sex = 'female' if self.rng.random() < sex_prob else 'male'
-            
-            # Create genome by sampling genotypes
-            genome: list = [None] * (max_trait_id + 1)
-            for trait in self.traits:
-                genotype = trait.get_genotype_by_frequency(self.rng)
-                genome[trait.trait_id] = genotype.genotype
-            
-            # Sample lifespan (in cycles)
-            lifespan = self.rng.integers(
-                self.config.creature_archetype.lifespan_cycles_min,
-                self.config.creature_archetype.lifespan_cycles_max + 1
-            )
-            
-            # Give founders a random age between 1 cycle and their lifespan
-            # This ensures founding population has age diversity
-            current_age_cycles = self.rng.integers(1, lifespan + 1)
-            birth_cycle = -current_age_cycles  # Negative birth_cycle means born before simulation start
-            
-            # Assign founder to a breeder (distribute evenly, respecting capacity)
-            # Find a breeder with capacity
+        # Determine sex based on initial_sex_ratio
+        sex_prob = self.config.initial_sex_ratio['female']
+        is_female = (self.rng.random(n) < sex_prob).tolist()
+        
+        # Sample one genotype column per trait based on initial frequencies;
+        # trait IDs without a trait keep a column of None
+        genotype_columns = [repeat(None, n) for _ in range(max_trait_id + 1)]
+        for trait in self.traits:
+            codes = trait.sample_codes(self.rng, n)
+            # Decode each code once rather than once per founder
+            strings = trait.genotype_strings
+            genotype_columns[trait.trait_id] = [strings[c] for c in codes.tolist()]
+        # Transpose the columns into one genome row per founder in a single pass
+        genomes = zip(*genotype_columns)
+        
+        # Sample lifespans (in cycles), then give founders a random age between
+        # 1 cycle and their lifespan so the founding population has age diversity
+        lifespans = self.rng.integers(
+            archetype.lifespan_cycles_min,
+            archetype.lifespan_cycles_max + 1,
+            size=n
+        )
+        ages = self.rng.integers(1, lifespans + 1)
+        
+        # Assign founders to breeders in order, filling each to max_creatures.
+        # Counts only grow, so the first breeder with capacity only moves forward.
+        breeder_counts = [0] * len(self.breeders)
+        next_breeder = 0
+        
+        founders = []
+        for i, genome, lifespan, age in zip(range(n), genomes, lifespans.tolist(), ages.tolist()):
             breeder_id = None
+            is_homed = False
             if self.breeders:
-                # Count how many founders each breeder has been assigned so far
-                breeder_counts = {}
-                for b in self.breeders:
-                    breeder_counts[b.breeder_id] = 0
-                
-                # Count already assigned founders
-                for existing_founder in founders:
-                    if existing_founder.breeder_id in breeder_counts:
-                        breeder_counts[existing_founder.breeder_id] += 1
-                
-                # Find a breeder with capacity (under max_creatures)
-                for breeder in self.breeders:
-                    if breeder_counts[breeder.breeder_id] < breeder.max_creatures:
-                        breeder_id = breeder.breeder_id
-                        break
-                
-                # If all breeders are at capacity, mark founder as homed (overflow)
-                if breeder_id is None and self.breeders:
-                    # Assign to first breeder but mark as homed
+                while (next_breeder < len(self.breeders)
+                       and breeder_counts[next_breeder] >= self.breeders[next_breeder].max_creatures):
+                    next_breeder += 1
+                if next_breeder < len(self.breeders):
+                    breeder_id = self.breeders[next_breeder].breeder_id
+                    breeder_counts[next_breeder] += 1
+                else:
+                    # All breeders are at capacity: assign to first breeder but mark as homed (overflow)
                     breeder_id = self.breeders[0].breeder_id
                     is_homed = True
-                else:
-                    is_homed = False
-            else:
-                is_homed = False
             
             creature = Creature(
                 simulation_id=0,  # Will be updated after simulation record created
-                birth_cycle=birth_cycle,
-                sex=sex,
-                genome=genome,
+                birth_cycle=-age,  # Negative birth_cycle means born before simulation start
+                sex='female' if is_female[i] else 'male',
+                genome=list(genome),
                 parent1_id=None,
                 parent2_id=None,
                 breeder_id=breeder_id,
@@ -359,18 +390,17 @@ class Simulation:
         This method persists all founders right after they are created and before any
         breeding occurs.
         """
-        # Get all founders (generation == 0)
-        founders = [c for c in self.population.creatures if c.generation == 0]
+        # Only founders exist at this point, so the whole population is persisted
+        founders = list(self.population.creatures)
         
         # Update simulation_id for all founders
         for creature in founders:
             creature.simulation_id = self.simulation_id
         
         if founders:
-            # Persist founders to database immediately
+            # Persist founders to database immediately (commits its own batch)
             self.population._persist_creatures(self.db_conn, self.simulation_id, founders)
-        
-        self.db_conn.commit()
+            self._total_created += len(founders)
     
     def run(self) -> SimulationResults:
         """
@@ -390,6 +420,7 @@ class Simulation:
                 self.initialize()
             
             # Execute cycles
+            from .models.generation import Cycle
             cycle = Cycle(0)
             
             cycles_to_run = self.config.cycles
@@ -407,8 +438,13 @@ class Simulation:
                     config=self.config
                 )
                 
-                # Update simulation progress
-                self._update_simulation_progress(cycle_num + 1, len(self.population.creatures))
+                self._total_created += stats.created
+                
+                # Update simulation progress at checkpoints only
+                self._cycles_completed = cycle_num + 1
+                if (self._cycles_completed - self._last_progress_cycle >= self._progress_interval
+                        or self._cycles_completed == cycles_to_run):
+                    self._update_simulation_progress(self._cycles_completed, len(self.population.creatures))
                 
                 # Monitor mode output
                 if self.config.mode == 'monitor':
@@ -445,9 +481,9 @@ class Simulation:
                     cursor = self.db_conn.cursor()
                     cursor.execute("""
                         UPDATE simulations
-                        SET status = 'failed', end_time = ?
+                        SET status = 'failed', end_time = ?, generations_completed = ?
                         WHERE simulation_id = ?
-                    """, (datetime.now().isoformat(), self.simulation_id))
+                    """, (datetime.now().isoformat(), self._cycles_completed, self.simulation_id))
                     self.db_conn.commit()
                 except:
                     pass
@@ -459,63 +495,69 @@ class Simulation:
                 self.db_conn.close()
     
     def _update_simulation_progress(self, generations_completed: int, population_size: int) -> None:
-        """Update simulation progress in database."""
-        cursor = self.db_conn.cursor()
-        cursor.execute("""
-            UPDATE simulations
-            SET generations_completed = ?, updated_at = ?
-            WHERE simulation_id = ?
-        """, (generations_completed, datetime.now().isoformat(), self.simulation_id))
-        self.db_conn.commit()
+        """
+        Update simulation progress in database.
+        
+        Does not commit: the update rides along with the next cycle's statistics
+        transaction or with _finalize_simulation's commit.
+        """
+        self.db_conn.execute(
+            UPDATE_PROGRESS_SQL,
+            (generations_completed, datetime.now().isoformat(), self.simulation_id)
+        )
+        self._last_progress_cycle = generations_completed
+    
+    def _compile_penetration_tables(self) -> None:
+        """
+        Precompute the match tables for the configured target phenotypes.
+        
+        The target list is fixed for the whole run, so each target is resolved
+        to its trait once and turned into a (sex, genotype code) -> matches
+        table. The extra trailing column is hit by UNKNOWN_GENOTYPE_CODE. A
+        target on an unknown trait can never match, which is recorded as None.
+        """
+        tables = []
+        for target in self.config.target_phenotypes or []:
+            trait = self.trait_by_id.get(target['trait_id'])
+            if trait is None:
+                self._penetration_tables = None
+                return
+            table = np.array([
+                [trait.get_phenotype(g, sex_name) == target['phenotype'] for g in trait.genotype_strings] + [False]
+                for sex_name in ('female', 'male', None)  # SEX_FEMALE, SEX_MALE, SEX_OTHER
+            ])
+            tables.append((trait.trait_id, table))
+        self._penetration_tables = tables
     
     def _calculate_desired_trait_penetration(self) -> float:
         """Calculate percentage of population with desired (target) phenotypes."""
-        if not self.config.target_phenotypes or not self.population.creatures:
+        tables = self._penetration_tables
+        if not self.config.target_phenotypes or not self.population.creatures or tables is None:
             return 0.0
         
-        matching_count = 0
-        for creature in self.population.creatures:
-            matches = True
-            for target in self.config.target_phenotypes:
-                trait_id = target['trait_id']
-                target_phenotype = target['phenotype']
-                
-                if trait_id >= len(creature.genome) or creature.genome[trait_id] is None:
-                    matches = False
-                    break
-                
-                # Find trait to get phenotype mapping
-                trait = next((t for t in self.traits if t.trait_id == trait_id), None)
-                if trait is None:
-                    matches = False
-                    break
-                
-                actual_phenotype = trait.get_phenotype(creature.genome[trait_id], creature.sex)
-                if actual_phenotype != target_phenotype:
-                    matches = False
-                    break
-            
-            if matches:
-                matching_count += 1
+        # Vectorized match over the encoded genome matrix, gathering each
+        # target's precompiled table per creature. Only creatures that matched
+        # every earlier target are gathered, so selective targets shrink the
+        # work for the rest (like a per-row break).
+        codes = self.population.genome_matrix(self.traits)
+        sex = self.population.sex_index()
+        candidates = np.arange(len(sex))
+        for trait_id, table in tables:
+            candidates = candidates[table[sex[candidates], codes[candidates, trait_id]]]
+            if candidates.size == 0:
+                break
         
-        return (matching_count / len(self.population.creatures)) * 100.0 if self.population.creatures else 0.0
+        return candidates.size / len(sex) * 100.0
     
     def _print_monitor_output(self, cycle_num: int, stats: 'CycleStats') -> None:
         """Print monitor mode output for current cycle."""
         penetration = self._calculate_desired_trait_penetration()
         
-        # Get total creatures created from database for this simulation
-        cursor = self.db_conn.cursor()
-        cursor.execute("""
-            SELECT COUNT(*) FROM creatures WHERE simulation_id = ?
-        """, (self.simulation_id,))
-        total_created = cursor.fetchone()[0]
-        
         breeding_pool = stats.eligible_males + stats.eligible_females
         
         # Print progress line with newline to persist output
         print(f"Cycle {cycle_num:5d}/{self.config.cycles-1:5d} | "
-              f"Created: {total_created:5d} | "
+              f"Created: {self._total_created:5d} | "
               f"Living: {stats.population_size:5d} | "
               f"Pool: {breeding_pool:4d} | "
               f"Desired: {penetration:5.1f}% | "
@@ -13,10 +13,22 @@ Configuration:
 - 12 undesirable traits (3 recessive, 6 dominant) with various frequencies
 """
 
+import os
 import subprocess
 import sys
 from pathlib import Path
 
+import yaml
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from gene_sim.config import load_config_dict
+
 
 def run_batch(config_path, output_dir, num_runs, kennels, mills, base_seed):
     """
@@ -30,33 +42,33 @@ def run_batch(config_path, output_dir, num_runs, kennels, mills, base_seed):
         mills: Number of mill breeders
         base_seed: Starting seed value
     """
-    print(f"\n{'='*80}")
-    print(f"BATCH: {output_dir}")
-    print(f"{'='*80}")
-    print(f"Configuration:")
-    print(f"  - Kennel Club Breeders: {kennels}")
-    print(f"  - Mill Breeders: {mills}")
-    print(f"  - Runs: {num_runs}")
-    print(f"  - Base Seed: {base_seed}")
-    print(f"  - Output: {output_dir}")
-    print(f"{'='*80}\n")
+    # Emit each banner with a single write rather than one per line
+    print("\n".join([
+        f"\n{'='*80}",
+        f"BATCH: {output_dir}",
+        f"{'='*80}",
+        f"Configuration:",
+        f"  - Kennel Club Breeders: {kennels}",
+        f"  - Mill Breeders: {mills}",
+        f"  - Runs: {num_runs}",
+        f"  - Base Seed: {base_seed}",
+        f"  - Output: {output_dir}",
+        f"{'='*80}\n",
+    ]))
     
     # Modify config to set breeder counts
-    import yaml
-    
-    with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
+    config = load_config_dict(config_path)
     
     # Update breeder configuration
     config['breeders']['kennel_club'] = kennels
     config['breeders']['mill'] = mills
     
     # Save modified config
-    modified_config_path = Path(output_dir) / "batch_config.yaml"
-    Path(output_dir).mkdir(exist_ok=True)
+    os.makedirs(output_dir, exist_ok=True)
+    modified_config_path = os.path.join(output_dir, "batch_config.yaml")
     
     with open(modified_config_path, 'w') as f:
-        yaml.dump(config, f)
+        yaml.dump(config, f, Dumper=SafeDumper, sort_keys=False, default_flow_style=False)
     
     # Run batch_run.py with the modified config
     cmd = [
@@ -124,25 +136,26 @@ def main():
     )
     
     # Summary
-    print("\n" + "="*80)
-    print("RUN 5 COMPLETE")
-    print("="*80)
-    
     if success_a and success_b:
-        print("\n✓ All batches completed successfully!")
+        status = "\n✓ All batches completed successfully!"
     else:
-        print("\n⚠️  Some batches had issues. Check output above.")
-    
-    print("\nResults:")
-    print("  - Batch A (Kennel-dominated): run5a_kennels/")
-    print("  - Batch B (Mill-dominated):   run5b_mills/")
-    print("\nNext steps:")
-    print("  1. Analyze individual batches:")
-    print("     cd ..")
-    print("     python batch_analysis.py run5/run5a_kennels")
-    print("     python batch_analysis.py run5/run5b_mills")
-    print("  2. Compare kennel vs mill results across batches")
-    print()
+        status = "\n⚠️  Some batches had issues. Check output above."
+    print("\n".join([
+        "\n" + "="*80,
+        "RUN 5 COMPLETE",
+        "="*80,
+        status,
+        "\nResults:",
+        "  - Batch A (Kennel-dominated): run5a_kennels/",
+        "  - Batch B (Mill-dominated):   run5b_mills/",
+        "\nNext steps:",
+        "  1. Analyze individual batches:",
+        "     cd ..",
+        "     python batch_analysis.py run5/run5a_kennels",
+        "     python batch_analysis.py run5/run5b_mills",
+        "  2. Compare kennel vs mill results across batches",
+        "",
+    ]))
 
 
 if __name__ == "__main__":
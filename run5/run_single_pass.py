@@ -6,18 +6,17 @@ Runs a single simulation with a fixed seed for quick testing.
 
 import sys
 from pathlib import Path
-import yaml
 from datetime import datetime
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from gene_sim.config import load_config_json_cached
 from gene_sim.simulation import Simulation
-from gene_sim.config import load_config
 
 
-def run_single_simulation(config_path: Path, run_name: str, seed: int = 42):
-    """Run a single simulation with monitoring enabled."""
+def run_single_simulation(config_path: Path, run_name: str, output_dir: Path, seed: int = 42):
+    """Run a single simulation with monitoring enabled; output_dir must exist."""
     
     print(f"\n{'='*80}")
     print(f"Running: {run_name}")
@@ -26,33 +25,21 @@ def run_single_simulation(config_path: Path, run_name: str, seed: int = 42):
     print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"{'='*80}\n")
     
-    # Load config to modify seed and mode
-    config = load_config(str(config_path))
-    
-    # Override seed and ensure monitoring is on
-    config.seed = seed
-    config.mode = 'monitor'
+    # Load config and override seed and mode in place; the dict is freshly
+    # loaded for this run, so no copy is needed
+    config = load_config_json_cached(config_path)
+    config['seed'] = seed
+    config['mode'] = 'monitor'
     
     # Create output filename
-    output_dir = config_path.parent / "single_pass_results"
-    output_dir.mkdir(exist_ok=True)
-    
     db_filename = f"{run_name}_seed_{seed}.db"
     db_path = output_dir / db_filename
     
-    # Save modified config to temporary file
-    temp_config_dict = config.raw_config.copy()
-    temp_config_dict['seed'] = seed
-    temp_config_dict['mode'] = 'monitor'
-    
-    temp_config_path = output_dir / f"temp_config_{run_name}.yaml"
-    with open(temp_config_path, 'w') as f:
-        yaml.dump(temp_config_dict, f, default_flow_style=False)
-    
-    # Run simulation with temp config
+    # Run simulation with the modified config
     print(f"Output database: {db_path}\n")
     
-    sim = Simulation(str(temp_config_path), str(db_path))
+    # Simulation validates and normalizes the dict (same steps as load_config)
+    sim = Simulation(config, str(db_path))
     sim.run()
     
     print(f"\n{'='*80}")
@@ -79,8 +66,12 @@ def main():
     print(f"\nConfiguration: 200 creatures, 6 years, 20 breeders (19 kennels, 1 mill)")
     print(f"Config file: {config_path}")
     
+    # Create the output directory once, up front
+    output_dir = run5_dir / "single_pass_results"
+    output_dir.mkdir(parents=True, exist_ok=True)
+    
     try:
-        db_path = run_single_simulation(config_path, "run5_single_pass", seed=7000)
+        db_path = run_single_simulation(config_path, "run5_single_pass", output_dir, seed=7000)
         
         print("\n" + "="*80)
         print("EXECUTION COMPLETE")
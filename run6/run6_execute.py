@@ -13,14 +13,56 @@ Configuration:
 - 12 undesirable traits (3 recessive, 6 dominant) with various frequencies
 """
 
-import subprocess
+import importlib
+import multiprocessing
+import os
 import sys
 from pathlib import Path
 
+import yaml
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper
 
-def run_batch(config_path, output_dir, num_runs, kennels, mills, base_seed):
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from gene_sim.config import load_config_dict
+
+
+def _load_batch_run():
+    """Import scripts/batch_run.py as a module (scripts/ is not a package)."""
+    # Put scripts/ on sys.path, rather than loading the file by location, so
+    # batch_run's worker processes can import it to unpickle their tasks
+    scripts_dir = str(Path(__file__).resolve().parent.parent / "scripts")
+    if scripts_dir not in sys.path:
+        sys.path.insert(0, scripts_dir)
+    return importlib.import_module("batch_run")
+
+
+# Loaded once here; batch processes inherit it instead of each starting a
+# fresh interpreter and re-importing gene_sim
+batch_run = _load_batch_run()
+
+
+# Batches are independent and all run at the same time, each on an equal
+# share of the CPUs
+BATCHES = [
+    # Batch A: Kennel-dominated (19 kennels, 1 mill = 95% kennels)
+    dict(output_dir="run6a_kennels", num_runs=15, kennels=19, mills=1, base_seed=9000),
+    # Batch B: Mill-dominated (1 kennel, 19 mills = 95% mills)
+    dict(output_dir="run6b_mills", num_runs=15, kennels=1, mills=19, base_seed=10000),
+]
+
+
+def run_batch(config_path, output_dir, num_runs, kennels, mills, base_seed, workers=1):
     """
-    Execute a batch of simulations with specified breeder configuration.
+    Start a batch of simulations with specified breeder configuration.
+    
+    The batch runs batch_run.run_batch_simulations in a child process, so
+    several batches can run at once; its output goes to batch_log.txt in the
+    output directory.
     
     Args:
         config_path: Path to configuration file
@@ -29,50 +71,88 @@ def run_batch(config_path, output_dir, num_runs, kennels, mills, base_seed):
         kennels: Number of kennel club breeders
         mills: Number of mill breeders
         base_seed: Starting seed value
+        workers: Number of simulations the batch runs in parallel
+        
+    Returns:
+        multiprocessing.Process running the batch (see wait_batch)
     """
-    print(f"\n{'='*80}")
-    print(f"BATCH: {output_dir}")
-    print(f"{'='*80}")
-    print(f"Configuration:")
-    print(f"  - Kennel Club Breeders: {kennels}")
-    print(f"  - Mill Breeders: {mills}")
-    print(f"  - Runs: {num_runs}")
-    print(f"  - Base Seed: {base_seed}")
-    print(f"  - Output: {output_dir}")
-    print(f"{'='*80}\n")
+    # Emit each banner with a single write rather than one per line
+    print("\n".join([
+        f"\n{'='*80}",
+        f"BATCH: {output_dir}",
+        f"{'='*80}",
+        f"Configuration:",
+        f"  - Kennel Club Breeders: {kennels}",
+        f"  - Mill Breeders: {mills}",
+        f"  - Runs: {num_runs}",
+        f"  - Base Seed: {base_seed}",
+        f"  - Output: {output_dir}",
+        f"{'='*80}\n",
+    ]))
     
     # Modify config to set breeder counts
-    import yaml
-    
-    with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
+    config = load_config_dict(config_path)
     
     # Update breeder configuration
     config['breeders']['kennel_club'] = kennels
     config['breeders']['mill'] = mills
     
     # Save modified config
-    modified_config_path = Path(output_dir) / "batch_config.yaml"
-    Path(output_dir).mkdir(exist_ok=True)
+    os.makedirs(output_dir, exist_ok=True)
+    modified_config_path = os.path.join(output_dir, "batch_config.yaml")
     
     with open(modified_config_path, 'w') as f:
-        yaml.dump(config, f)
-    
-    # Run batch_run.py with the modified config
-    cmd = [
-        sys.executable,
-        "../scripts/batch_run.py",
-        "-c", str(modified_config_path),
-        "-n", str(num_runs),
-        "-s", str(base_seed),
-        "-o", output_dir
-    ]
+        yaml.dump(config, f, Dumper=SafeDumper, sort_keys=False, default_flow_style=False)
+    
+    log_path = os.path.join(output_dir, "batch_log.txt")
+    print(f"Log: {log_path}\n")
+    # Flush so the batch process does not inherit (and repeat) buffered output
+    sys.stdout.flush()
+    process = multiprocessing.Process(
+        target=_run_batch_logged,
+        args=(modified_config_path, num_runs, base_seed, output_dir, workers, log_path),
+        name=output_dir
+    )
+    process.start()
+    return process
+
+
+def _run_batch_logged(config_path, num_runs, base_seed, output_dir, workers, log_path):
+    """Process target: run one batch with stdout/stderr sent to its log file."""
+    with open(log_path, 'w') as log_file:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        # Redirect the file descriptors, not just sys.stdout, so batch_run's
+        # worker processes write to the log as well
+        os.dup2(log_file.fileno(), 1)
+        os.dup2(log_file.fileno(), 2)
+        batch_run.run_batch_simulations(
+            config_path=config_path,
+            num_runs=num_runs,
+            base_seed=base_seed,
+            output_dir=output_dir,
+            workers=workers
+        )
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+
+def wait_batch(process, output_dir):
+    """
+    Wait for a batch started by run_batch to finish.
     
-    print(f"Executing: {' '.join(cmd)}\n")
-    result = subprocess.run(cmd)
+    Args:
+        process: Process returned by run_batch
+        output_dir: Output directory of the batch (for messages)
+        
+    Returns:
+        True if the batch exited successfully
+    """
+    process.join()
+    returncode = process.exitcode
     
-    if result.returncode != 0:
-        print(f"\n⚠️  WARNING: Batch exited with code {result.returncode}")
+    if returncode != 0:
+        print(f"\n⚠️  WARNING: Batch {output_dir} exited with code {returncode}")
         return False
     
     print(f"\n✓ Batch complete: {output_dir}\n")
@@ -93,57 +173,47 @@ def main():
     print("\nThis will execute 30 total simulations (2 batches of 15 runs each)")
     print("Configuration: 200 creatures, 20 years, 20 total breeders")
     print("(Same as Run 4 with different random seeds for validation)")
-    print("\nPress Ctrl+C to cancel, or Enter to continue...")
-    
-    try:
-        input()
-    except KeyboardInterrupt:
-        print("\n\nCancelled by user.")
-        sys.exit(0)
-    
-    # Batch A: Kennel-dominated (19 kennels, 1 mill = 95% kennels)
-    success_a = run_batch(
-        config_path=config_path,
-        output_dir="run6a_kennels",
-        num_runs=15,
-        kennels=19,
-        mills=1,
-        base_seed=9000
-    )
     
-    if not success_a:
-        print("\n⚠️  Batch A had issues, but continuing to Batch B...")
-    
-    # Batch B: Mill-dominated (1 kennel, 19 mills = 95% mills)
-    success_b = run_batch(
-        config_path=config_path,
-        output_dir="run6b_mills",
-        num_runs=15,
-        kennels=1,
-        mills=19,
-        base_seed=10000
-    )
+    # Only prompt a human at a terminal; scripted runs (no TTY, or
+    # RUN_NONINTERACTIVE set) start immediately
+    if sys.stdin.isatty() and not os.environ.get('RUN_NONINTERACTIVE'):
+        print("\nPress Ctrl+C to cancel, or Enter to continue...")
+        try:
+            input()
+        except KeyboardInterrupt:
+            print("\n\nCancelled by user.")
+            sys.exit(0)
+    
+    # Start every batch, then wait for all of them. Batch output goes to log
+    # files, so waiting on the handles in order never blocks a running batch.
+    workers = max(1, (os.cpu_count() or 2) // len(BATCHES))
+    processes = [
+        (batch['output_dir'], run_batch(config_path=config_path, workers=workers, **batch))
+        for batch in BATCHES
+    ]
+    successes = [wait_batch(process, output_dir) for output_dir, process in processes]
     
     # Summary
-    print("\n" + "="*80)
-    print("RUN 6 COMPLETE")
-    print("="*80)
-    
-    if success_a and success_b:
-        print("\n✓ All batches completed successfully!")
+    if all(successes):
+        status = "\n✓ All batches completed successfully!"
     else:
-        print("\n⚠️  Some batches had issues. Check output above.")
-    
-    print("\nResults:")
-    print("  - Batch A (Kennel-dominated): run6a_kennels/")
-    print("  - Batch B (Mill-dominated):   run6b_mills/")
-    print("\nNext steps:")
-    print("  1. Analyze individual batches:")
-    print("     cd ..")
-    print("     python scripts/batch_analysis.py run6/run6a_kennels")
-    print("     python scripts/batch_analysis.py run6/run6b_mills")
-    print("  2. Compare kennel vs mill results across batches")
-    print()
+        status = "\n⚠️  Some batches had issues. Check output above."
+    print("\n".join([
+        "\n" + "="*80,
+        "RUN 6 COMPLETE",
+        "="*80,
+        status,
+        "\nResults:",
+        "  - Batch A (Kennel-dominated): run6a_kennels/",
+        "  - Batch B (Mill-dominated):   run6b_mills/",
+        "\nNext steps:",
+        "  1. Analyze individual batches:",
+        "     cd ..",
+        "     python scripts/batch_analysis.py run6/run6a_kennels",
+        "     python scripts/batch_analysis.py run6/run6b_mills",
+        "  2. Compare kennel vs mill results across batches",
+        "",
+    ]))
 
 
 if __name__ == "__main__":
@@ -3,30 +3,25 @@
 
 import sys
 from pathlib import Path
-import yaml
 
 # Add parent directory to path
 parent_dir = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(parent_dir))
 
+from gene_sim.config import load_config_json_cached
 from gene_sim.simulation import Simulation
 
 
-def run_single_simulation(config_path, run_name, seed, script_dir):
-    """Run one simulation for testing."""
+def run_single_simulation(config_path, run_name, seed, output_dir):
+    """Run one simulation for testing; output_dir must exist."""
     
     # Load config
-    with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
+    config = load_config_json_cached(config_path)
     
     # Override seed and ensure monitor mode
     config['seed'] = seed
     config['mode'] = 'monitor'
     
-    # Create output directory in script directory
-    output_dir = script_dir / "single_pass_results"
-    output_dir.mkdir(exist_ok=True)
-    
     # Create database path
     db_path = output_dir / f"{run_name}_seed{seed}.db"
     
@@ -63,7 +58,11 @@ def main():
     seed = 9000
     run_name = "run6_test"
     
-    db_path = run_single_simulation(config_path, run_name, seed, script_dir)
+    # Create output directory in script directory, once, up front
+    output_dir = script_dir / "single_pass_results"
+    output_dir.mkdir(parents=True, exist_ok=True)
+    
+    db_path = run_single_simulation(config_path, run_name, seed, output_dir)
     
     print("\n" + "="*80)
     print("SINGLE-PASS TEST COMPLETE")
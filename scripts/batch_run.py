@@ -6,6 +6,8 @@ to enable statistical analysis of results.
 """
 
 import argparse
+import copy
+import multiprocessing
 import sys
 import time
 import yaml
@@ -13,13 +15,107 @@ import json
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict
-import tempfile
 import sqlite3
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from gene_sim.simulation import Simulation
+from gene_sim.config import save_config
+
+
+def _run_one_seed(args) -> Dict:
+    """
+    Run one simulation of a batch and collect its summary statistics.
+    
+    Args:
+        args: (run_num, run_seed, base_config, output_dir) tuple
+        
+    Returns:
+        Result dictionary for the run ('error' is set if the run failed)
+    """
+    run_num, run_seed, base_config, output_dir = args
+    
+    # Modify config for this run; Simulation normalizes the dict it is given
+    # in place, so it gets its own copy rather than sharing base_config's
+    run_config = copy.deepcopy(base_config)
+    run_config['seed'] = run_seed
+    run_config['mode'] = 'quiet'  # Suppress output during batch
+    
+    # Create database path
+    db_path = Path(output_dir) / f"simulation_run_{run_num:03d}_seed_{run_seed}.db"
+    
+    try:
+        # Run simulation
+        run_start = time.perf_counter()
+        sim = Simulation(run_config, db_path=str(db_path))
+        sim.run()
+        run_end = time.perf_counter()
+        run_time = run_end - run_start
+        
+        # Collect statistics
+        conn = sqlite3.connect(str(db_path))
+        cursor = conn.cursor()
+        
+        cursor.execute("SELECT MAX(generation) FROM generation_stats")
+        final_generation = cursor.fetchone()[0]
+        
+        cursor.execute("SELECT COUNT(*) FROM creatures")
+        total_creatures = cursor.fetchone()[0]
+        
+        cursor.execute("""
+            SELECT population_size 
+            FROM generation_stats 
+            WHERE generation = ?
+        """, (final_generation,))
+        final_pop_size = cursor.fetchone()[0]
+        
+        conn.close()
+        
+        # Record results
+        return {
+            'run_number': run_num,
+            'seed': run_seed,
+            'runtime_seconds': run_time,
+            'final_generation': final_generation,
+            'final_population_size': final_pop_size,
+            'total_creatures_created': total_creatures,
+            'database_path': str(db_path)
+        }
+        
+    except Exception as e:
+        return {
+            'run_number': run_num,
+            'seed': run_seed,
+            'error': str(e)
+        }
+
+
+def _worker_context():
+    """
+    Get the multiprocessing context for simulation worker pools.
+    
+    Uses a fork server that has already imported gene_sim where available, so
+    each worker forks from it instead of paying a new interpreter start and
+    the gene_sim/NumPy imports; the server itself starts clean, so workers
+    still inherit no database handles. Falls back to spawn elsewhere.
+    
+    Returns:
+        multiprocessing context
+    """
+    if 'forkserver' not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('spawn')
+    context = multiprocessing.get_context('forkserver')
+    context.set_forkserver_preload(['gene_sim.simulation'])
+    return context
+
+
+def _format_run_result(result: Dict) -> str:
+    """Format one run's result as a progress line."""
+    if 'error' in result:
+        return f"FAILED: {result['error']}"
+    return (f"{result['runtime_seconds']:.1f}s | Gen: {result['final_generation']} | "
+            f"Pop: {result['final_population_size']:,} | Total: {result['total_creatures_created']:,}")
 
 
 def run_batch_simulations(
@@ -29,7 +125,8 @@ def run_batch_simulations(
     output_dir: str = None,
     pop_size: int = None,
     years: int = None,
-    save_config_copy: bool = True
+    save_config_copy: bool = True,
+    workers: int = 1
 ) -> List[Dict]:
     """
     Run multiple simulations with different seeds.
@@ -42,6 +139,7 @@ def run_batch_simulations(
         pop_size: Override population size from config (optional)
         years: Override years from config (optional)
         save_config_copy: Save a copy of the config used for this batch (default: True)
+        workers: Number of worker processes running simulations in parallel (default: 1)
         
     Returns:
         List of result dictionaries with metadata for each run
@@ -71,8 +169,7 @@ def run_batch_simulations(
     # Save a copy of the config used for this batch
     if save_config_copy:
         config_copy_path = output_path / "batch_config.yaml"
-        with open(config_copy_path, 'w') as f:
-            yaml.dump(base_config, f)
+        save_config(base_config, config_copy_path)
     
     # Results tracking
     results = []
@@ -87,83 +184,32 @@ def run_batch_simulations(
     print(f"Number of runs: {num_runs}")
     print(f"Base seed: {base_seed}")
     print(f"Output directory: {output_dir}")
+    print(f"Workers: {workers}")
     print("="*80)
     print()
     
-    for run_num in range(1, num_runs + 1):
-        run_seed = base_seed + run_num - 1
-        
-        print(f"Run {run_num}/{num_runs} (seed={run_seed})...", end=" ", flush=True)
-        
-        # Modify config for this run
-        run_config = base_config.copy()
-        run_config['seed'] = run_seed
-        run_config['mode'] = 'quiet'  # Suppress output during batch
-        
-        # Save modified config
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(run_config, f)
-            tmp_config_path = f.name
-        
-        # Create database path
-        db_path = output_path / f"simulation_run_{run_num:03d}_seed_{run_seed}.db"
-        
-        try:
-            # Run simulation
-            run_start = time.perf_counter()
-            sim = Simulation(tmp_config_path, db_path=str(db_path))
-            sim.run()
-            run_end = time.perf_counter()
-            run_time = run_end - run_start
-            
-            # Collect statistics
-            conn = sqlite3.connect(str(db_path))
-            cursor = conn.cursor()
-            
-            cursor.execute("SELECT MAX(generation) FROM generation_stats")
-            final_generation = cursor.fetchone()[0]
-            
-            cursor.execute("SELECT COUNT(*) FROM creatures")
-            total_creatures = cursor.fetchone()[0]
-            
-            cursor.execute("""
-                SELECT population_size 
-                FROM generation_stats 
-                WHERE generation = ?
-            """, (final_generation,))
-            final_pop_size = cursor.fetchone()[0]
-            
-            conn.close()
-            
-            # Record results
-            result = {
-                'run_number': run_num,
-                'seed': run_seed,
-                'runtime_seconds': run_time,
-                'final_generation': final_generation,
-                'final_population_size': final_pop_size,
-                'total_creatures_created': total_creatures,
-                'database_path': str(db_path)
-            }
-            results.append(result)
-            
-            print(f"{run_time:.1f}s | Gen: {final_generation} | Pop: {final_pop_size:,} | Total: {total_creatures:,}")
-            
-        except Exception as e:
-            print(f"FAILED: {e}")
-            result = {
-                'run_number': run_num,
-                'seed': run_seed,
-                'error': str(e)
-            }
+    run_args = [
+        (run_num, base_seed + run_num - 1, base_config, str(output_path))
+        for run_num in range(1, num_runs + 1)
+    ]
+    
+    if workers <= 1:
+        for args in run_args:
+            print(f"Run {args[0]}/{num_runs} (seed={args[1]})...", end=" ", flush=True)
+            result = _run_one_seed(args)
             results.append(result)
-        
-        finally:
-            # Cleanup temp config
-            try:
-                Path(tmp_config_path).unlink()
-            except:
-                pass
+            print(_format_run_result(result))
+    else:
+        # Each run is an independent Simulation with its own database file, so runs
+        # go to a pool of fresh worker processes (no inherited SQLite handles)
+        # and are reported as they finish
+        print(f"Running {num_runs} simulations on {workers} worker processes...")
+        with _worker_context().Pool(processes=workers) as pool:
+            for result in pool.imap_unordered(_run_one_seed, run_args):
+                results.append(result)
+                print(f"Run {result['run_number']}/{num_runs} (seed={result['seed']})... "
+                      f"{_format_run_result(result)}", flush=True)
+        results.sort(key=lambda r: r['run_number'])
     
     total_time = time.time() - start_time
     
@@ -413,6 +459,9 @@ Examples:
   
   # Quick test with recommended config
   python batch_run.py -n 30 -p 100 -y 3
+  
+  # Run 15 simulations on 8 worker processes
+  python batch_run.py -n 15 -j 8
         """
     )
     
@@ -446,6 +495,12 @@ Examples:
         type=int,
         help='Override simulation duration in years'
     )
+    parser.add_argument(
+        '-j', '--workers',
+        type=int,
+        default=1,
+        help='Number of simulations to run in parallel (default: 1)'
+    )
     
     args = parser.parse_args()
     
@@ -455,7 +510,8 @@ Examples:
         base_seed=args.seed,
         output_dir=args.output,
         pop_size=args.population,
-        years=args.years
+        years=args.years,
+        workers=args.workers
     )
 
 
@@ -62,8 +62,7 @@ def run_test_and_chart():
         sim.initialize()
         
         # Create specific founders: 2 BB, 1 bb
-        sim.population.creatures.clear()
-        sim.population.age_out = []
+        sim.population.clear()
         
         dominant_genotype = "BB"
         recessive_genotype = "bb"
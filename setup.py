@@ -16,6 +16,9 @@ setup(
             "pytest>=7.4.0",
             "pytest-cov>=4.1.0",
         ],
+        "fast": [
+            "orjson>=3.9",
+        ],
     },
 )
 
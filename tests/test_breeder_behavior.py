@@ -344,6 +344,31 @@ def test_kennel_pairing_cache():
     assert score3 == score1, "Order-independent cache should work"
 
 
+
+def test_kennel_sub_optimal_mask():
+    """Test that the batched sub-optimal scan matches per-creature tier checks."""
+    breeder = KennelClubBreeder(
+        target_phenotypes=[],
+        genotype_preferences=[
+            {
+                'trait_id': 0,
+                'optimal': ['AA'],
+                'acceptable': ['Aa'],
+                'undesirable': ['aa']
+            }
+        ]
+    )
+    
+    creatures = [
+        Creature(1, 0, "male", ["AA"], lifespan=10),
+        Creature(1, 0, "female", ["Aa"], lifespan=10),
+        Creature(1, 0, "male", ["aa"], lifespan=10),
+        Creature(1, 0, "female", [None], lifespan=10),
+    ]
+    
+    assert breeder._sub_optimal_mask(creatures) == [False, True, True, True]
+    assert [breeder._get_genotype_tier(c, 0) for c in creatures] == [0, 1, 2, 3]
+
 def test_kennel_intelligent_pairing_selection():
     """Test that Kennel Club breeder selects best pairings based on genetic scoring."""
     breeder = KennelClubBreeder(
@@ -395,3 +420,19 @@ def test_kennel_intelligent_pairing_selection():
         scores = [breeder._score_pairing(m, f) for m, f in pairs]
         assert all(scores[i] >= scores[i+1] for i in range(len(scores)-1)), \
             "Pairs should be ordered by score (highest first)"
+
+
+def test_breeder_trait_lookup_indexed_per_list(sample_trait):
+    """Test that trait lookups are indexed once per traits list."""
+    breeder = MillBreeder(target_phenotypes=[])
+    other = Trait(3, "Size", TraitType.SIMPLE_MENDELIAN, [Genotype("SS", "Large", 1.0)])
+    traits = [sample_trait, other]
+    
+    assert breeder._get_trait(traits, 3) is other
+    index = breeder._trait_by_id
+    assert breeder._get_trait(traits, 0) is sample_trait
+    assert breeder._trait_by_id is index  # Same list reuses the index
+    assert breeder._get_trait(traits, 7) is None
+    
+    # A different list is re-indexed
+    assert breeder._get_trait([sample_trait], 3) is None
@@ -1,10 +1,13 @@
 """Tests for configuration system."""
 
+import os
 import pytest
 import tempfile
 import yaml
 from pathlib import Path
-from gene_sim.config import load_config, ConfigurationError
+from gene_sim.config import (
+    load_config, load_config_dict, load_config_json_cached, save_config, ConfigurationError
+)
 
 
 @pytest.fixture
@@ -64,6 +67,62 @@ def test_load_config_yaml(sample_config):
         Path(config_path).unlink()
 
 
+def test_save_config_round_trip(sample_config):
+    """Test that a saved configuration loads back unchanged."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        config_path = Path(tmp_dir) / 'saved.yaml'
+        save_config(sample_config, str(config_path))
+        
+        with open(config_path) as f:
+            assert yaml.safe_load(f) == sample_config
+        assert load_config(str(config_path)).seed == 42
+
+
+def test_load_config_dict_returns_fresh_copies(sample_config):
+    """Test that cached config dicts are copies and follow file edits."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        config_path = Path(tmp_dir) / 'config.yaml'
+        save_config(sample_config, str(config_path))
+        
+        first = load_config_dict(str(config_path))
+        first['breeders']['mill'] = 99
+        assert load_config_dict(str(config_path)) == sample_config
+        
+        sample_config['seed'] = 7
+        save_config(sample_config, str(config_path))
+        assert load_config_dict(str(config_path))['seed'] == 7
+
+
+def test_load_config_json_cached_ignores_stale_sidecar(sample_config):
+    """Test that a restored older config is not served from the JSON sidecar."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        config_path = Path(tmp_dir) / 'config.yaml'
+        save_config(sample_config, str(config_path))
+        v1_stat = config_path.stat()
+        assert load_config_json_cached(config_path) == sample_config
+        
+        # Load an edited version, then restore the original with its timestamp
+        edited = dict(sample_config, seed=2)
+        save_config(edited, str(config_path))
+        assert load_config_json_cached(config_path)['seed'] == 2
+        save_config(sample_config, str(config_path))
+        os.utime(config_path, ns=(v1_stat.st_atime_ns, v1_stat.st_mtime_ns))
+        assert load_config_json_cached(config_path) == sample_config
+
+
+def test_load_config_json_cached_unreadable_sidecar(sample_config):
+    """Test that a corrupt sidecar is treated as a cache miss and rewritten."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        config_path = Path(tmp_dir) / 'config.yaml'
+        save_config(sample_config, str(config_path))
+        sidecar = Path(tmp_dir) / 'config.yaml.json'
+        sidecar.write_text('{"source": ')
+        
+        assert load_config_json_cached(config_path) == sample_config
+        assert load_config_json_cached(config_path) == sample_config
+        assert sorted(p.name for p in Path(tmp_dir).iterdir()) == ['config.yaml', 'config.yaml.json']
+
+
 def test_load_config_missing_field(sample_config):
     """Test that missing required fields raise errors."""
     del sample_config['seed']
@@ -45,6 +45,13 @@ def test_creature_creation(founder_creature):
     assert founder_creature.parent2_id is None
 
 
+def test_creature_uses_slots(founder_creature):
+    """Test that creatures have no per-instance __dict__."""
+    assert not hasattr(founder_creature, '__dict__')
+    with pytest.raises(AttributeError):
+        founder_creature.unknown_attribute = 1
+
+
 def test_creature_founder_validation():
     """Test that founders cannot have conception_cycle and must have generation=0."""
     genome = [None] * 1
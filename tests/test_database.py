@@ -81,3 +81,83 @@ def test_get_db_connection():
     finally:
         Path(db_path).unlink()
 
+
+
+def test_get_db_connection_pragmas():
+    """Test that write-performance PRAGMAs are applied on connect."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = str(Path(tmp_dir) / 'test.db')
+        conn = get_db_connection(db_path)
+        
+        cursor = conn.cursor()
+        cursor.execute("PRAGMA journal_mode")
+        assert cursor.fetchone()[0] == 'wal'
+        cursor.execute("PRAGMA synchronous")
+        assert cursor.fetchone()[0] == 1  # NORMAL
+        cursor.execute("PRAGMA cache_size")
+        assert cursor.fetchone()[0] == -65536  # 64 MiB
+        
+        conn.close()
+
+
+def test_creature_genotypes_clustered_on_primary_key():
+    """Test that creature_genotypes is a WITHOUT ROWID table keyed by creature."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        conn = create_database(str(Path(tmp_dir) / 'test.db'))
+        
+        sql = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE name = 'creature_genotypes'"
+        ).fetchone()[0]
+        assert 'WITHOUT ROWID' in sql
+        
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT trait_id, genotype FROM creature_genotypes WHERE creature_id = ?",
+            (1,)
+        ).fetchall()
+        assert any('PRIMARY KEY' in row[-1] for row in plan)
+        
+        conn.close()
+
+
+def test_living_creatures_by_generation_use_covering_index():
+    """Test that selecting living creatures by generation is index-only."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        conn = create_database(str(Path(tmp_dir) / 'test.db'))
+        
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT creature_id, generation FROM creatures "
+            "WHERE simulation_id = ? AND is_alive = 1",
+            (1,)
+        ).fetchall()
+        assert any('COVERING INDEX idx_creatures_alive_generation' in row[-1] for row in plan)
+        
+        conn.close()
+
+
+def test_ownership_transfer_trigger_updates_breeder():
+    """Test that recording a transfer moves the creature to the new owner."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        conn = create_database(str(Path(tmp_dir) / 'test.db'))
+        cursor = conn.cursor()
+        
+        cursor.execute("INSERT INTO simulations (seed, config) VALUES (1, '{}')")
+        sim_id = cursor.lastrowid
+        cursor.executemany(
+            "INSERT INTO breeders (simulation_id, breeder_index, breeder_type) VALUES (?, ?, 'random')",
+            [(sim_id, 0), (sim_id, 1)]
+        )
+        cursor.execute("""
+            INSERT INTO creatures (simulation_id, birth_cycle, lifespan, breeder_id, generation)
+            VALUES (?, 0, 10, 1, 0)
+        """, (sim_id,))
+        creature_id = cursor.lastrowid
+        
+        cursor.execute("""
+            INSERT INTO creature_ownership_history (creature_id, breeder_id, transfer_generation)
+            VALUES (?, 2, 5)
+        """, (creature_id,))
+        
+        cursor.execute("SELECT breeder_id FROM creatures WHERE creature_id = ?", (creature_id,))
+        assert cursor.fetchone()[0] == 2
+        
+        conn.close()
@@ -94,8 +94,7 @@ def test_desired_genotype_increases_with_selection(config_with_desired_genotype)
     undesired_genotype = "bb"
     
     # Clear the existing population
-    sim.population.creatures.clear()
-    sim.population.age_out = []
+    sim.population.clear()
     
     # Create creatures with specific genotypes
     genome_male = [None] * 1
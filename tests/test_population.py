@@ -3,7 +3,10 @@
 import pytest
 import sqlite3
 import tempfile
-from gene_sim.models.population import Population
+import numpy as np
+from gene_sim.models.population import (
+    Population, CreaturePool, SEX_FEMALE, SEX_MALE, SEX_OTHER
+)
 from gene_sim.models.creature import Creature
 from gene_sim.models.trait import Trait, Genotype, TraitType
 
@@ -74,6 +77,41 @@ def test_population_get_aged_out_creatures(sample_creature):
     assert aged_out[0] == sample_creature
 
 
+def test_population_age_out_shifted_once_per_cycle(sample_creature):
+    """Only advance_cycle shifts the aging-out list."""
+    population = Population()
+    other = Creature(1, 0, "female", ["BB"], lifespan=10, creature_id=2)
+    sample_creature.creature_id = 1
+    population.add_creatures([sample_creature, other], current_cycle=0)
+    population.age_out = [[sample_creature], [other]]
+    
+    population.remove_aged_out_creatures(None, 1)
+    assert len(population.age_out) == 2
+    assert list(population.creatures) == [other]
+    
+    population.advance_cycle()
+    assert population.get_aged_out_creatures() == [other]
+
+
+def test_population_homed_creatures_skipped_when_aging_out():
+    """Homed creatures are filtered from their age_out bucket lazily."""
+    population = Population()
+    creatures = [
+        Creature(1, 0, "male", ["BB"], lifespan=1, creature_id=i) for i in range(1, 4)
+    ]
+    population.add_creatures(creatures, current_cycle=0)
+    
+    population.remove_homed_creatures([creatures[0]])
+    assert len(population.age_out[1]) == 3  # Bucket not rebuilt yet
+    
+    population.advance_cycle()
+    assert population.get_aged_out_creatures() == creatures[1:]
+    
+    # Stale entries are compacted once they outnumber the working pool
+    population.remove_homed_creatures([creatures[1]])
+    assert population.age_out[0] == [creatures[2]]
+
+
 def test_population_calculate_genotype_frequencies(sample_creature):
     """Test calculating genotype frequencies."""
     population = Population()
@@ -111,3 +149,178 @@ def test_population_calculate_genotype_diversity(sample_creature):
     diversity = population.calculate_genotype_diversity(0)
     assert diversity == 2
 
+
+def test_population_calculate_heterozygosity():
+    """Test heterozygosity over simple and polygenic genotypes, with cache refresh."""
+    population = Population()
+    population.add_creatures([
+        Creature(1, 0, "male", ["Bb", "AA_Bb"], lifespan=10, creature_id=1),
+        Creature(1, 0, "female", ["BB", "AA_BB"], lifespan=10, creature_id=2),
+        Creature(1, 0, "female", ["Bb", None], lifespan=10, creature_id=3),
+    ], current_cycle=0)
+    
+    assert population.calculate_heterozygosity(0) == pytest.approx(2 / 3)
+    assert population.calculate_heterozygosity(1) == pytest.approx(0.5)
+    
+    # Removing a creature refreshes the cached genotype columns
+    population.remove_homed_creatures([next(iter(population.creatures))])
+    assert population.calculate_heterozygosity(0) == pytest.approx(0.5)
+    assert population.calculate_genotype_frequencies(1) == {"AA_BB": 1.0}
+
+
+def test_population_calculate_allele_frequencies_sex_linked():
+    """Test allele frequencies where males carry one allele and females two."""
+    trait = type('obj', (object,), {
+        'trait_type': type('obj', (object,), {'value': 'SEX_LINKED'})()
+    })()
+    population = Population()
+    population.add_creatures([
+        Creature(1, 0, "male", ["N"], lifespan=10),
+        Creature(1, 0, "male", [np.str_("c")], lifespan=10),  # as drawn by rng.choice
+        Creature(1, 0, "female", ["Nc"], lifespan=10),
+        Creature(1, 0, "female", ["NN"], lifespan=10),
+    ], current_cycle=0)
+    
+    frequencies = population.calculate_allele_frequencies(0, trait)
+    assert frequencies == {"N": pytest.approx(4 / 6), "c": pytest.approx(2 / 6)}
+    assert all(type(allele) is str for allele in frequencies)
+
+
+def test_population_calculate_trait_stats_threaded_matches_serial():
+    """Test that the thread pool path returns the same stats as the serial path."""
+    traits = [
+        type('obj', (object,), {
+            'trait_id': trait_id,
+            'trait_type': type('obj', (object,), {'value': 'SIMPLE_MENDELIAN'})()
+        })()
+        for trait_id in range(3)
+    ]
+    population = Population()
+    population.add_creatures([
+        Creature(1, 0, "male", ["BB", "Bb", "bb"], lifespan=10),
+        Creature(1, 0, "female", ["Bb", "bb", None], lifespan=10),
+        Creature(1, 0, "female", ["bb", "Bb", "BB"], lifespan=10),
+    ], current_cycle=0)
+    
+    serial = population.calculate_trait_stats(traits)
+    threaded = population.calculate_trait_stats(traits, max_workers=3)
+    
+    assert threaded == serial
+    assert serial[0][1] == population.calculate_genotype_frequencies(1)
+    assert serial[3] == {0: 3, 1: 2, 2: 2}
+
+
+def test_population_eligibility_cache(sample_config, sample_creature):
+    """Test that eligible lists are cached per cycle and invalidated on mutation."""
+    population = Population()
+    population.add_creatures([sample_creature], current_cycle=0)
+    
+    first = population.get_eligible_males(0, sample_config)
+    assert population.get_eligible_males(0, sample_config) is first
+    
+    # Removals that match nothing keep the cache
+    population.remove_homed_creatures([])
+    population.remove_aged_out_creatures(None, 1)
+    assert population.get_eligible_males(0, sample_config) is first
+    
+    # Adding creatures invalidates the cache
+    female = Creature(1, 0, "female", ["bb"], lifespan=10)
+    population.add_creatures([female], current_cycle=0)
+    assert population.get_eligible_females(0, sample_config) == [female]
+    
+    # Direct mutation requires explicit invalidation
+    female.is_homed = True
+    population.invalidate_eligibility_cache()
+    assert population.get_eligible_females(0, sample_config) == []
+    
+    # Reassigning the working pool also invalidates the cache
+    population.creatures = []
+    assert population.get_eligible_males(0, sample_config) == []
+
+
+def test_population_sex_pools():
+    """Test that per-sex sub-pools track additions, removals and clear()."""
+    population = Population()
+    male = Creature(1, 0, "male", ["BB"], lifespan=10, creature_id=1)
+    female = Creature(1, 0, "female", ["bb"], lifespan=10, creature_id=2)
+    population.add_creatures([male, female], current_cycle=0)
+    
+    assert list(population.males) == [male]
+    assert list(population.females) == [female]
+    
+    population.remove_homed_creatures([female])
+    assert list(population.females) == []
+    assert list(population.creatures) == [male]
+    
+    population.clear()
+    assert len(population.males) == 0 and len(population.creatures) == 0
+    assert len(population.age_out) == 0
+
+
+def test_creature_pool_keeps_order_and_removes_by_identity():
+    """Test that the pool preserves insertion order and removes in place."""
+    creatures = [Creature(1, 0, "male", ["BB"], lifespan=10) for _ in range(4)]
+    pool = CreaturePool(creatures[:3])
+    pool.extend(creatures[3:])
+    
+    pool.discard(creatures[1])
+    pool.discard(creatures[1])  # Discarding twice is a no-op
+    
+    assert list(pool) == [creatures[0], creatures[2], creatures[3]]
+    assert len(pool) == 3
+    assert creatures[1] not in pool and creatures[2] in pool
+
+
+def test_persist_creatures_batch_assigns_ids_and_genotypes():
+    """Test that a batch of creatures gets consecutive IDs and genotype rows."""
+    from gene_sim.database import create_database
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = create_database(f"{tmp}/pop.db")
+        conn.execute(
+            "INSERT INTO simulations (simulation_id, seed, start_time, config) "
+            "VALUES (1, 42, datetime('now'), '{}')"
+        )
+        conn.execute("INSERT INTO traits (trait_id, name, trait_type) VALUES (0, 'T0', 'SIMPLE_MENDELIAN')")
+        conn.execute("INSERT INTO traits (trait_id, name, trait_type) VALUES (1, 'T1', 'SIMPLE_MENDELIAN')")
+        conn.commit()
+        
+        population = Population()
+        first = [Creature(1, 0, "male", ["BB", "Bb"], lifespan=10)]
+        batch = [
+            Creature(1, 0, "female", ["bb", None], lifespan=10),
+            Creature(1, 0, "male", ["Bb", "bb"], lifespan=10),
+        ]
+        population._persist_creatures(conn, 1, first)
+        population._persist_creatures(conn, 1, batch)
+        
+        assert [c.creature_id for c in first + batch] == [1, 2, 3]
+        rows = conn.execute(
+            "SELECT creature_id, trait_id, genotype FROM creature_genotypes ORDER BY creature_id, trait_id"
+        ).fetchall()
+        assert rows == [(1, 0, "BB"), (1, 1, "Bb"), (2, 0, "bb"), (3, 0, "Bb"), (3, 1, "bb")]
+        conn.close()
+
+
+def test_population_genome_matrix_and_sex_index():
+    """Test the integer-encoded genome matrix and sex index views."""
+    trait0 = Trait(0, "Coat", TraitType.SIMPLE_MENDELIAN, [
+        Genotype("BB", "Black", 0.5), Genotype("bb", "Brown", 0.5),
+    ])
+    trait2 = Trait(2, "Tail", TraitType.SIMPLE_MENDELIAN, [
+        Genotype("LL", "Long", 1.0),
+    ])
+    population = Population()
+    population.add_creatures([
+        Creature(1, 0, "male", ["bb", None, "LL"], lifespan=10),
+        Creature(1, 0, "female", ["BB"], lifespan=10),
+        Creature(1, 0, None, ["Bb", None, "LL"], lifespan=10),
+    ], current_cycle=0)
+    
+    matrix = population.genome_matrix([trait0, trait2])
+    assert matrix.tolist() == [[1, -1, 0], [0, -1, -1], [-1, -1, 0]]
+    assert population.genome_matrix([trait0, trait2]) is matrix
+    assert population.sex_index().tolist() == [SEX_MALE, SEX_FEMALE, SEX_OTHER]
+    
+    population.creatures = []
+    assert population.genome_matrix([trait0, trait2]).shape == (0, 3)
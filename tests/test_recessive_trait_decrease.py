@@ -83,9 +83,12 @@ def test_recessive_trait_decreases_after_first_litter(config_for_recessive_test)
     # Get the trait
     trait = sim.traits[0]
     
-    # Clear existing population and create specific founders
-    sim.population.creatures.clear()
-    sim.population.age_out = []
+    # Clear existing population and create specific founders. The randomly
+    # generated founders were already persisted by initialize(); delete them
+    # (genotypes cascade) so the database only reflects the founders below.
+    sim.population.clear()
+    sim.db_conn.execute("DELETE FROM creatures WHERE simulation_id = ?", (sim.simulation_id,))
+    sim.db_conn.commit()
     
     # Create 3 founders: 2 BB (dominant homozygous), 1 bb (recessive homozygous)
     # 1 male BB, 1 female BB, 1 female bb
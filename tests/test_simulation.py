@@ -122,3 +122,182 @@ def test_simulation_database_persistence(simple_config_file):
     
     conn.close()
 
+
+
+def test_simulation_initialize_persists_breeders_in_index_order(simple_config_file):
+    """Test that batch-inserted breeders get their database IDs backfilled."""
+    sim = Simulation.from_config(simple_config_file)
+    sim.initialize()
+    
+    try:
+        rows = sim.db_conn.execute(
+            "SELECT breeder_id, breeder_type FROM breeders WHERE simulation_id = ? ORDER BY breeder_index",
+            (sim.simulation_id,)
+        ).fetchall()
+        assert [b.breeder_id for b in sim.breeders] == [r[0] for r in rows]
+        assert [r[1] for r in rows] == ['random'] * 5
+        
+        genotype_count = sim.db_conn.execute("SELECT COUNT(*) FROM genotypes").fetchone()[0]
+        assert genotype_count == 3
+    finally:
+        sim.db_conn.close()
+
+
+def test_simulation_progress_written_at_checkpoints(simple_config_file):
+    """Test that progress is coalesced to checkpoints but the final count is exact."""
+    sim = Simulation.from_config(simple_config_file)
+    sim._progress_interval = 2
+    results = sim.run()
+    
+    import sqlite3
+    conn = sqlite3.connect(results.database_path)
+    completed = conn.execute(
+        "SELECT generations_completed FROM simulations WHERE simulation_id = ?",
+        (results.simulation_id,)
+    ).fetchone()[0]
+    conn.close()
+    
+    assert completed == 3
+    assert sim._last_progress_cycle == 3
+
+
+def test_total_created_matches_database(simple_config_file):
+    """Test that the in-memory created counter tracks persisted creatures."""
+    sim = Simulation.from_config(simple_config_file)
+    results = sim.run()
+    
+    import sqlite3
+    conn = sqlite3.connect(results.database_path)
+    total = conn.execute(
+        "SELECT COUNT(*) FROM creatures WHERE simulation_id = ?",
+        (results.simulation_id,)
+    ).fetchone()[0]
+    conn.close()
+    
+    assert sim._total_created == total
+
+
+def test_desired_trait_penetration(simple_config_file):
+    """Test penetration against a direct per-creature phenotype check."""
+    sim = Simulation.from_config(simple_config_file)
+    sim.initialize()
+    
+    try:
+        trait = sim.traits[0]
+        sim.config.target_phenotypes = [{'trait_id': 0, 'phenotype': 'Black'}]
+        sim._compile_penetration_tables()
+        creatures = list(sim.population.creatures)
+        expected = sum(
+            trait.get_phenotype(c.genome[0], c.sex) == 'Black' for c in creatures
+        ) / len(creatures) * 100.0
+        assert sim._calculate_desired_trait_penetration() == pytest.approx(expected)
+        
+        # A target on an unknown trait can never match
+        sim.config.target_phenotypes = [{'trait_id': 7, 'phenotype': 'Black'}]
+        sim._compile_penetration_tables()
+        assert sim._penetration_tables is None
+        assert sim._calculate_desired_trait_penetration() == 0.0
+    finally:
+        sim.db_conn.close()
+
+
+def test_simulation_import_defers_cycle_and_breeders():
+    """Test that importing the package does not load the cycle/breeder modules."""
+    import subprocess
+    import sys
+    
+    code = (
+        "import sys, gene_sim; "
+        "print('gene_sim.models.generation' in sys.modules, 'gene_sim.models.breeder' in sys.modules)"
+    )
+    output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+    assert output.split() == ['False', 'False']
+    
+    from gene_sim.models import Cycle, MillBreeder
+    assert Cycle.__module__ == 'gene_sim.models.generation'
+    assert MillBreeder.__module__ == 'gene_sim.models.breeder'
+
+
+def test_founder_genomes_with_sparse_trait_ids(simple_config_file):
+    """Test that founder genomes leave unused trait IDs unset."""
+    with open(simple_config_file) as f:
+        config = yaml.safe_load(f)
+    second = dict(config['traits'][0], trait_id=3, name='Coat Shade')
+    config['traits'].append(second)
+    with open(simple_config_file, 'w') as f:
+        yaml.dump(config, f)
+    
+    sim = Simulation.from_config(simple_config_file)
+    sim.initialize()
+    
+    try:
+        creatures = list(sim.population.creatures)
+        assert len(creatures) == 20
+        for creature in creatures:
+            assert len(creature.genome) == 4
+            assert creature.genome[1] is None and creature.genome[2] is None
+            assert creature.genome[0] in ('BB', 'Bb', 'bb')
+            assert creature.genome[3] in ('BB', 'Bb', 'bb')
+    finally:
+        sim.db_conn.close()
+
+
+def test_simulation_from_config_dict(simple_config_file):
+    """Test that a parsed config dictionary can be passed instead of a path."""
+    with open(simple_config_file) as f:
+        config = yaml.safe_load(f)
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = str(Path(tmp_dir) / 'from_dict.db')
+        sim = Simulation(config, db_path=db_path)
+        assert sim.config_path is None
+        assert sim.config.seed == 42
+        
+        results = sim.run()
+        assert results.status == 'completed'
+        assert results.database_path == db_path
+
+
+def test_simulation_persists_allele_frequencies_as_json(simple_config_file):
+    """Test that per-trait allele frequencies round-trip through the database as JSON."""
+    import json
+    import sqlite3
+    
+    with open(simple_config_file) as f:
+        config = yaml.safe_load(f)
+    # Long enough for offspring, whose sex-linked alleles come from rng.choice
+    config['seed'] = 1
+    config['years'] = 3
+    config['traits'].append({
+        'trait_id': 1,
+        'name': 'Color Blindness',
+        'trait_type': 'SEX_LINKED',
+        'genotypes': [
+            {'genotype': 'NN', 'phenotype': 'Normal', 'sex': 'female', 'initial_freq': 0.5},
+            {'genotype': 'Nc', 'phenotype': 'Carrier', 'sex': 'female', 'initial_freq': 0.5},
+            {'genotype': 'N', 'phenotype': 'Normal', 'sex': 'male', 'initial_freq': 0.5},
+            {'genotype': 'c', 'phenotype': 'Colorblind', 'sex': 'male', 'initial_freq': 0.5},
+        ]
+    })
+    with open(simple_config_file, 'w') as f:
+        yaml.dump(config, f)
+    
+    sim = Simulation.from_config(simple_config_file)
+    results = sim.run()
+    
+    conn = sqlite3.connect(results.database_path)
+    rows = conn.execute(
+        "SELECT trait_id, allele_frequencies FROM generation_trait_stats WHERE simulation_id = ?",
+        (results.simulation_id,)
+    ).fetchall()
+    conn.close()
+    
+    assert {trait_id for trait_id, _ in rows} == {0, 1}
+    for trait_id, allele_frequencies in rows:
+        frequencies = json.loads(allele_frequencies)
+        assert isinstance(frequencies, dict)
+        if trait_id == 0:
+            assert set(frequencies) <= {'B', 'b'}
+        else:
+            assert {'N', 'c'} & set(frequencies)
+        assert sum(frequencies.values()) == pytest.approx(1.0)
@@ -102,3 +102,34 @@ def test_trait_from_config():
     assert trait.trait_type == TraitType.SIMPLE_MENDELIAN
     assert len(trait.genotypes) == 3
 
+
+
+def test_trait_genotype_codes():
+    """Test interning genotype strings to integer codes."""
+    from gene_sim.models.trait import UNKNOWN_GENOTYPE_CODE
+    
+    trait = Trait(0, "Bleeding", TraitType.SEX_LINKED, [
+        Genotype("N", "Normal", 0.25, sex="male"),
+        Genotype("n", "Affected", 0.25, sex="male"),
+        Genotype("Nn", "Carrier", 0.5, sex="female"),
+    ])
+    
+    assert trait.genotype_strings == ["N", "n", "Nn"]
+    assert [trait.encode_genotype(g) for g in trait.genotype_strings] == [0, 1, 2]
+    assert trait.encode_genotype("nn") == UNKNOWN_GENOTYPE_CODE
+    assert trait.encode_genotype(None) == UNKNOWN_GENOTYPE_CODE
+
+
+def test_trait_sample_codes_matches_choice():
+    """Test that CDF sampling draws the same genotypes as rng.choice."""
+    trait = Trait(0, "Coat Color", TraitType.SIMPLE_MENDELIAN, [
+        Genotype("BB", "Black", 0.36),
+        Genotype("Bb", "Black", 0.48),
+        Genotype("bb", "Brown", 0.16),
+    ])
+    
+    codes = trait.sample_codes(np.random.Generator(np.random.PCG64(7)), 500)
+    expected = np.random.Generator(np.random.PCG64(7)).choice(3, size=500, p=[0.36, 0.48, 0.16])
+    
+    assert codes.dtype == np.int16
+    assert codes.tolist() == expected.tolist()